@@ -3,19 +3,31 @@ Admin Dashboard API routes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List
 from datetime import datetime, timedelta
 
-from app.database import get_db
-from app.models.user import User, UserRole
+from app.config import settings
+from app.database import get_read_db
+from app.models.user import User, UserRole, UserStatus
 from app.models.seat import Seat, SeatStatus
 from app.models.floor import Floor
 from app.models.location import Location
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.occupancy_history import OccupancyHistory
 from app.api.auth import get_current_user
+from app.services.analytics_export import EXPORT_MEDIA_TYPES, gzip_stream, iter_report
+from app.services.columnar_export import (
+    COLUMNAR_MEDIA_TYPES,
+    columnar_export_available,
+    iter_columnar_export,
+)
+from app.services.occupancy_rollups import get_history_trends, get_occupancy_trends
+from app.services.loop_monitor import loop_lag_monitor
+from app.services.query_profiler import slow_requests
+from app.services.seat_refresh_worker import seat_refresh_worker
 
 router = APIRouter()
 
@@ -33,51 +45,27 @@ async def require_admin(current_user: User = Depends(get_current_user)):
 @router.get("/analytics/occupancy")
 async def get_occupancy_analytics(
     location_id: str = Query(None),
-    days: int = Query(7, ge=1, le=90),
+    floor_id: str = Query(None),
+    days: int = Query(7, ge=1, le=365),
+    resolution: str = Query("hour", regex="^(hour|day)$"),
+    source: str = Query("rollup", regex="^(rollup|history)$"),
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get occupancy analytics for admin dashboard.
-    Returns occupancy trends over specified time period.
+    Returns occupancy trends over specified time period, aggregated in SQL
+    from the hourly or daily rollups, or from the raw history rows with
+    source=history (exact window start, raw retention period only).
     """
     start_date = datetime.utcnow() - timedelta(days=days)
-    
-    query = db.query(OccupancyHistory).filter(
-        OccupancyHistory.timestamp >= start_date
-    )
-    
-    if location_id:
-        query = query.filter(OccupancyHistory.location_id == location_id)
-    
-    history = query.order_by(OccupancyHistory.timestamp).all()
-    
-    # Group by hour for trends
-    hourly_data = {}
-    for record in history:
-        hour_key = record.timestamp.strftime("%Y-%m-%d %H:00")
-        if hour_key not in hourly_data:
-            hourly_data[hour_key] = {
-                "timestamp": hour_key,
-                "occupancy_percentage": [],
-                "occupancy_count": []
-            }
-        hourly_data[hour_key]["occupancy_percentage"].append(record.occupancy_percentage)
-        hourly_data[hour_key]["occupancy_count"].append(record.occupancy_count)
-    
-    # Calculate averages
-    trends = []
-    for hour_key, data in sorted(hourly_data.items()):
-        avg_percentage = sum(data["occupancy_percentage"]) / len(data["occupancy_percentage"])
-        avg_count = sum(data["occupancy_count"]) / len(data["occupancy_count"])
-        trends.append({
-            "timestamp": hour_key,
-            "average_occupancy_percentage": round(avg_percentage, 2),
-            "average_occupancy_count": round(avg_count, 2)
-        })
+    get_trends = get_occupancy_trends if source == "rollup" else get_history_trends
+    trends = get_trends(db, resolution, start_date, location_id=location_id, floor_id=floor_id)
     
     return {
         "period_days": days,
+        "resolution": resolution,
+        "source": source,
         "start_date": start_date.isoformat(),
         "end_date": datetime.utcnow().isoformat(),
         "trends": trends
@@ -87,7 +75,7 @@ async def get_occupancy_analytics(
 @router.get("/analytics/utilization")
 async def get_utilization_stats(
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get overall utilization statistics.
@@ -96,21 +84,25 @@ async def get_utilization_stats(
     # Get all locations
     locations = db.query(Location).all()
     
-    # Get total seats and occupancy
-    total_seats = db.query(Seat).count()
-    occupied_seats = db.query(Seat).filter(Seat.status == SeatStatus.OCCUPIED).count()
-    available_seats = db.query(Seat).filter(Seat.status == SeatStatus.AVAILABLE).count()
-    reserved_seats = db.query(Seat).filter(Seat.status == SeatStatus.RESERVED).count()
+    # Get total seats and occupancy (one GROUP BY per table instead of a COUNT per status)
+    seat_counts = dict(db.query(Seat.status, func.count()).group_by(Seat.status).all())
+    total_seats = sum(seat_counts.values())
+    occupied_seats = seat_counts.get(SeatStatus.OCCUPIED, 0)
+    available_seats = seat_counts.get(SeatStatus.AVAILABLE, 0)
+    reserved_seats = seat_counts.get(SeatStatus.RESERVED, 0)
     
     # Get reservation stats
-    total_reservations = db.query(Reservation).count()
-    active_reservations = db.query(Reservation).filter(
-        Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.ACTIVE])
-    ).count()
+    reservation_counts = dict(db.query(Reservation.status, func.count()).group_by(Reservation.status).all())
+    total_reservations = sum(reservation_counts.values())
+    active_reservations = sum(
+        reservation_counts.get(status_value, 0)
+        for status_value in (ReservationStatus.CONFIRMED, ReservationStatus.ACTIVE)
+    )
     
     # Get user stats
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.status == "active").count()
+    user_counts = dict(db.query(User.status, func.count()).group_by(User.status).all())
+    total_users = sum(user_counts.values())
+    active_users = user_counts.get(UserStatus.ACTIVE, 0)
     
     # Location breakdown
     location_stats = []
@@ -150,7 +142,7 @@ async def get_all_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all users for admin management."""
     users = db.query(User).offset(skip).limit(limit).all()
@@ -174,61 +166,109 @@ async def get_all_users(
 
 @router.get("/export/report")
 async def export_analytics_report(
-    format: str = Query("json", regex="^(json|csv)$"),
+    format: str = Query("json", regex="^(json|csv|ndjson)$"),
+    dataset: str = Query("occupancy", regex="^(occupancy|reservations)$"),
     days: int = Query(30, ge=1, le=365),
-    admin: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    gzip: bool = Query(False),
+    admin: User = Depends(require_admin)
 ):
     """
-    Export analytics report in JSON or CSV format.
+    Export analytics report in JSON, CSV or NDJSON format.
+    JSON is the full report; CSV and NDJSON export the rows of `dataset`.
+    The response is streamed from a database cursor, optionally gzipped.
     """
     start_date = datetime.utcnow() - timedelta(days=days)
+    chunks = iter_report(format, dataset, start_date, days)
+    media_type = EXPORT_MEDIA_TYPES[format]
+    headers = {}
+    if format != "json" or gzip:
+        name = "report" if format == "json" else dataset
+        filename = f"analytics-{name}-{start_date:%Y%m%d}.{format}"
+        if gzip:
+            chunks = gzip_stream(chunks)
+            media_type = "application/gzip"
+            filename += ".gz"
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
     
-    # Get occupancy history
-    history = db.query(OccupancyHistory).filter(
-        OccupancyHistory.timestamp >= start_date
-    ).order_by(OccupancyHistory.timestamp).all()
-    
-    # Get reservation stats
-    reservations = db.query(Reservation).filter(
-        Reservation.created_at >= start_date
-    ).all()
-    
-    report_data = {
-        "report_generated_at": datetime.utcnow().isoformat(),
-        "period_days": days,
-        "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
-        "occupancy_records": len(history),
-        "total_reservations": len(reservations),
-        "occupancy_data": [
-            {
-                "timestamp": h.timestamp.isoformat(),
-                "location_id": h.location_id,
-                "occupancy_count": h.occupancy_count,
-                "total_capacity": h.total_capacity,
-                "occupancy_percentage": h.occupancy_percentage
-            }
-            for h in history
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+@router.get("/export/history.{format}")
+async def export_history_columnar(
+    format: str,
+    dataset: str = Query("history", regex="^(history|rollups)$"),
+    days: int = Query(90, ge=1, le=730),
+    compression: str = Query("zstd", regex="^(zstd|none)$"),
+    admin: User = Depends(require_admin)
+):
+    """
+    Export occupancy history (or its hourly/daily rollups) as Parquet
+    (`history.parquet`) or an Arrow IPC stream (`history.arrow`) for
+    analytics tools. Written in row groups of dictionary-encoded columns and
+    streamed as each group is ready.
+    """
+    if format not in COLUMNAR_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Supported exports: history.parquet, history.arrow"
+        )
+    if not columnar_export_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Columnar export requires pyarrow (pip install pyarrow)"
+        )
+    start_date = datetime.utcnow() - timedelta(days=days)
+    filename = f"occupancy-{dataset}-{start_date:%Y%m%d}.{format}"
+    return StreamingResponse(
+        iter_columnar_export(format, dataset, start_date, compression),
+        media_type=COLUMNAR_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/profiling/slow-requests")
+async def get_slow_requests(
+    limit: int = Query(20, ge=1, le=1000),
+    admin: User = Depends(require_admin),
+):
+    """
+    The most recent requests slower than SLOW_REQUEST_THRESHOLD_MS, newest
+    first, with their SQL grouped by statement and any N+1 candidates.
+    Empty unless QUERY_PROFILING_ENABLED is set.
+    """
+    return {
+        "enabled": settings.QUERY_PROFILING_ENABLED,
+        "threshold_ms": settings.SLOW_REQUEST_THRESHOLD_MS,
+        "n_plus_one_threshold": settings.N_PLUS_ONE_THRESHOLD,
+        "requests": [
+            profile.to_dict(settings.N_PLUS_ONE_THRESHOLD)
+            for profile in slow_requests.recent(limit)
         ],
-        "reservation_summary": {
-            "total": len(reservations),
-            "confirmed": len([r for r in reservations if r.status == ReservationStatus.CONFIRMED]),
-            "active": len([r for r in reservations if r.status == ReservationStatus.ACTIVE]),
-            "completed": len([r for r in reservations if r.status == ReservationStatus.COMPLETED]),
-            "cancelled": len([r for r in reservations if r.status == ReservationStatus.CANCELLED]),
-            "no_show": len([r for r in reservations if r.status == ReservationStatus.NO_SHOW])
-        }
     }
-    
-    if format == "csv":
-        # For CSV, return a simplified format
-        # In a real application, you would generate actual CSV content
-        return {
-            "format": "csv",
-            "message": "CSV export not yet implemented. Use JSON format.",
-            "data": report_data
-        }
-    
-    return report_data
 
+
+@router.get("/workers/seat-refresh")
+async def get_seat_refresh_ticks(
+    limit: int = Query(50, ge=1, le=1000),
+    admin: User = Depends(require_admin),
+):
+    """
+    Recent seat refresh ticks of this process, newest first: time per phase,
+    seats changed, snapshot size, and overruns of SEAT_REFRESH_INTERVAL_SECONDS
+    with the ticks skipped because of them. Only the leader process refreshes,
+    so followers report no ticks.
+    """
+    return seat_refresh_worker.get_tick_stats(limit)
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats(
+    limit: int = Query(20, ge=1, le=1000),
+    admin: User = Depends(require_admin),
+):
+    """
+    Event loop lag percentiles of this process over the last minute, and the
+    most recent stalls longer than LOOP_LAG_THRESHOLD_MS with the stack of
+    the code that was blocking the loop, newest first.
+    """
+    return loop_lag_monitor.get_stats(limit)
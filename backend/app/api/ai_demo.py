@@ -80,6 +80,7 @@ async def ai_demo_seats(db: Session = Depends(get_db)):
             {
                 "seat_id": seat.id,
                 "seat_number": seat.seat_number,
+                "table_number": seat.table_number,
                 "status": status_value,
                 "has_power_outlet": seat.has_power_outlet,
                 "has_wifi": getattr(seat, "has_wifi", False),
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.floor import Floor
 from app.models.seat import Seat
 from app.schemas.floor import FloorResponse, FloorWithSeats
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("/", response_model=List[FloorResponse])
 async def get_floors(
     location_id: str = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get list of floors."""
     query = db.query(Floor)
@@ -30,7 +30,7 @@ async def get_floors(
 
 
 @router.get("/{floor_id}", response_model=FloorResponse)
-async def get_floor(floor_id: str, db: Session = Depends(get_db)):
+async def get_floor(floor_id: str, db: Session = Depends(get_read_db)):
     """Get floor by ID."""
     floor = db.query(Floor).filter(Floor.id == floor_id).first()
     if not floor:
@@ -42,7 +42,7 @@ async def get_floor(floor_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{floor_id}/seats", response_model=FloorWithSeats)
-async def get_floor_with_seats(floor_id: str, db: Session = Depends(get_db)):
+async def get_floor_with_seats(floor_id: str, db: Session = Depends(get_read_db)):
     """Get floor with all its seats."""
     floor = db.query(Floor).filter(Floor.id == floor_id).first()
     if not floor:
@@ -3,9 +3,11 @@ Locations API routes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List
-from app.database import get_db
+from app.database import get_async_read_db
 from app.models.location import Location
 from app.schemas.location import LocationResponse
 from app.models.floor import Floor
@@ -15,10 +17,11 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[LocationResponse])
-async def get_locations(db: Session = Depends(get_db)):
-    locations = db.query(Location).options(
-        joinedload(Location.floors).joinedload(Floor.seats)
-    ).all()
+async def get_locations(db: AsyncSession = Depends(get_async_read_db)):
+    result = await db.execute(
+        select(Location).options(joinedload(Location.floors).joinedload(Floor.seats))
+    )
+    locations = result.unique().scalars().all()
 
     result = []
 
@@ -37,12 +40,15 @@ async def get_locations(db: Session = Depends(get_db)):
 
 
 @router.get("/{location_id}", response_model=LocationResponse)
-async def get_location(location_id: str, db: Session = Depends(get_db)):
+async def get_location(location_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """Get a single location with aggregated accessibility."""
 
-    location = db.query(Location).options(
-        joinedload(Location.floors).joinedload(Floor.seats)
-    ).filter(Location.id == location_id).first()
+    result = await db.execute(
+        select(Location).options(
+            joinedload(Location.floors).joinedload(Floor.seats)
+        ).where(Location.id == location_id)
+    )
+    location = result.unique().scalars().first()
 
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
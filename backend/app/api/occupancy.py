@@ -4,33 +4,52 @@ This simulates IoT sensor signals for seat occupancy.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
-import uuid
 import random
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.seat import Seat, SeatStatus
 from app.models.floor import Floor
 from app.models.location import Location
 from app.models.occupancy_history import OccupancyHistory
 from app.schemas.occupancy import OccupancyEvent, OccupancyResponse, OccupancyHistoryResponse
+from app.services.seat_indexes import update_seat_statuses
 
 router = APIRouter()
 
 
+async def count_occupied_on_floor(db: AsyncSession, floor_id: str) -> int:
+    return await db.scalar(
+        select(func.count()).select_from(Seat).where(
+            Seat.floor_id == floor_id,
+            Seat.status == SeatStatus.OCCUPIED
+        )
+    )
+
+
+async def count_occupied_in_location(db: AsyncSession, location_id: str) -> int:
+    return await db.scalar(
+        select(func.count()).select_from(Seat).join(Floor).where(
+            Floor.location_id == location_id,
+            Seat.status == SeatStatus.OCCUPIED
+        )
+    )
+
+
 @router.post("/occupancy", status_code=status.HTTP_200_OK)
 async def update_seat_occupancy(
     event: OccupancyEvent,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Simulate IoT sensor event for seat occupancy.
     This endpoint simulates a sensor detecting seat occupation/vacation.
     """
     # Find the seat
-    seat = db.query(Seat).filter(Seat.id == event.seat_id).first()
+    seat = await db.get(Seat, event.seat_id)
     if not seat:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,26 +61,22 @@ async def update_seat_occupancy(
         seat.status = SeatStatus.OCCUPIED
     else:
         seat.status = SeatStatus.AVAILABLE
+    status_changes = {seat.id: seat.status}
+    # The session does not autoflush; the counts below must see the new status
+    await db.flush()
     
     # Update floor occupancy
-    floor = db.query(Floor).filter(Floor.id == seat.floor_id).first()
+    floor = await db.get(Floor, seat.floor_id)
     if floor:
-        occupied_count = db.query(Seat).filter(
-            Seat.floor_id == floor.id,
-            Seat.status == SeatStatus.OCCUPIED
-        ).count()
-        floor.occupied_seats = occupied_count
+        floor.occupied_seats = await count_occupied_on_floor(db, floor.id)
         
         # Update location occupancy
-        location = db.query(Location).filter(Location.id == floor.location_id).first()
+        location = await db.get(Location, floor.location_id)
         if location:
-            total_occupied = db.query(Seat).join(Floor).filter(
-                Floor.location_id == location.id,
-                Seat.status == SeatStatus.OCCUPIED
-            ).count()
-            location.current_occupancy = total_occupied
+            location.current_occupancy = await count_occupied_in_location(db, location.id)
     
-    db.commit()
+    await db.commit()
+    update_seat_statuses(status_changes)
     
     return {
         "message": "Occupancy updated successfully",
@@ -74,38 +89,34 @@ async def update_seat_occupancy(
 @router.post("/occupancy/batch", status_code=status.HTTP_200_OK)
 async def batch_update_occupancy(
     events: List[OccupancyEvent],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Batch update multiple seat occupancy events.
     Useful for simulating multiple IoT sensors reporting simultaneously.
     """
     updated_count = 0
+    status_changes = {}
     
     for event in events:
-        seat = db.query(Seat).filter(Seat.id == event.seat_id).first()
+        seat = await db.get(Seat, event.seat_id)
         if seat:
             seat.status = SeatStatus.OCCUPIED if event.is_occupied else SeatStatus.AVAILABLE
+            status_changes[seat.id] = seat.status
             updated_count += 1
     
     # Update all floor and location occupancies
-    floors = db.query(Floor).all()
+    await db.flush()
+    floors = (await db.scalars(select(Floor))).all()
     for floor in floors:
-        occupied_count = db.query(Seat).filter(
-            Seat.floor_id == floor.id,
-            Seat.status == SeatStatus.OCCUPIED
-        ).count()
-        floor.occupied_seats = occupied_count
+        floor.occupied_seats = await count_occupied_on_floor(db, floor.id)
     
-    locations = db.query(Location).all()
+    locations = (await db.scalars(select(Location))).all()
     for location in locations:
-        total_occupied = db.query(Seat).join(Floor).filter(
-            Floor.location_id == location.id,
-            Seat.status == SeatStatus.OCCUPIED
-        ).count()
-        location.current_occupancy = total_occupied
+        location.current_occupancy = await count_occupied_in_location(db, location.id)
     
-    db.commit()
+    await db.commit()
+    update_seat_statuses(status_changes)
     
     return {
         "message": f"Batch update completed",
@@ -117,14 +128,14 @@ async def batch_update_occupancy(
 @router.get("/occupancy/current", response_model=List[OccupancyResponse])
 async def get_current_occupancy(
     location_id: str = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current occupancy status for locations."""
-    query = db.query(Location)
+    query = select(Location)
     if location_id:
-        query = query.filter(Location.id == location_id)
+        query = query.where(Location.id == location_id)
     
-    locations = query.all()
+    locations = (await db.scalars(query)).all()
     
     results = []
     for location in locations:
@@ -142,17 +153,19 @@ async def get_current_occupancy(
 
 @router.post("/occupancy/simulate", status_code=status.HTTP_200_OK)
 async def simulate_random_occupancy(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Simulate random IoT sensor events for testing.
-    This randomly updates seat occupancy to simulate real-world usage.
+    This randomly updates seat occupancy to simulate real-world usage;
+    history is recorded separately by the occupancy sampler.
     """
     # Get all seats
-    seats = db.query(Seat).all()
+    seats = (await db.scalars(select(Seat))).all()
     
     # Randomly update some seats
     updated_seats = []
+    status_changes = {}
     for seat in seats:
         # 30% chance to change status
         if random.random() < 0.3:
@@ -162,38 +175,20 @@ async def simulate_random_occupancy(
             elif seat.status == SeatStatus.OCCUPIED:
                 seat.status = SeatStatus.AVAILABLE
             updated_seats.append(seat.id)
+            status_changes[seat.id] = seat.status
     
     # Update floor and location occupancies
-    floors = db.query(Floor).all()
+    await db.flush()
+    floors = (await db.scalars(select(Floor))).all()
     for floor in floors:
-        occupied_count = db.query(Seat).filter(
-            Seat.floor_id == floor.id,
-            Seat.status == SeatStatus.OCCUPIED
-        ).count()
-        floor.occupied_seats = occupied_count
+        floor.occupied_seats = await count_occupied_on_floor(db, floor.id)
     
-    locations = db.query(Location).all()
+    locations = (await db.scalars(select(Location))).all()
     for location in locations:
-        total_occupied = db.query(Seat).join(Floor).filter(
-            Floor.location_id == location.id,
-            Seat.status == SeatStatus.OCCUPIED
-        ).count()
-        location.current_occupancy = total_occupied
-        
-        # Record occupancy history
-        history = OccupancyHistory(
-            id=str(uuid.uuid4()),
-            location_id=location.id,
-            floor_id=None,
-            timestamp=datetime.utcnow(),
-            occupancy_count=location.current_occupancy,
-            total_capacity=location.total_capacity,
-            day_of_week=datetime.utcnow().weekday(),
-            hour_of_day=datetime.utcnow().hour
-        )
-        db.add(history)
+        location.current_occupancy = await count_occupied_in_location(db, location.id)
     
-    db.commit()
+    await db.commit()
+    update_seat_statuses(status_changes)
     
     return {
         "message": "Random occupancy simulation completed",
@@ -206,15 +201,15 @@ async def simulate_random_occupancy(
 async def get_occupancy_history(
     location_id: str = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get historical occupancy data for analytics."""
-    query = db.query(OccupancyHistory)
+    query = select(OccupancyHistory)
     
     if location_id:
-        query = query.filter(OccupancyHistory.location_id == location_id)
+        query = query.where(OccupancyHistory.location_id == location_id)
     
-    history = query.order_by(OccupancyHistory.timestamp.desc()).limit(limit).all()
+    history = (await db.scalars(query.order_by(OccupancyHistory.timestamp.desc()).limit(limit))).all()
     
     return [OccupancyHistoryResponse.from_orm(h) for h in history]
 
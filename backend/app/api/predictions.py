@@ -2,37 +2,29 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.config import settings
-from app.database import get_db
+from app.database import get_read_db
 from app.schemas.prediction import (
     SeatSuggestionRequest,
     SeatSuggestionResponse,
     SeatingPredictionRequest,
     SeatingPredictionResponse,
 )
-from app.services.gemini_client import GeminiClient, GeminiClientError
+from app.services.gemini_client import GeminiClientError, get_gemini_client
 from app.services.prediction_service import SeatPredictionService
-from app.services.seating_data import SeatingDataService
+from app.services.seating_data import get_seating_data_service
 from app.services.suggestion_service import SeatSuggestionService
 
 
 router = APIRouter()
 
 
-@lru_cache(maxsize=1)
-def _get_data_service() -> SeatingDataService:
-    return SeatingDataService(settings.SEATING_DATA_PATH)
-
-
 def _get_prediction_service() -> SeatPredictionService:
     return SeatPredictionService(
-        data_service=_get_data_service(),
-        gemini_client=GeminiClient(),
+        data_service=get_seating_data_service(),
+        gemini_client=get_gemini_client(),
     )
 
 
@@ -57,7 +49,7 @@ async def seating_prediction_endpoint(payload: SeatingPredictionRequest):
 @router.post("/suggestions", response_model=SeatSuggestionResponse)
 async def seat_suggestions_endpoint(
     payload: SeatSuggestionRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     service = SeatSuggestionService(db)
     suggestions = service.suggest(payload)
@@ -3,17 +3,19 @@ Reservations API routes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 import uuid
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.seat import Seat, SeatStatus
 from app.models.user import User
 from app.schemas.reservation import ReservationCreate, ReservationResponse, ReservationUpdate
 from app.api.auth import get_current_user
+from app.services.seat_indexes import update_seat_statuses
 
 router = APIRouter()
 
@@ -22,11 +24,11 @@ router = APIRouter()
 async def create_reservation(
     reservation_data: ReservationCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new reservation."""
     # Check if seat exists
-    seat = db.query(Seat).filter(Seat.id == reservation_data.seat_id).first()
+    seat = await db.get(Seat, reservation_data.seat_id)
     if not seat:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,8 +56,9 @@ async def create_reservation(
     seat.status = SeatStatus.RESERVED
     
     db.add(new_reservation)
-    db.commit()
-    db.refresh(new_reservation)
+    await db.commit()
+    await db.refresh(new_reservation)
+    update_seat_statuses({reservation_data.seat_id: SeatStatus.RESERVED})
     
     return ReservationResponse.from_orm(new_reservation)
 
@@ -63,12 +66,14 @@ async def create_reservation(
 @router.get("/my", response_model=List[ReservationResponse])
 async def get_my_reservations(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's reservations."""
-    reservations = db.query(Reservation).filter(
-        Reservation.user_id == current_user.id
-    ).order_by(Reservation.start_time.desc()).all()
+    reservations = (await db.scalars(
+        select(Reservation).where(
+            Reservation.user_id == current_user.id
+        ).order_by(Reservation.start_time.desc())
+    )).all()
     
     return [ReservationResponse.from_orm(r) for r in reservations]
 
@@ -77,13 +82,15 @@ async def get_my_reservations(
 async def checkin_reservation(
     reservation_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Check in to a reservation."""
-    reservation = db.query(Reservation).filter(
-        Reservation.id == reservation_id,
-        Reservation.user_id == current_user.id
-    ).first()
+    reservation = await db.scalar(
+        select(Reservation).where(
+            Reservation.id == reservation_id,
+            Reservation.user_id == current_user.id
+        )
+    )
     
     if not reservation:
         raise HTTPException(
@@ -95,12 +102,15 @@ async def checkin_reservation(
     reservation.status = ReservationStatus.ACTIVE
     
     # Update seat status
-    seat = db.query(Seat).filter(Seat.id == reservation.seat_id).first()
+    seat = await db.get(Seat, reservation.seat_id)
+    status_changes = {}
     if seat:
         seat.status = SeatStatus.OCCUPIED
+        status_changes[seat.id] = seat.status
     
-    db.commit()
-    db.refresh(reservation)
+    await db.commit()
+    await db.refresh(reservation)
+    update_seat_statuses(status_changes)
     
     return ReservationResponse.from_orm(reservation)
 
@@ -109,13 +119,15 @@ async def checkin_reservation(
 async def cancel_reservation(
     reservation_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Cancel a reservation."""
-    reservation = db.query(Reservation).filter(
-        Reservation.id == reservation_id,
-        Reservation.user_id == current_user.id
-    ).first()
+    reservation = await db.scalar(
+        select(Reservation).where(
+            Reservation.id == reservation_id,
+            Reservation.user_id == current_user.id
+        )
+    )
     
     if not reservation:
         raise HTTPException(
@@ -126,10 +138,13 @@ async def cancel_reservation(
     reservation.status = ReservationStatus.CANCELLED
     
     # Update seat status
-    seat = db.query(Seat).filter(Seat.id == reservation.seat_id).first()
+    seat = await db.get(Seat, reservation.seat_id)
+    status_changes = {}
     if seat:
         seat.status = SeatStatus.AVAILABLE
+        status_changes[seat.id] = seat.status
     
-    db.commit()
+    await db.commit()
+    update_seat_statuses(status_changes)
     
     return {"message": "Reservation cancelled successfully"}
@@ -2,13 +2,28 @@
 Seats API routes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import math
 
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Iterator, List, Optional
+
+from app.database import ReadSessionLocal, get_async_db, get_async_read_db
 from app.models.seat import Seat, SeatStatus
-from app.schemas.seat import SeatResponse, SeatUpdateRequest, SeatUpdateResponse
+from app.schemas.seat import (
+    SeatGroupMember,
+    SeatGroupOption,
+    SeatGroupResponse,
+    SeatNearestResponse,
+    SeatNeighbor,
+    SeatResponse,
+    SeatUpdateRequest,
+    SeatUpdateResponse,
+)
+from app.services.seat_indexes import ensure_seat_indexes_async, refresh_seat_indexes_async
+from app.services.seat_spatial_index import SeatCluster, seat_spatial_index
 
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
@@ -17,57 +32,251 @@ from datetime import datetime
 router = APIRouter()
 
 
+# Rows fetched per round trip when streaming NDJSON.
+SEAT_STREAM_CHUNK_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def iter_seat_ndjson(criteria: list, cursor: Optional[str], limit: Optional[int]) -> Iterator[str]:
+    """
+    Yield seats matching criteria as NDJSON lines, fetching keyset-ordered chunks.
+    Uses its own session so the stream does not depend on the request scope.
+    """
+    db = ReadSessionLocal()
+    try:
+        remaining = limit
+        while remaining is None or remaining > 0:
+            chunk_size = SEAT_STREAM_CHUNK_SIZE if remaining is None else min(SEAT_STREAM_CHUNK_SIZE, remaining)
+            query = db.query(Seat).filter(*criteria)
+            if cursor:
+                query = query.filter(Seat.id > cursor)
+            seats = query.order_by(Seat.id).limit(chunk_size).all()
+            if not seats:
+                break
+
+            yield "".join(SeatResponse.from_orm(seat).model_dump_json() + "\n" for seat in seats)
+
+            cursor = seats[-1].id
+            if remaining is not None:
+                remaining -= len(seats)
+            if len(seats) < chunk_size:
+                break
+            db.expunge_all()
+    finally:
+        db.close()
+
+
+async def list_seats(
+    db: AsyncSession,
+    criteria: list,
+    response: Response,
+    cursor: Optional[str],
+    limit: Optional[int],
+    skip: int = 0,
+    format: str = "json",
+):
+    """Shared keyset-paginated listing for the seat collection endpoints."""
+    if format == "ndjson":
+        return StreamingResponse(
+            iter_seat_ndjson(criteria, cursor, limit),
+            media_type="application/x-ndjson"
+        )
+
+    query = select(Seat).where(*criteria)
+    if cursor:
+        query = query.where(Seat.id > cursor)
+    query = query.order_by(Seat.id).offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+
+    seats = (await db.scalars(query)).all()
+    if limit is not None and len(seats) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = seats[-1].id
+    return [SeatResponse.from_orm(seat) for seat in seats]
+
+
 @router.get("/", response_model=List[SeatResponse])
 async def get_seats(
+    response: Response,
     floor_id: Optional[str] = Query(None),
     status: Optional[SeatStatus] = Query(None),
     seat_type: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Seat id from the previous page's X-Next-Cursor header"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    format: str = Query("json", regex="^(json|ndjson)$"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get list of seats with optional filters."""
-    query = db.query(Seat)
-
+    """
+    Get list of seats with optional filters, ordered by seat id.
+    Pass the X-Next-Cursor response header back as `cursor` for the next page;
+    `format=ndjson` streams the rows instead of building one JSON array.
+    """
+    criteria = []
     if floor_id:
-        query = query.filter(Seat.floor_id == floor_id)
+        criteria.append(Seat.floor_id == floor_id)
     if status:
-        query = query.filter(Seat.status == status)
+        criteria.append(Seat.status == status)
     if seat_type:
-        query = query.filter(Seat.seat_type == seat_type)
+        criteria.append(Seat.seat_type == seat_type)
 
-    seats = query.offset(skip).limit(limit).all()
-    return [SeatResponse.from_orm(seat) for seat in seats]
+    return await list_seats(db, criteria, response, cursor, limit, skip=skip, format=format)
 
 
 @router.get("/available", response_model=List[SeatResponse])
 async def get_available_seats(
+    response: Response,
     floor_id: Optional[str] = Query(None),
     has_power: Optional[bool] = Query(None),
     has_ac: Optional[bool] = Query(None),
     is_quiet: Optional[bool] = Query(None),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Seat id from the previous page's X-Next-Cursor header"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    format: str = Query("json", regex="^(json|ndjson)$"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get available seats with optional filters."""
-    query = db.query(Seat).filter(Seat.status == SeatStatus.AVAILABLE)
-
+    """
+    Get available seats with optional filters, ordered by seat id.
+    Without `limit` every match is returned; use `cursor`/`limit` to page
+    or `format=ndjson` to stream.
+    """
+    criteria = [Seat.status == SeatStatus.AVAILABLE]
     if floor_id:
-        query = query.filter(Seat.floor_id == floor_id)
+        criteria.append(Seat.floor_id == floor_id)
     if has_power is not None:
-        query = query.filter(Seat.has_power_outlet == has_power)
+        criteria.append(Seat.has_power_outlet == has_power)
     if has_ac is not None:
-        query = query.filter(Seat.has_ac == has_ac)
+        criteria.append(Seat.has_ac == has_ac)
     if is_quiet is not None:
-        query = query.filter(Seat.is_quiet == is_quiet)
+        criteria.append(Seat.is_quiet == is_quiet)
 
-    seats = query.all()
-    return [SeatResponse.from_orm(seat) for seat in seats]
+    return await list_seats(db, criteria, response, cursor, limit, format=format)
+
+
+@router.get("/group", response_model=SeatGroupResponse)
+async def get_group_seats(
+    size: int = Query(..., ge=1, le=50),
+    floor_id: Optional[str] = Query(None),
+    limit: int = Query(5, ge=1, le=20),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Find clusters of adjacent available seats for a group.
+    Seats at the same table rank first, then the tightest spatial clusters.
+    """
+    await ensure_seat_indexes_async(db)
+    clusters = seat_spatial_index.find_groups(size, floor_id=floor_id, limit=limit)
+    return SeatGroupResponse(
+        size=size,
+        floor_id=floor_id,
+        groups=[serialize_cluster(cluster) for cluster in clusters]
+    )
+
+
+@router.get("/nearest", response_model=SeatNearestResponse)
+async def get_nearest_seats(
+    seat_id: Optional[str] = Query(None, description="Find seats near this seat"),
+    seat_number: Optional[str] = Query(None, description="Find seats near this seat number, e.g. LIB-1-020"),
+    floor_id: Optional[str] = Query(None),
+    x: Optional[float] = Query(None, description="Floor map x coordinate (with floor_id)"),
+    y: Optional[float] = Query(None, description="Floor map y coordinate (with floor_id)"),
+    k: int = Query(5, ge=1, le=50),
+    has_power: Optional[bool] = Query(None),
+    has_ac: Optional[bool] = Query(None),
+    is_quiet: Optional[bool] = Query(None),
+    accessibility: Optional[bool] = Query(None),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Get the k nearest available seats to another seat or to a point on a floor.
+    Optional feature filters restrict which seats qualify.
+    """
+    await ensure_seat_indexes_async(db)
+
+    reference = None
+    if seat_id or seat_number:
+        reference = seat_spatial_index.locate(seat_id=seat_id, seat_number=seat_number)
+        if reference is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Seat not found"
+            )
+        floor_id, x, y = reference.floor_id, reference.x, reference.y
+    elif floor_id is None or x is None or y is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide seat_id, seat_number, or floor_id with x and y"
+        )
+    elif not (math.isfinite(x) and math.isfinite(y)):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="x and y must be finite numbers"
+        )
+
+    neighbours = seat_spatial_index.nearest(
+        floor_id,
+        x,
+        y,
+        k=k,
+        exclude_seat_id=reference.seat_id if reference else None,
+        filters={
+            "has_power_outlet": has_power,
+            "has_ac": has_ac,
+            "is_quiet": is_quiet,
+            "accessibility": accessibility,
+        },
+    )
+    return SeatNearestResponse(
+        floor_id=floor_id,
+        x_coordinate=x,
+        y_coordinate=y,
+        reference_seat_id=reference.seat_id if reference else None,
+        seats=[
+            SeatNeighbor(
+                seat_id=seat.seat_id,
+                seat_number=seat.seat_number,
+                floor_id=seat.floor_id,
+                table_number=seat.table_number,
+                has_power_outlet=seat.has_power_outlet,
+                has_ac=seat.has_ac,
+                accessibility=seat.accessibility,
+                x_coordinate=seat.x,
+                y_coordinate=seat.y,
+                distance=round(distance, 4)
+            )
+            for distance, seat in neighbours
+        ]
+    )
+
+
+def serialize_cluster(cluster: SeatCluster) -> SeatGroupOption:
+    """Convert a spatial index cluster into its response schema."""
+    return SeatGroupOption(
+        floor_id=cluster.floor_id,
+        floor_name=cluster.seats[0].floor_name if cluster.seats else None,
+        same_table=cluster.same_table,
+        table_number=cluster.table_number,
+        spread=cluster.spread,
+        seats=[
+            SeatGroupMember(
+                seat_id=seat.seat_id,
+                seat_number=seat.seat_number,
+                table_number=seat.table_number,
+                has_power_outlet=seat.has_power_outlet,
+                has_ac=seat.has_ac,
+                accessibility=seat.accessibility,
+                x_coordinate=seat.x,
+                y_coordinate=seat.y
+            )
+            for seat in cluster.seats
+        ]
+    )
 
 
 @router.get("/{seat_id}", response_model=SeatResponse)
-async def get_seat(seat_id: str, db: Session = Depends(get_db)):
+async def get_seat(seat_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """Get seat by ID."""
-    seat = db.query(Seat).filter(Seat.id == seat_id).first()
+    seat = await db.get(Seat, seat_id)
     if not seat:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,7 +288,7 @@ async def get_seat(seat_id: str, db: Session = Depends(get_db)):
 @router.patch("/update", response_model=SeatUpdateResponse)
 async def update_seats(
     payload: SeatUpdateRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update venue seat layout in a single transaction.
@@ -94,25 +303,27 @@ async def update_seats(
 
         # --- Remove seats ---
         if payload.removed:
-            db.query(Seat).filter(Seat.id.in_(payload.removed)
-                                  ).delete(synchronize_session=False)
+            await db.execute(
+                delete(Seat).where(Seat.id.in_(payload.removed)).execution_options(synchronize_session=False)
+            )
 
         # --- Update existing seats ---
         if payload.updated:
             for seat_data in payload.updated:
-                seat = db.query(Seat).filter(Seat.id == seat_data.id).first()
+                seat = await db.get(Seat, seat_data.id)
                 if seat:
                     for key, value in seat_data.dict(exclude_unset=True).items():
                         setattr(seat, key, value)
 
-        db.commit()
+        await db.commit()
+        await refresh_seat_indexes_async(db)
 
         return SeatUpdateResponse(
             message="Map successfully modified",
             created_at=datetime.now())
 
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {str(e)}"
@@ -20,6 +20,22 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./jcu_library.db"
+    # Optional read replica for read-only endpoints; defaults to DATABASE_URL
+    DATABASE_READ_URL: Optional[str] = None
+    # Apply pending Alembic migrations on startup; when False, startup fails instead
+    DB_AUTO_MIGRATE: bool = True
+    # Connection pool for file-backed databases
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    # Server databases (PostgreSQL)
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    # SQLite tuning: "tuned" (WAL, synchronous=NORMAL, bigger cache, mmap) or "default"
+    SQLITE_PROFILE: str = "tuned"
+    SQLITE_CACHE_SIZE_KB: int = 65536
+    SQLITE_MMAP_SIZE_BYTES: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
@@ -33,6 +49,27 @@ class Settings(BaseSettings):
     IOT_SIMULATION_ENABLED: bool = True
     IOT_UPDATE_INTERVAL_SECONDS: int = 60
 
+    # Occupancy history retention (days, 0 = keep forever); daily rollups are always kept
+    OCCUPANCY_RAW_RETENTION_DAYS: int = 90
+    OCCUPANCY_HOURLY_ROLLUP_RETENTION_DAYS: int = 400
+    # How often the leader prunes (0 = no pruning)
+    OCCUPANCY_RETENTION_INTERVAL_SECONDS: int = 3600
+    # Per-floor and per-location history sample cadence (0 = no sampling)
+    OCCUPANCY_SAMPLE_INTERVAL_SECONDS: int = 300
+
+    # Request/database metrics middleware and the Prometheus /metrics endpoint
+    METRICS_ENABLED: bool = True
+    # Opt-in SQL profiling of every request: N+1 detection and a slow-request log
+    QUERY_PROFILING_ENABLED: bool = False
+    SLOW_REQUEST_THRESHOLD_MS: int = 500
+    SLOW_REQUEST_LOG_SIZE: int = 50
+    # Same statement this many times in one request = N+1 candidate
+    N_PLUS_ONE_THRESHOLD: int = 5
+    # Event loop lag sampling (0 = off); stalls over the threshold are logged with the blocking stack
+    LOOP_LAG_SAMPLE_INTERVAL_MS: int = 100
+    LOOP_LAG_THRESHOLD_MS: int = 100
+    LOOP_STALL_HISTORY: int = 50
+
     # Images
     IMAGE_UPLOAD_DIR: str = "/var/www/cp3405-uploads"
 
@@ -40,6 +77,15 @@ class Settings(BaseSettings):
     SEAT_REFRESH_INTERVAL_SECONDS: int = 60
     SEAT_REFRESH_DRIFT_RATIO: float = 0.06
     SEAT_TARGET_OCCUPANCY_RATIO: float = 0.65
+    # Recent leader refresh ticks kept for /api/admin/workers/seat-refresh
+    SEAT_REFRESH_TICK_HISTORY: int = 120
+    # "compact" (per-floor, run-length encoded) or "verbose" (one line per seat)
+    AI_SEAT_MAP_ENCODING: str = "compact"
+    # Multi-process deployments: one process (the leader) runs the seat refresh
+    # worker and the others poll its published snapshot at this interval
+    SEAT_SNAPSHOT_POLL_SECONDS: int = 5
+    # Directory for the leader election lock files used with SQLite (default: temp dir)
+    WORKER_LOCK_DIR: Optional[str] = None
     
     # Admin User
     ADMIN_EMAIL: str = "admin@jcu.edu.au"
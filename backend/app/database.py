@@ -3,24 +3,168 @@ Database configuration and session management.
 Sets up SQLAlchemy engine, session, and base model.
 """
 
-from sqlalchemy import create_engine
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 from .config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG
+SQLITE_PROFILES = ("default", "tuned")
+
+# Async driver used for each dialect on the async request path
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def sqlite_pragmas(profile: str) -> Dict[str, object]:
+    """
+    PRAGMAs applied to every new SQLite connection for a profile.
+    "tuned" lets readers run alongside the writer (WAL) and only fsyncs at
+    checkpoints; a power loss can drop the last commits but never corrupts
+    the database.
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r}; expected one of {SQLITE_PROFILES}")
+    pragmas: Dict[str, object] = {"busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS}
+    if profile == "tuned":
+        pragmas.update(
+            journal_mode="WAL",
+            synchronous="NORMAL",
+            # Negative values are KiB rather than pages
+            cache_size=-settings.SQLITE_CACHE_SIZE_KB,
+            mmap_size=settings.SQLITE_MMAP_SIZE_BYTES,
+            temp_store="MEMORY",
+        )
+    return pragmas
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url.split("://", 1)[1] in ("", "/:memory:") or "mode=memory" in url
+
+
+def _sqlite_options(url: str, queue_pool) -> Dict[str, object]:
+    """Engine keyword arguments shared by the sync and async SQLite engines."""
+    if _is_sqlite_memory(url):
+        # One shared connection, otherwise every checkout sees an empty database
+        pool_options: Dict[str, object] = {"poolclass": StaticPool}
+    else:
+        pool_options = {
+            "poolclass": queue_pool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+        }
+    return {
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+        "echo": settings.DEBUG,
+        **pool_options,
+    }
+
+
+def _install_sqlite_pragmas(sqlite_engine: Engine, profile: Optional[str]) -> None:
+    pragmas = sqlite_pragmas(profile or settings.SQLITE_PROFILE)
+
+    @event.listens_for(sqlite_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def _server_pool_options() -> Dict[str, object]:
+    """
+    Pool settings for a database server (PostgreSQL in production).
+    Connections are checked before use and recycled so a failover or idle
+    timeout on the server side does not surface as a failed request.
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "echo": settings.DEBUG,
+    }
+
+
+def create_server_engine(url: str) -> Engine:
+    """Engine for a database server, with the pool profile and statement timeout."""
+    connect_args = {}
+    if url.startswith("postgresql"):
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    return create_engine(url, connect_args=connect_args, **_server_pool_options())
+
+
+def create_db_engine(url: str, sqlite_profile: Optional[str] = None) -> Engine:
+    """Create an engine for `url`, applying the SQLite profile to SQLite URLs."""
+    if not url.startswith("sqlite"):
+        return create_server_engine(url)
+
+    sqlite_engine = create_engine(url, **_sqlite_options(url, QueuePool))
+    _install_sqlite_pragmas(sqlite_engine, sqlite_profile)
+    return sqlite_engine
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync database URL onto its async driver (aiosqlite / asyncpg)."""
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {dialect!r} URLs")
+    driver = ASYNC_DRIVERS[dialect].split("+", 1)[1]
+    if find_spec(driver) is None:
+        raise RuntimeError(
+            f"{dialect} database URLs need the {driver!r} package for the async engine; "
+            f"install it with `pip install {driver}` (see requirements.txt)"
+        )
+    return f"{ASYNC_DRIVERS[dialect]}{separator}{rest}"
+
+
+def create_async_db_engine(url: str, sqlite_profile: Optional[str] = None) -> AsyncEngine:
+    """Async counterpart of create_db_engine with the same pool and SQLite profiles."""
+    async_url = to_async_url(url)
+    if not url.startswith("sqlite"):
+        connect_args = {}
+        if url.startswith("postgresql"):
+            connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+        return create_async_engine(async_url, connect_args=connect_args, **_server_pool_options())
+
+    async_engine = create_async_engine(async_url, **_sqlite_options(url, AsyncAdaptedQueuePool))
+    _install_sqlite_pragmas(async_engine.sync_engine, sqlite_profile)
+    return async_engine
+
+
+# Create SQLAlchemy engines: primary for writes, replica (if configured) for reads
+engine = create_db_engine(settings.DATABASE_URL)
+read_engine = create_db_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else engine
+
+# Async engines for the request path of the hot endpoints
+async_engine = create_async_db_engine(settings.DATABASE_URL)
+async_read_engine = (
+    create_async_db_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else async_engine
 )
 
-# Create session factory
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+# Objects stay readable after commit so handlers can serialize them without a refresh
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[1] / "alembic.ini"
+# Revision matching the schema that create_all produced before migrations existed
+BASELINE_REVISION = "3f1c2a9d8b10"
+
 
 def get_db():
     """
@@ -34,11 +178,86 @@ def get_db():
         db.close()
 
 
-def init_db():
+def get_read_db():
     """
-    Initialize database by creating all tables.
-    Should be called on application startup.
+    Dependency for read-only endpoints.
+    Uses the read replica when DATABASE_READ_URL is set, so results can lag
+    the primary by the replication delay; endpoints that write or must see
+    their own writes should use get_db.
     """
-    from app.models import user, location, floor, seat, reservation, occupancy_history, operating_hours
-    Base.metadata.create_all(bind=engine)
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    Async dependency for the hot endpoints.
+    Queries await the driver instead of blocking the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """Async counterpart of get_read_db (replica when DATABASE_READ_URL is set)."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engines():
+    """Close pooled async connections on shutdown."""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+
+def alembic_config():
+    """Alembic config bound to the application's database."""
+    from alembic.config import Config
 
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "migrations"))
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+    # Leave the application's (uvicorn's) logging configuration alone
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def get_schema_revisions() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (current, head) schema revisions.
+    Only reads the alembic_version table, so it is cheap enough for every boot.
+    """
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    return current, head
+
+
+def upgrade_db(revision: str = "head"):
+    """
+    Apply migrations up to `revision`.
+    Databases created by create_all before migrations existed are stamped at
+    the baseline first so only the later revisions run against them.
+    """
+    from alembic import command
+
+    config = alembic_config()
+    current, _ = get_schema_revisions()
+    if current is None and inspect(engine).has_table("seats"):
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+def init_db():
+    """
+    Initialize database by migrating it to the latest schema revision.
+    Used by scripts that build a database from scratch (e.g. mock data).
+    """
+    upgrade_db()
@@ -2,11 +2,14 @@
 Main FastAPI application entry point.
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.database import init_db
+from app.database import dispose_async_engines, get_schema_revisions, upgrade_db
 from app.api import (
     admin,
     ai_demo,
@@ -21,7 +24,14 @@ from app.api import (
     seats,
     forecast
 )
+from app.services import metrics, query_profiler
+from app.services.gemini_client import get_gemini_client
+from app.services.leader_election import LeaderLock
+from app.services.loop_monitor import loop_lag_monitor
+from app.services.occupancy_retention import occupancy_retention_worker
+from app.services.occupancy_sampler import occupancy_sampler
 from app.services.seat_refresh_worker import seat_refresh_worker
+from app.services.seating_data import warm_up_seating_data
 
 
 @asynccontextmanager
@@ -31,14 +41,44 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     print("🚀 Starting JCU Smart Seats System...")
-    init_db()
-    print("✅ Database initialized")
+    await loop_lag_monitor.start()
+    # Worker processes start together; only one at a time may check and migrate
+    migration_lock = LeaderLock("schema-migration")
+    await asyncio.to_thread(migration_lock.acquire)
+    try:
+        current_revision, head_revision = await asyncio.to_thread(get_schema_revisions)
+        if current_revision == head_revision:
+            print(f"✅ Database schema at revision {head_revision}")
+        elif settings.DB_AUTO_MIGRATE:
+            await asyncio.to_thread(upgrade_db)
+            print(f"✅ Database migrated from {current_revision or 'empty'} to {head_revision}")
+        else:
+            raise RuntimeError(
+                f"Database schema is at revision {current_revision or 'none'}, expected {head_revision}. "
+                "Run `alembic upgrade head` before starting the server."
+            )
+    finally:
+        await asyncio.to_thread(migration_lock.release)
+    if await asyncio.to_thread(warm_up_seating_data):
+        print("✅ Seating dataset loaded")
+    else:
+        print(f"⚠️ Seating dataset not found at {settings.SEATING_DATA_PATH}")
     await seat_refresh_worker.start()
+    role = "leader" if seat_refresh_worker.is_leader else "follower"
+    print(f"✅ Seat refresh worker started as {role}")
+    await occupancy_retention_worker.start()
+    await occupancy_sampler.start()
+    await get_gemini_client().open()
 
     yield
 
     # Shutdown
+    await get_gemini_client().aclose()
+    await occupancy_sampler.stop()
+    await occupancy_retention_worker.stop()
     await seat_refresh_worker.stop()
+    await dispose_async_engines()
+    await loop_lag_monitor.stop()
     print("👋 Shutting down...")
 
 
@@ -59,8 +99,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[seats.NEXT_CURSOR_HEADER],
 )
 
+if settings.QUERY_PROFILING_ENABLED:
+    query_profiler.install_query_hooks()
+    app.add_middleware(query_profiler.QueryProfilerMiddleware)
+
+if settings.METRICS_ENABLED:
+    # Added last so it is outermost and times CORS handling too
+    metrics.install_query_hooks()
+    app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(seats.router, prefix="/api/seats", tags=["Seats"])
@@ -94,3 +144,10 @@ async def health_check():
         "status": "healthy",
         "environment": settings.ENVIRONMENT
     }
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """Request, database and background worker metrics in the Prometheus text format."""
+        return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
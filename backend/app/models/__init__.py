@@ -9,7 +9,9 @@ from .floor import Floor
 from .seat import Seat
 from .reservation import Reservation
 from .occupancy_history import OccupancyHistory
+from .occupancy_rollup import OccupancyRollup
 from .operating_hours import OperatingHours
+from .worker_snapshot import WorkerSnapshot
 
 __all__ = [
     "User",
@@ -18,6 +20,8 @@ __all__ = [
     "Seat",
     "Reservation",
     "OccupancyHistory",
+    "OccupancyRollup",
     "OperatingHours",
+    "WorkerSnapshot",
 ]
 
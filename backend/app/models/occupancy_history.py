@@ -2,7 +2,8 @@
 Occupancy history model for tracking seat occupancy over time.
 """
 
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Numeric, DateTime, ForeignKey, Index, case, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -12,6 +13,10 @@ class OccupancyHistory(Base):
     """Occupancy history model for analytics and IoT data."""
     
     __tablename__ = "occupancy_history"
+    __table_args__ = (
+        # Per-location history windows ordered by time
+        Index("ix_occupancy_history_location_id_timestamp", "location_id", "timestamp"),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, index=True)
@@ -36,12 +41,23 @@ class OccupancyHistory(Base):
     location = relationship("Location", back_populates="occupancy_history")
     floor = relationship("Floor", back_populates="occupancy_history")
     
-    @property
+    @hybrid_property
     def occupancy_percentage(self) -> float:
         """Calculate occupancy percentage."""
         if self.total_capacity == 0:
             return 0.0
         return round((self.occupancy_count / self.total_capacity) * 100, 2)
+
+    @occupancy_percentage.expression
+    def occupancy_percentage(cls):
+        """Same calculation in SQL, so it can be filtered and aggregated in queries."""
+        return case(
+            (
+                cls.total_capacity > 0,
+                func.round(cast(cls.occupancy_count * 100.0 / cls.total_capacity, Numeric), 2, type_=Float),
+            ),
+            else_=0.0,
+        )
     
     def __repr__(self):
         return f"<OccupancyHistory(id={self.id}, timestamp={self.timestamp}, occupancy={self.occupancy_percentage}%)>"
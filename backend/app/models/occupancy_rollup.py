@@ -0,0 +1,52 @@
+"""
+Occupancy rollup model: pre-aggregated occupancy history per time bucket.
+"""
+
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
+from app.database import Base
+
+
+class OccupancyRollup(Base):
+    """
+    Hourly or daily aggregate of occupancy history rows for one location
+    (floor_id NULL) or floor. Maintained as history is written, so analytics
+    read one row per bucket instead of every sample.
+    """
+
+    __tablename__ = "occupancy_rollups"
+    __table_args__ = (
+        # Trend queries: one granularity over a time window, optionally per location
+        Index("ix_occupancy_rollups_granularity_bucket", "granularity", "bucket_start"),
+        Index("ix_occupancy_rollups_granularity_location_bucket", "granularity", "location_id", "bucket_start"),
+    )
+
+    # Primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Bucket
+    granularity = Column(String(8), nullable=False)  # "hour" or "day"
+    bucket_start = Column(DateTime, nullable=False)
+
+    # Foreign keys
+    location_id = Column(String(36), ForeignKey("locations.id"), nullable=False)
+    floor_id = Column(String(36), ForeignKey("floors.id"), nullable=True)
+
+    # Aggregates over the history rows in the bucket
+    sample_count = Column(Integer, nullable=False, default=0)
+    occupancy_sum = Column(Integer, nullable=False, default=0)
+    occupancy_min = Column(Integer, nullable=False)
+    occupancy_max = Column(Integer, nullable=False)
+    # Sum of per-sample occupancy percentages (0-100), for the average percentage
+    percentage_sum = Column(Float, nullable=False, default=0.0)
+
+    @property
+    def occupancy_avg(self) -> float:
+        if self.sample_count == 0:
+            return 0.0
+        return self.occupancy_sum / self.sample_count
+
+    def __repr__(self):
+        return (
+            f"<OccupancyRollup(granularity={self.granularity}, bucket_start={self.bucket_start}, "
+            f"location_id={self.location_id}, floor_id={self.floor_id}, samples={self.sample_count})>"
+        )
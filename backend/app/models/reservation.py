@@ -2,7 +2,7 @@
 Reservation model for seat bookings.
 """
 
-from sqlalchemy import Column, String, DateTime, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Enum, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -23,6 +23,14 @@ class Reservation(Base):
     """Reservation model for seat bookings."""
     
     __tablename__ = "reservations"
+    __table_args__ = (
+        # "My reservations", newest first
+        Index("ix_reservations_user_id_start_time", "user_id", "start_time"),
+        # Active/pending bookings for a seat
+        Index("ix_reservations_seat_id_status", "seat_id", "status"),
+        # Report export window
+        Index("ix_reservations_created_at", "created_at"),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, index=True)
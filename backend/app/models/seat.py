@@ -2,7 +2,7 @@
 Seat model for individual seats.
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, Enum, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, Enum, Numeric, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -31,6 +31,19 @@ class Seat(Base):
     """Seat model representing individual seats."""
     
     __tablename__ = "seats"
+    __table_args__ = (
+        # Floor occupancy counts and per-floor listings filtered by status
+        Index("ix_seats_floor_id_status", "floor_id", "status"),
+        # Status counts and keyset pagination over /seats?status= and /seats/available
+        Index("ix_seats_status_id", "status", "id"),
+        # Feature filters on /seats/available; only available seats are ever searched
+        Index(
+            "ix_seats_available_features",
+            "has_power_outlet", "has_ac", "is_quiet",
+            sqlite_where=text("status = 'AVAILABLE'"),
+            postgresql_where=text("status = 'AVAILABLE'"),
+        ),
+    )
     
     # Primary key
     id = Column(String(36), primary_key=True, index=True)
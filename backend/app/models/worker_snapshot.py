@@ -0,0 +1,30 @@
+"""
+Worker snapshot model for state shared between server processes.
+"""
+
+from sqlalchemy import Column, String, Integer, LargeBinary, DateTime
+from datetime import datetime
+from app.database import Base
+
+
+class WorkerSnapshot(Base):
+    """Latest snapshot published by a background worker, read by every process."""
+
+    __tablename__ = "worker_snapshots"
+
+    # Primary key
+    name = Column(String(64), primary_key=True)
+
+    # Incremented on every publish so readers can skip unchanged snapshots
+    version = Column(Integer, nullable=False, default=0)
+    # zlib-compressed JSON
+    payload = Column(LargeBinary, nullable=False)
+
+    # Process that published it (host:pid)
+    owner = Column(String(128), nullable=True)
+
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<WorkerSnapshot(name={self.name}, version={self.version}, owner={self.owner})>"
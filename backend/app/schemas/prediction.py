@@ -40,6 +40,7 @@ class SeatSuggestionItem(BaseModel):
     seat_id: str
     seat_number: str
     floor_id: str
+    floor_name: Optional[str] = None
     seat_type: SeatType
     has_power_outlet: bool
     has_wifi: bool
@@ -71,6 +71,50 @@ class SeatUpdateRequest(BaseModel):
     updated: Optional[List[SeatUpdate]] = []
 
 
+class SeatGroupMember(BaseModel):
+    """Seat within a group seating option."""
+    seat_id: str
+    seat_number: str
+    table_number: Optional[int]
+    has_power_outlet: bool
+    has_ac: bool
+    accessibility: bool
+    x_coordinate: float
+    y_coordinate: float
+
+
+class SeatGroupOption(BaseModel):
+    """A cluster of adjacent available seats."""
+    floor_id: str
+    floor_name: Optional[str]
+    same_table: bool
+    table_number: Optional[int]
+    spread: float
+    seats: List[SeatGroupMember]
+
+
+class SeatGroupResponse(BaseModel):
+    """Schema for group seating search response."""
+    size: int
+    floor_id: Optional[str]
+    groups: List[SeatGroupOption]
+
+
+class SeatNeighbor(SeatGroupMember):
+    """Available seat returned by a nearest-seat query."""
+    floor_id: str
+    distance: float
+
+
+class SeatNearestResponse(BaseModel):
+    """Schema for nearest available seats response."""
+    floor_id: str
+    x_coordinate: float
+    y_coordinate: float
+    reference_seat_id: Optional[str] = None
+    seats: List[SeatNeighbor]
+
+
 class SeatUpdateResponse(BaseModel):
     """Schema for seat update response"""
     message: Optional[str]
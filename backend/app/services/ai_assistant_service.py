@@ -10,23 +10,38 @@ from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.models.seat import Seat, SeatType
 from app.schemas.ai_demo import AiChatRequest, AiChatResponse, ChatMessage
-from app.schemas.prediction import SeatSuggestionRequest
-from app.services.gemini_client import GeminiClient
-from app.services.seating_data import SeatingDataService
+from app.schemas.prediction import SeatSuggestionItem, SeatSuggestionRequest
+from app.services.gemini_client import get_gemini_client
+from app.services.seat_indexes import ensure_seat_indexes
+from app.services.seat_spatial_index import SeatCluster, seat_spatial_index
+from app.services.seating_data import get_seating_data_service
 from app.services.suggestion_service import SeatSuggestionService
 from app.services.seat_refresh_worker import seat_refresh_worker
 
 
+_NUMBER_WORDS = {
+    "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_COUNT = r"(\d{1,2}|" + "|".join(_NUMBER_WORDS) + r")"
+_GROUP_SIZE_PATTERNS = (
+    re.compile(_COUNT + r"\s+(?:seats|people|persons|students|friends|of us)\b", re.IGNORECASE),
+    re.compile(r"\bgroup of\s+" + _COUNT + r"\b", re.IGNORECASE),
+)
+MAX_GROUP_OPTIONS = 3
+_SEAT_NUMBER_PATTERN = re.compile(r"\b[A-Z]{2,4}-\d+-\d+\b", re.IGNORECASE)
+MAX_NEARBY_SEATS = 5
+
+
 class AiAssistantService:
     """Handles chat intent extraction, seat selection, and Gemini responses."""
 
     def __init__(self, db: Session):
         self._db = db
         self._suggestion_service = SeatSuggestionService(db)
-        self._gemini = GeminiClient()
-        self._data_service = SeatingDataService(settings.SEATING_DATA_PATH)
+        self._gemini = get_gemini_client()
+        self._data_service = get_seating_data_service()
 
     async def chat(self, payload: AiChatRequest) -> AiChatResponse:
         sanitized_messages = [msg for msg in payload.messages if (msg.content and msg.content.strip())]
@@ -35,12 +50,16 @@ class AiAssistantService:
 
         latest_message = sanitized_messages[-1].content
 
+        # One load warms the suggestion and spatial indexes together
+        ensure_seat_indexes(self._db)
         suggestion_request = SeatSuggestionRequest()
         suggestions = self._suggestion_service.suggest(suggestion_request)
 
         seat_details = [self._serialize_seat(item) for item in suggestions]
+        group_options = self._group_options(latest_message, seat_details)
+        group_options += self._nearby_options(latest_message, seat_details)
 
-        seat_map_snapshot = seat_refresh_worker.get_encoded_snapshot()
+        seat_map_snapshot = self._seat_map_snapshot(latest_message, seat_details)
 
         try:
             reply_text, model_highlights = await self._compose_reply(
@@ -48,6 +67,7 @@ class AiAssistantService:
                 seat_details,
                 latest_message,
                 seat_map_snapshot,
+                group_options,
             )
         except Exception as exc:
             debug_info = traceback.format_exc()
@@ -63,41 +83,144 @@ class AiAssistantService:
 
         return AiChatResponse(reply=reply_text, highlight_seats=highlight_ids, seat_details=seat_details)
 
-    def _serialize_seat(self, seat_item) -> Dict:
-        seat: Seat = self._db.query(Seat).filter(Seat.id == seat_item.seat_id).first()
-        if seat is None:
-            return {
-                "seat_id": seat_item.seat_id,
-                "seat_number": seat_item.seat_number,
-                "floor_id": seat_item.floor_id,
-                "seat_type": seat_item.seat_type,
-                "has_power_outlet": seat_item.has_power_outlet,
-                "has_wifi": seat_item.has_wifi,
-                "has_ac": seat_item.has_ac,
-                "accessibility": seat_item.accessibility,
-            }
-
-        floor_name = seat.floor.floor_name if seat.floor else "Unknown Floor"
+    @staticmethod
+    def _parse_group_size(message: str) -> Optional[int]:
+        for pattern in _GROUP_SIZE_PATTERNS:
+            match = pattern.search(message or "")
+            if match:
+                token = match.group(1).lower()
+                size = _NUMBER_WORDS.get(token) or int(token)
+                return size if size > 1 else None
+        return None
+
+    def _group_options(self, latest_message: str, seat_details: List[Dict]) -> List[Dict]:
+        """Precomputed adjacent-seat clusters when the user asks for several seats.
+
+        Member seats are appended to ``seat_details`` so the model may highlight them.
+        """
+        size = self._parse_group_size(latest_message)
+        if size is None:
+            return []
+
+        ensure_seat_indexes(self._db)
+        clusters = seat_spatial_index.find_groups(size, limit=MAX_GROUP_OPTIONS)
+        known_ids = {detail["seat_id"] for detail in seat_details}
+        options = []
+        for cluster in clusters:
+            for seat in cluster.seats:
+                if seat.seat_id not in known_ids:
+                    seat_details.append(self._serialize_cluster_seat(seat))
+                    known_ids.add(seat.seat_id)
+            options.append(self._serialize_cluster(cluster))
+        return options
+
+    def _nearby_options(self, latest_message: str, seat_details: List[Dict]) -> List[Dict]:
+        """Nearest available seats to any seat number mentioned in the message."""
+        seat_numbers = _SEAT_NUMBER_PATTERN.findall(latest_message or "")
+        if not seat_numbers:
+            return []
+
+        ensure_seat_indexes(self._db)
+        known_ids = {detail["seat_id"] for detail in seat_details}
+        options = []
+        for seat_number in dict.fromkeys(number.upper() for number in seat_numbers):
+            reference = seat_spatial_index.locate(seat_number=seat_number)
+            if reference is None:
+                continue
+            neighbours = seat_spatial_index.nearest(
+                reference.floor_id,
+                reference.x,
+                reference.y,
+                k=MAX_NEARBY_SEATS,
+                exclude_seat_id=reference.seat_id,
+            )
+            for _, seat in neighbours:
+                if seat.seat_id not in known_ids:
+                    seat_details.append(self._serialize_cluster_seat(seat))
+                    known_ids.add(seat.seat_id)
+            options.append(
+                {
+                    "near_seat": reference.seat_number,
+                    "floor_name": reference.floor_name,
+                    "seat_ids": [seat.seat_id for _, seat in neighbours],
+                    "seat_numbers": [seat.seat_number for _, seat in neighbours],
+                }
+            )
+        return options
+
+    @staticmethod
+    def _serialize_cluster(cluster: SeatCluster) -> Dict:
         return {
-            "seat_id": seat.id,
+            "floor_name": cluster.seats[0].floor_name if cluster.seats else None,
+            "same_table": cluster.same_table,
+            "table_number": cluster.table_number,
+            "seat_ids": [seat.seat_id for seat in cluster.seats],
+            "seat_numbers": [seat.seat_number for seat in cluster.seats],
+        }
+
+    @staticmethod
+    def _serialize_cluster_seat(seat) -> Dict:
+        return {
+            "seat_id": seat.seat_id,
             "seat_number": seat.seat_number,
             "floor_id": seat.floor_id,
-            "floor_name": floor_name,
-            "seat_type": seat.seat_type.value if hasattr(seat.seat_type, "value") else seat.seat_type,
+            "floor_name": seat.floor_name or "Unknown Floor",
+            "seat_type": seat.seat_type,
             "has_power_outlet": seat.has_power_outlet,
-            "has_wifi": getattr(seat, "has_wifi", False),
-            "has_ac": getattr(seat, "has_ac", False),
+            "has_wifi": False,
+            "has_ac": seat.has_ac,
             "accessibility": seat.accessibility,
         }
 
+    @staticmethod
+    def _seat_map_snapshot(latest_message: str, seat_details: List[Dict]) -> Dict[str, Optional[str]]:
+        if settings.AI_SEAT_MAP_ENCODING == "verbose":
+            return seat_refresh_worker.get_encoded_snapshot()
+        return seat_refresh_worker.get_compact_snapshot(
+            message=latest_message,
+            preferred_floor_ids=[detail["floor_id"] for detail in seat_details if detail.get("floor_id")],
+        )
+
+    @staticmethod
+    def _serialize_seat(seat_item: SeatSuggestionItem) -> Dict:
+        seat_type = seat_item.seat_type
+        return {
+            "seat_id": seat_item.seat_id,
+            "seat_number": seat_item.seat_number,
+            "floor_id": seat_item.floor_id,
+            "floor_name": seat_item.floor_name or "Unknown Floor",
+            "seat_type": seat_type.value if hasattr(seat_type, "value") else seat_type,
+            "has_power_outlet": seat_item.has_power_outlet,
+            "has_wifi": seat_item.has_wifi,
+            "has_ac": seat_item.has_ac,
+            "accessibility": seat_item.accessibility,
+        }
+
     async def _compose_reply(
         self,
         messages: List[ChatMessage],
         seat_details: List[Dict],
         latest_user_message: str,
         seat_map_snapshot: Dict[str, Optional[str]],
+        group_options: Optional[List[Dict]] = None,
     ) -> tuple[str, List[str]]:
         if not self._gemini.is_configured:
+            if group_options and "near_seat" in group_options[0]:
+                nearby = group_options[0]
+                if nearby["seat_numbers"]:
+                    return (
+                        f"The closest free seats to {nearby['near_seat']} are {', '.join(nearby['seat_numbers'])} "
+                        f"on {nearby['floor_name'] or 'the same floor'}.",
+                        list(nearby["seat_ids"]),
+                    )
+            elif group_options:
+                group = group_options[0]
+                where = f"at table {group['table_number']}" if group["same_table"] else "next to each other"
+                return (
+                    f"Seats {', '.join(group['seat_numbers'])} on {group['floor_name'] or 'the selected floor'} "
+                    f"are free {where}—they match your latest request: {latest_user_message}.",
+                    list(group["seat_ids"]),
+                )
             if seat_details:
                 seat = seat_details[0]
                 return (
@@ -108,7 +231,10 @@ class AiAssistantService:
             return ("I couldn't find any matching seats right now, please try again later.", [])
 
         conversation = "\n".join(f"{msg.role.title()}: {msg.content}" for msg in messages)
-        seat_json = json.dumps(seat_details, ensure_ascii=False, indent=2)
+        if settings.AI_SEAT_MAP_ENCODING == "verbose":
+            seat_json = json.dumps(seat_details, ensure_ascii=False, indent=2)
+        else:
+            seat_json = json.dumps(seat_details, ensure_ascii=False, separators=(",", ":"))
         dataset_summary = json.dumps(self._data_service.summary(), ensure_ascii=False)[:4000]
         seat_map_encoded = seat_map_snapshot.get("encoded") or ""
         seat_map_timestamp = seat_map_snapshot.get("last_updated") or "unknown"
@@ -121,6 +247,7 @@ class AiAssistantService:
             "Recommended seats (JSON):\n"
             f"{seat_json}\n\n"
             f"There are {len(seat_details)} seats in this list. You MUST only reference seats that appear in this JSON. If the user asks for more seats than available, explain the limitation clearly.\n\n"
+            f"{self._group_prompt(group_options)}"
             "After your explanation, add a line highlight_seats_list:[seat_id_1,seat_id_2,...] containing the seat_id values you highlighted. This line is mandatory.\n\n"
             "Seat map snapshot (encoded lines) refreshed at "
             f"{seat_map_timestamp}:\n{seat_map_encoded}\n\n"
@@ -145,6 +272,19 @@ class AiAssistantService:
         clean_text = self._strip_highlight_line(response_text)
         return clean_text, highlights
 
+    @staticmethod
+    def _group_prompt(group_options: Optional[List[Dict]]) -> str:
+        if not group_options:
+            return ""
+        group_json = json.dumps(group_options, ensure_ascii=False, separators=(",", ":"))
+        return (
+            "Group and nearby seating options (adjacent available seats, best first; "
+            "same_table=true means everyone sits at one table; near_seat lists the closest free seats to that seat):\n"
+            f"{group_json}\n"
+            "When the user asks for several seats or seats near a given seat, recommend from these options "
+            "rather than picking seats yourself.\n\n"
+        )
+
     def _parse_highlight_ids(self, text: str, seat_details: List[Dict]) -> List[str]:
         seat_id_map = {str(detail["seat_id"]): detail["seat_id"] for detail in seat_details}
         seat_number_map = {
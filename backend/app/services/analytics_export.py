@@ -0,0 +1,167 @@
+"""Streaming exports of occupancy history and reservations for the admin dashboard."""
+
+from __future__ import annotations
+
+import csv
+import enum
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.database import ReadSessionLocal
+from app.models.occupancy_history import OccupancyHistory
+from app.models.reservation import Reservation, ReservationStatus
+
+
+# Rows fetched per round trip; the database cursor streams, so memory stays
+# bounded by one chunk whatever the export window.
+EXPORT_CHUNK_SIZE = 5000
+
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def occupancy_export_query(start: datetime) -> Select:
+    return (
+        select(
+            OccupancyHistory.timestamp,
+            OccupancyHistory.location_id,
+            OccupancyHistory.floor_id,
+            OccupancyHistory.occupancy_count,
+            OccupancyHistory.total_capacity,
+            OccupancyHistory.occupancy_percentage.label("occupancy_percentage"),
+        )
+        .where(OccupancyHistory.timestamp >= start)
+        .order_by(OccupancyHistory.timestamp)
+    )
+
+
+def reservation_export_query(start: datetime) -> Select:
+    return (
+        select(
+            Reservation.id,
+            Reservation.user_id,
+            Reservation.seat_id,
+            Reservation.status,
+            Reservation.start_time,
+            Reservation.end_time,
+            Reservation.check_in_time,
+            Reservation.created_at,
+        )
+        .where(Reservation.created_at >= start)
+        .order_by(Reservation.created_at)
+    )
+
+
+EXPORT_QUERIES = {"occupancy": occupancy_export_query, "reservations": reservation_export_query}
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def iter_row_chunks(db: Session, statement: Select) -> Iterator[List[Dict]]:
+    """Yield the statement's rows as lists of plain dicts, EXPORT_CHUNK_SIZE at a time."""
+    result = db.execute(statement.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+    for partition in result.partitions():
+        yield [{key: _export_value(value) for key, value in row._mapping.items()} for row in partition]
+
+
+def reservation_status_counts(db: Session, start: datetime) -> Dict[str, int]:
+    """Reservations created since `start`, per status, from one GROUP BY."""
+    counts = dict(
+        db.query(Reservation.status, func.count())
+        .filter(Reservation.created_at >= start)
+        .group_by(Reservation.status)
+        .all()
+    )
+    summary = {"total": sum(counts.values())}
+    summary.update({status.value: counts.get(status, 0) for status in ReservationStatus})
+    return summary
+
+
+def iter_csv(chunks: Iterable[List[Dict]], fields: List[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+    for chunk in chunks:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_ndjson(chunks: Iterable[List[Dict]]) -> Iterator[str]:
+    for chunk in chunks:
+        yield "".join(json.dumps(row) + "\n" for row in chunk)
+
+
+def iter_json_report(db: Session, start: datetime, days: int) -> Iterator[str]:
+    """
+    The full JSON report (metadata, occupancy rows, reservation summary),
+    written incrementally instead of being built as one dict.
+    """
+    summary = reservation_status_counts(db, start)
+    occupancy_records = db.scalar(
+        select(func.count()).select_from(OccupancyHistory).where(OccupancyHistory.timestamp >= start)
+    )
+    header = {
+        "report_generated_at": datetime.utcnow().isoformat(),
+        "period_days": days,
+        "start_date": start.isoformat(),
+        "end_date": datetime.utcnow().isoformat(),
+        "occupancy_records": occupancy_records,
+        "total_reservations": summary["total"],
+    }
+    yield json.dumps(header)[:-1] + ', "occupancy_data": ['
+    separator = ""
+    for chunk in iter_row_chunks(db, occupancy_export_query(start)):
+        yield separator + ", ".join(json.dumps(row) for row in chunk)
+        separator = ", "
+    yield '], "reservation_summary": ' + json.dumps(summary) + "}"
+
+
+def iter_report(format: str, dataset: str, start: datetime, days: int) -> Iterator[str]:
+    """
+    Stream a report in `format`. CSV and NDJSON export the rows of one
+    `dataset`; JSON is the full report. Uses its own session so the stream
+    does not depend on the request scope.
+    """
+    db = ReadSessionLocal()
+    try:
+        if format == "json":
+            yield from iter_json_report(db, start, days)
+            return
+        statement = EXPORT_QUERIES[dataset](start)
+        chunks = iter_row_chunks(db, statement)
+        if format == "csv":
+            yield from iter_csv(chunks, [column.name for column in statement.selected_columns])
+        else:
+            yield from iter_ndjson(chunks)
+    finally:
+        db.close()
+
+
+def gzip_stream(chunks: Iterable[str], level: int = 6) -> Iterator[bytes]:
+    """Gzip a text stream chunk by chunk."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,176 @@
+"""
+Columnar (Parquet / Arrow IPC) exports of occupancy history and rollups.
+
+pyarrow is an optional dependency: it is imported on first use and
+`columnar_export_available()` tells the API whether to offer these formats.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from datetime import datetime
+from typing import Iterator, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.database import ReadSessionLocal
+from app.models.occupancy_history import OccupancyHistory
+from app.models.occupancy_rollup import OccupancyRollup
+
+
+# Rows per Parquet row group / Arrow record batch; also the fetch size, so
+# memory is bounded by one group whatever the export window.
+ROW_GROUP_SIZE = 100_000
+
+COLUMNAR_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def columnar_export_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _history_query(start: datetime) -> Select:
+    return (
+        select(
+            OccupancyHistory.timestamp,
+            OccupancyHistory.location_id,
+            OccupancyHistory.floor_id,
+            OccupancyHistory.occupancy_count,
+            OccupancyHistory.total_capacity,
+            OccupancyHistory.occupancy_percentage.label("occupancy_percentage"),
+        )
+        .where(OccupancyHistory.timestamp >= start)
+        .order_by(OccupancyHistory.timestamp)
+    )
+
+
+def _rollup_query(start: datetime) -> Select:
+    return (
+        select(
+            OccupancyRollup.granularity,
+            OccupancyRollup.bucket_start,
+            OccupancyRollup.location_id,
+            OccupancyRollup.floor_id,
+            OccupancyRollup.sample_count,
+            OccupancyRollup.occupancy_min,
+            OccupancyRollup.occupancy_max,
+            (OccupancyRollup.occupancy_sum * 1.0 / OccupancyRollup.sample_count).label("occupancy_avg"),
+            (OccupancyRollup.percentage_sum / OccupancyRollup.sample_count).label("occupancy_percentage_avg"),
+        )
+        .where(OccupancyRollup.bucket_start >= start)
+        .order_by(OccupancyRollup.granularity, OccupancyRollup.bucket_start)
+    )
+
+
+def _schema(dataset: str):
+    import pyarrow as pa
+
+    # Ids repeat on every row; dictionary encoding stores each one once per batch
+    ids = pa.dictionary(pa.int32(), pa.string())
+    if dataset == "history":
+        return pa.schema([
+            ("timestamp", pa.timestamp("us")),
+            ("location_id", ids),
+            ("floor_id", ids),
+            ("occupancy_count", pa.int32()),
+            ("total_capacity", pa.int32()),
+            ("occupancy_percentage", pa.float64()),
+        ])
+    return pa.schema([
+        ("granularity", ids),
+        ("bucket_start", pa.timestamp("us")),
+        ("location_id", ids),
+        ("floor_id", ids),
+        ("sample_count", pa.int32()),
+        ("occupancy_min", pa.int32()),
+        ("occupancy_max", pa.int32()),
+        ("occupancy_avg", pa.float64()),
+        ("occupancy_percentage_avg", pa.float64()),
+    ])
+
+
+EXPORT_QUERIES = {"history": _history_query, "rollups": _rollup_query}
+
+
+def iter_record_batches(db: Session, dataset: str, start: datetime) -> Iterator:
+    """Yield the dataset as Arrow record batches of up to ROW_GROUP_SIZE rows."""
+    import pyarrow as pa
+
+    schema = _schema(dataset)
+    result = db.execute(EXPORT_QUERIES[dataset](start).execution_options(yield_per=ROW_GROUP_SIZE))
+    for partition in result.partitions():
+        columns = list(zip(*partition))
+        arrays = []
+        for field, values in zip(schema, columns):
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, field.type))
+        yield pa.record_batch(arrays, schema=schema)
+
+
+class _StreamSink:
+    """Write-only file object that hands written bytes back to the response stream."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_columnar_export(format: str, dataset: str, start: datetime, compression: str = "zstd") -> Iterator[bytes]:
+    """
+    Stream `dataset` as Parquet (one row group per batch) or an Arrow IPC
+    stream. Bytes are yielded as each batch is written; Parquet's footer
+    follows the last row group. Uses its own session so the stream does not
+    depend on the request scope.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    codec = None if compression == "none" else compression
+    schema = _schema(dataset)
+    sink = _StreamSink()
+    if format == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression=codec or "none")
+    else:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression=codec))
+
+    db = ReadSessionLocal()
+    try:
+        for batch in iter_record_batches(db, dataset, start):
+            writer.write_batch(batch)
+            data = sink.drain()
+            if data:
+                yield data
+        writer.close()
+        yield sink.drain()
+    finally:
+        db.close()
+
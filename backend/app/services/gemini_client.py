@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import Optional
 
 import httpx
@@ -18,7 +20,14 @@ class GeminiClientError(RuntimeError):
 
 
 class GeminiClient:
-    """Minimal async client for Gemini-compatible custom nodes."""
+    """
+    Minimal async client for Gemini-compatible custom nodes.
+
+    One httpx.AsyncClient is kept per GeminiClient and reused across calls,
+    so connections stay pooled and the TLS context is loaded once. Call
+    open() at startup to build it off the event loop and aclose() at
+    shutdown.
+    """
 
     def __init__(
         self,
@@ -31,6 +40,7 @@ class GeminiClient:
         self._api_key = api_key or settings.GEMINI_API_KEY
         self._model = model or settings.GEMINI_MODEL
         self._timeout = timeout_seconds or settings.GEMINI_REQUEST_TIMEOUT_SECONDS
+        self._http: Optional[httpx.AsyncClient] = None
 
     @property
     def is_configured(self) -> bool:
@@ -40,6 +50,28 @@ class GeminiClient:
     def model(self) -> Optional[str]:
         return self._model
 
+    def _build_http_client(self) -> httpx.AsyncClient:
+        # Loading the TLS context reads the CA bundle from disk (~100 ms)
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self._timeout),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = self._build_http_client()
+        return self._http
+
+    async def open(self) -> None:
+        """Build the HTTP client in a thread, ahead of the first request."""
+        if self.is_configured and (self._http is None or self._http.is_closed):
+            self._http = await asyncio.to_thread(self._build_http_client)
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def generate_text(
         self,
         system_prompt: str,
@@ -75,18 +107,9 @@ class GeminiClient:
             "temperature": temperature,
         }
 
-        transport = httpx.AsyncHTTPTransport(retries=2)
-        timeout = httpx.Timeout(
-            self._timeout,
-            connect=self._timeout,
-            read=self._timeout,
-            write=self._timeout,
-            pool=self._timeout,
-        )
         try:
-            async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
-                logger.debug("Sending Gemini request to %s", self._endpoint_url)
-                response = await client.post(self._endpoint_url, headers=headers, json=payload)
+            logger.debug("Sending Gemini request to %s", self._endpoint_url)
+            response = await self._http_client().post(self._endpoint_url, headers=headers, json=payload)
         except httpx.HTTPError as exc:
             logger.exception("Gemini HTTP request failed")
             raise GeminiClientError(f"Gemini request failed: {exc}") from exc
@@ -141,3 +164,9 @@ class GeminiClient:
                         return text.strip()
 
         return None
+
+
+@lru_cache(maxsize=1)
+def get_gemini_client() -> GeminiClient:
+    """Process-wide Gemini client configured from settings."""
+    return GeminiClient()
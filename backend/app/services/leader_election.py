@@ -0,0 +1,174 @@
+"""Leader election between server processes (e.g. `uvicorn --workers N`)."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import socket
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from threading import Lock
+from typing import IO, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.database import engine
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# A bigint advisory key is stored as classid (high 32 bits), objid (low 32 bits), objsubid 1
+ADVISORY_LOCK_HELD = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory' AND classid = 0"
+    " AND objid::bigint = :key AND objsubid = 1 AND pid = pg_backend_pid() AND granted)"
+)
+
+def process_identity() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def lock_file_path(name: str) -> Path:
+    """Lock file shared by every process using the same database."""
+    database_key = hashlib.sha1(settings.DATABASE_URL.encode()).hexdigest()[:12]
+    lock_dir = Path(settings.WORKER_LOCK_DIR or tempfile.gettempdir())
+    return lock_dir / f"jcu-{name}-{database_key}.lock"
+
+
+class LeaderLock:
+    """
+    Inter-process lock held by at most one process at a time.
+
+    PostgreSQL uses a session advisory lock on a dedicated connection, so it
+    also works across hosts. Other databases (SQLite) use an OS file lock,
+    which covers the processes of a single host. Either way the lock is
+    released by the OS/server when the holder exits, so another process can
+    take over on its next attempt.
+
+    A holder checks the lock is still its own on every try_acquire: that the
+    advisory lock's connection is alive and still holds it, or that the lock
+    file was not deleted or replaced. If not, it steps down and competes for
+    the lock again like any other process.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock_path = lock_file_path(name)
+        self._guard = Lock()
+        self._file: Optional[IO] = None
+        self._connection: Optional[Connection] = None
+
+    @property
+    def is_held(self) -> bool:
+        return self._file is not None or self._connection is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock if it is free; return whether this process holds it."""
+        with self._guard:
+            if self.is_held:
+                if self._still_held():
+                    return True
+                self._step_down()
+            if engine.dialect.name == "postgresql":
+                return self._acquire_advisory_lock()
+            return self._acquire_file_lock()
+
+    def acquire(self, poll_seconds: float = 0.2) -> None:
+        """Block until this process holds the lock."""
+        while not self.try_acquire():
+            time.sleep(poll_seconds)
+
+    def release(self) -> None:
+        with self._guard:
+            if self._connection is not None:
+                try:
+                    self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._advisory_key})
+                except SQLAlchemyError:
+                    # The session is gone, and its lock with it
+                    self._connection.invalidate()
+                finally:
+                    self._connection.close()
+                    self._connection = None
+            if self._file is not None:
+                self._unlock_file(self._file)
+                self._file.close()
+                self._file = None
+
+    def _still_held(self) -> bool:
+        try:
+            if self._connection is not None:
+                held = self._connection.execute(ADVISORY_LOCK_HELD, {"key": self._advisory_key}).scalar()
+                self._connection.commit()
+                return bool(held)
+            return os.path.samestat(os.fstat(self._file.fileno()), os.stat(self._lock_path))
+        except (OSError, SQLAlchemyError):
+            return False
+
+    def _step_down(self) -> None:
+        """Drop a lock that is no longer ours, without trying to unlock it."""
+        logger.warning("Lost the %s leader lock; stepping down", self.name)
+        if self._connection is not None:
+            try:
+                # Discard the session rather than return it to the pool
+                self._connection.invalidate()
+                self._connection.close()
+            except SQLAlchemyError:
+                pass
+            self._connection = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def _advisory_key(self) -> int:
+        # Advisory lock keys are signed 64-bit integers
+        return zlib.crc32(f"jcu:{self.name}".encode())
+
+    def _acquire_advisory_lock(self) -> bool:
+        connection = engine.connect()
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": self._advisory_key}
+        ).scalar()
+        connection.commit()
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+        return bool(acquired)
+
+    def _acquire_file_lock(self) -> bool:
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self._lock_path, "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(process_identity())
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    @staticmethod
+    def _unlock_file(lock_file: IO) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,216 @@
+"""Event loop lag monitor and blocking-call detector.
+
+A task on the event loop sleeps for LOOP_LAG_SAMPLE_INTERVAL_MS and records
+how late it wakes up: the scheduling delay every coroutine sees at that
+moment. Percentiles over the last minute are exported on /metrics.
+
+A watchdog thread checks the task's heartbeat. When the loop has not run it
+for LOOP_LAG_THRESHOLD_MS, the loop is stuck in a synchronous call, and the
+watchdog captures the loop thread's stack and the task being run while the
+call is still in progress. Stalls are logged and the most recent ones are
+served by GET /api/admin/event-loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from app.config import settings
+from app.services.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Lag percentiles cover this much recent time
+LAG_WINDOW_SECONDS = 60
+# Innermost frames kept per captured stack
+STACK_DEPTH = 25
+QUANTILES = (0.5, 0.9, 0.99)
+
+loop_stalls = registry.counter(
+    "event_loop_stalls_total", "Event loop stalls longer than LOOP_LAG_THRESHOLD_MS.",
+)
+
+
+@dataclass
+class LoopStall:
+    """A stall caught by the watchdog, with the code that was blocking the loop."""
+
+    detected_at: datetime
+    # How long the loop had been blocked when the stack was taken
+    blocked_ms: float
+    task: Optional[str]
+    stack: List[str] = field(default_factory=list)
+    # Total delay, filled in once the loop runs the monitor again
+    lag_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["detected_at"] = self.detected_at.isoformat()
+        return data
+
+
+def _describe_task(task: Optional[asyncio.Task]) -> Optional[str]:
+    if task is None:
+        return None
+    coro = task.get_coro()
+    return f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+
+
+class LoopLagMonitor:
+    """Samples event loop scheduling delay and captures stacks of blocking calls (per process)."""
+
+    def __init__(self, interval_ms: int = 100, threshold_ms: int = 100, history_size: int = 50) -> None:
+        self._interval = interval_ms / 1000
+        self._threshold = threshold_ms / 1000
+        window = max(1, int(LAG_WINDOW_SECONDS / self._interval)) if self._interval > 0 else 1
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._stalls: Deque[LoopStall] = deque(maxlen=max(1, history_size))
+        self._lag_sum = 0.0
+        self._lag_count = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = 0.0
+        self._pending_stall: Optional[LoopStall] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    async def start(self) -> None:
+        if self._task is not None or self._interval <= 0:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog:
+            self._stopping.set()
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self._record(max(0.0, now - expected))
+
+    def _record(self, lag: float) -> None:
+        with self._lock:
+            self._samples.append(lag)
+            self._lag_sum += lag
+            self._lag_count += 1
+            stall, self._pending_stall = self._pending_stall, None
+        if stall is not None:
+            stall.lag_ms = round(lag * 1000, 3)
+        if lag >= self._threshold:
+            loop_stalls.inc()
+            if stall is None:
+                # Shorter than the watchdog's polling could catch
+                logger.warning("Event loop lagged %.0f ms", lag * 1000)
+
+    def _watch(self) -> None:
+        check_every = max(0.005, self._threshold / 4)
+        captured_heartbeat = None
+        while not self._stopping.wait(check_every):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self._interval
+            if blocked >= self._threshold and heartbeat != captured_heartbeat:
+                captured_heartbeat = heartbeat
+                self._capture(blocked)
+
+    def _capture(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.format_stack(frame)[-STACK_DEPTH:]
+        stall = LoopStall(
+            detected_at=datetime.utcnow(),
+            blocked_ms=round(blocked * 1000, 3),
+            task=_describe_task(asyncio.current_task(self._loop)),
+            stack=[line.rstrip() for line in stack],
+        )
+        with self._lock:
+            self._stalls.append(stall)
+            self._pending_stall = stall
+        logger.warning(
+            "Event loop blocked for %.0f ms in %s:\n%s",
+            blocked * 1000, stall.task or "a callback", "".join(stack[-8:]).rstrip(),
+        )
+
+    def lag_quantiles(self) -> Dict[str, float]:
+        """Lag percentiles (ms) over the window, plus its max."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {}
+        result = {
+            f"p{int(quantile * 100)}": round(samples[min(len(samples) - 1, int(len(samples) * quantile))] * 1000, 3)
+            for quantile in QUANTILES
+        }
+        result["mean"] = round(statistics.fmean(samples) * 1000, 3)
+        result["max"] = round(samples[-1] * 1000, 3)
+        return result
+
+    def get_stats(self, limit: Optional[int] = None) -> Dict:
+        with self._lock:
+            stalls = list(self._stalls)
+            samples = len(self._samples)
+        stalls.reverse()
+        return {
+            "running": self._task is not None,
+            "sample_interval_ms": self._interval * 1000,
+            "threshold_ms": self._threshold * 1000,
+            "window_samples": samples,
+            "lag_ms": self.lag_quantiles(),
+            "stalls_total": int(loop_stalls.value()),
+            "stalls": [stall.to_dict() for stall in stalls[:limit]],
+        }
+
+    def metric_lines(self) -> List[str]:
+        """event_loop_lag_seconds as a Prometheus summary over the window."""
+        with self._lock:
+            samples = sorted(self._samples)
+            lag_sum, lag_count = self._lag_sum, self._lag_count
+        lines = [
+            f"# HELP event_loop_lag_seconds Event loop scheduling delay (quantiles over the last {LAG_WINDOW_SECONDS}s).",
+            "# TYPE event_loop_lag_seconds summary",
+        ]
+        if samples:
+            for quantile in QUANTILES + (1.0,):
+                value = samples[min(len(samples) - 1, int(len(samples) * quantile))]
+                lines.append(f'event_loop_lag_seconds{{quantile="{quantile}"}} {value:.6f}')
+        lines.append(f"event_loop_lag_seconds_sum {lag_sum:.6f}")
+        lines.append(f"event_loop_lag_seconds_count {lag_count}")
+        return lines
+
+
+loop_lag_monitor = LoopLagMonitor(
+    interval_ms=settings.LOOP_LAG_SAMPLE_INTERVAL_MS,
+    threshold_ms=settings.LOOP_LAG_THRESHOLD_MS,
+    history_size=settings.LOOP_STALL_HISTORY,
+)
+registry.add_collector(loop_lag_monitor.metric_lines)
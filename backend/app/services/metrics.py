@@ -0,0 +1,316 @@
+"""In-process request and database metrics in the Prometheus text format.
+
+MetricsMiddleware records every HTTP request: latency, response size and
+status per route template, requests in flight, and how many SQL statements
+the request ran and how long they took. Statements are counted by
+SQLAlchemy cursor events on every engine (see install_query_hooks); those
+run outside a request, e.g. in background workers, are counted separately.
+`registry.render()` produces the /metrics payload.
+
+Values live in the process: with `uvicorn --workers N` each scrape sees
+the worker that answered it.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Starlette appends "; charset=utf-8" to text/* media types itself
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+# Route label for requests that matched no route, so stray paths add no series
+UNMATCHED_ROUTE = "<unmatched>"
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Iterable[object]) -> str:
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str], lock: Lock) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = lock
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str], lock: Lock, buckets: Sequence[float]) -> None:
+        super().__init__(name, documentation, labels, lock)
+        self.buckets = tuple(buckets)
+        # Per label set: a count per bucket (not cumulative), then sum and count
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, labels: LabelValues = ()) -> int:
+        series = self._series.get(labels)
+        return int(series[-1]) if series else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        label_names = self.labels + ("le",)
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(label_names, labels + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(label_names, labels + ('+Inf',))} {int(series[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {int(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics of this process, plus collectors that render extra lines at scrape time."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels, self._lock))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels, self._lock))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, self._lock, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """`collector` returns complete exposition lines (HELP/TYPE included) on every scrape."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for metric in self._metrics.values():
+                lines.extend(metric.header())
+                lines.extend(metric.samples())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status code.", ("method", "route", "status"),
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ("method", "route"),
+)
+http_response_size = registry.histogram(
+    "http_response_size_bytes", "HTTP response body size.", ("method", "route"), SIZE_BUCKETS,
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests being served.",
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries", "SQL statements run per HTTP request.", ("method", "route"), QUERY_COUNT_BUCKETS,
+)
+http_request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL statements per HTTP request.", ("method", "route"),
+)
+db_queries = registry.counter(
+    "db_queries_total", "SQL statements, inside HTTP requests or in the background.", ("context",),
+)
+db_query_duration = registry.counter(
+    "db_query_duration_seconds_total", "Time spent in SQL statements.", ("context",),
+)
+
+
+# Database statements
+
+
+class RequestQueryStats:
+    """Statements run on behalf of the current request (shared with its threadpool calls)."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# The middleware sets a fresh object per request. Threadpool calls run in a
+# copy of the request's context, so they update the same object.
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_metrics_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats = _request_stats.get()
+    if stats is not None:
+        # Folded into db_queries_total once, when the request ends
+        stats.queries += 1
+        stats.seconds += elapsed
+    else:
+        db_queries.inc(("background",))
+        db_query_duration.inc(("background",), elapsed)
+
+
+def install_query_hooks(target=Engine) -> None:
+    """Time statements on `target`: the Engine class (every engine, async ones included) or one engine."""
+    if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+# HTTP middleware
+
+
+_route_templates: Dict[object, str] = {}
+
+
+def route_template(scope: Dict) -> str:
+    """Path template of the route that served the request, e.g. /api/seats/{seat_id}."""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+    template = _route_templates.get(endpoint)
+    if template is None:
+        for route in scope["app"].routes:
+            if getattr(route, "endpoint", None) is endpoint:
+                template = route.path_format
+                break
+            if getattr(route, "app", None) is endpoint:  # Mount
+                template = route.path_format + "/{path}"
+                break
+        else:
+            template = UNMATCHED_ROUTE
+        _route_templates[endpoint] = template
+    return template
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, size, status and SQL statements per route."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_and_measure(message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        stats = RequestQueryStats()
+        token = _request_stats.set(stats)
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            _request_stats.reset(token)
+            method, route = scope["method"], route_template(scope)
+            labels = (method, route)
+            http_requests.inc((method, route, str(status)))
+            http_request_duration.observe(elapsed, labels)
+            http_response_size.observe(size, labels)
+            http_request_db_queries.observe(stats.queries, labels)
+            http_request_db_duration.observe(stats.seconds, labels)
+            if stats.queries:
+                db_queries.inc(("request",), stats.queries)
+                db_query_duration.inc(("request",), stats.seconds)
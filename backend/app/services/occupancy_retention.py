@@ -0,0 +1,74 @@
+"""Background task that applies the occupancy history retention policy.
+
+A failed prune is logged and retried on the next interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.leader_election import LeaderLock
+from app.services.occupancy_rollups import prune_occupancy_history
+
+logger = logging.getLogger(__name__)
+
+
+class OccupancyRetentionWorker:
+    """Periodically prunes raw history and hourly rollups past their retention (leader only)."""
+
+    def __init__(self, interval_seconds: int = 3600, leader_lock: Optional[LeaderLock] = None) -> None:
+        self._interval = interval_seconds
+        self._leader_lock = leader_lock or LeaderLock("occupancy-retention")
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None and self._interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self._leader_lock.release)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    await asyncio.to_thread(self._prune)
+                except Exception:
+                    logger.exception("Occupancy retention prune failed")
+                await asyncio.sleep(self._interval)
+        finally:
+            # Release the lock if this task dies, so another process can take over
+            await asyncio.to_thread(self._leader_lock.release)
+
+    def _prune(self) -> None:
+        if not self._leader_lock.try_acquire():
+            return
+        db = SessionLocal()
+        try:
+            pruned = prune_occupancy_history(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if any(pruned.values()):
+            print(
+                f"🧹 Pruned {pruned['history']} occupancy history rows "
+                f"and {pruned['hourly_rollups']} hourly rollups"
+            )
+
+
+occupancy_retention_worker = OccupancyRetentionWorker(
+    interval_seconds=settings.OCCUPANCY_RETENTION_INTERVAL_SECONDS,
+)
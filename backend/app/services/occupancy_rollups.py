@@ -0,0 +1,280 @@
+"""
+Occupancy trend aggregation: hourly and daily rollups maintained as history
+rows are written, and SQL-side aggregation over the raw history.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.occupancy_history import OccupancyHistory
+from app.models.occupancy_rollup import OccupancyRollup
+
+
+GRANULARITIES = ("hour", "day")
+BUCKET_LABEL_FORMATS = {"hour": "%Y-%m-%d %H:00", "day": "%Y-%m-%d"}
+POSTGRES_LABEL_FORMATS = {"hour": "YYYY-MM-DD HH24:00", "day": "YYYY-MM-DD"}
+# SQLite stores DateTime columns as text in this layout
+SQLITE_BUCKET_START_FORMATS = {"hour": "%Y-%m-%d %H:00:00.000000", "day": "%Y-%m-%d 00:00:00.000000"}
+
+RollupKey = Tuple[str, datetime, str, Optional[str]]
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown rollup granularity {granularity!r}; expected one of {GRANULARITIES}")
+
+
+def bucket_label_expression(column, granularity: str, dialect_name: str):
+    """SQL expression for the bucket label of a timestamp column (see BUCKET_LABEL_FORMATS)."""
+    if dialect_name == "sqlite":
+        return func.strftime(BUCKET_LABEL_FORMATS[granularity], column)
+    return func.to_char(func.date_trunc(granularity, column), POSTGRES_LABEL_FORMATS[granularity])
+
+
+def bucket_start_expression(column, granularity: str, dialect_name: str):
+    """SQL expression truncating a timestamp column to the start of its bucket."""
+    if dialect_name == "sqlite":
+        return func.strftime(SQLITE_BUCKET_START_FORMATS[granularity], column)
+    return func.date_trunc(granularity, column)
+
+
+def _percentage(occupancy_count: int, total_capacity: int) -> float:
+    return occupancy_count / total_capacity * 100 if total_capacity else 0.0
+
+
+def record_occupancy_rollups(db: Session, samples: Iterable) -> None:
+    """
+    Fold new history rows (OccupancyHistory objects or OccupancySample
+    tuples) into their hourly and daily rollups.
+    Runs in the caller's transaction, so rollups commit together with the rows.
+    """
+    samples = list(samples)
+    if not samples:
+        return
+
+    # Rollups created earlier in this transaction must be visible to the lookup
+    db.flush()
+    timestamps = [sample.timestamp for sample in samples]
+    existing = db.query(OccupancyRollup).filter(
+        OccupancyRollup.bucket_start.between(bucket_start(min(timestamps), "day"), max(timestamps)),
+        OccupancyRollup.location_id.in_({sample.location_id for sample in samples}),
+    )
+    rollups: Dict[RollupKey, OccupancyRollup] = {
+        (rollup.granularity, rollup.bucket_start, rollup.location_id, rollup.floor_id): rollup
+        for rollup in existing
+    }
+
+    for sample in samples:
+        count = sample.occupancy_count
+        percentage = _percentage(count, sample.total_capacity)
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(sample.timestamp, granularity), sample.location_id, sample.floor_id)
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = OccupancyRollup(
+                    granularity=granularity,
+                    bucket_start=key[1],
+                    location_id=sample.location_id,
+                    floor_id=sample.floor_id,
+                    sample_count=0,
+                    occupancy_sum=0,
+                    occupancy_min=count,
+                    occupancy_max=count,
+                    percentage_sum=0.0,
+                )
+                db.add(rollup)
+                rollups[key] = rollup
+            rollup.sample_count += 1
+            rollup.occupancy_sum += count
+            rollup.occupancy_min = min(rollup.occupancy_min, count)
+            rollup.occupancy_max = max(rollup.occupancy_max, count)
+            rollup.percentage_sum += percentage
+
+
+def get_occupancy_trends(
+    db: Session,
+    granularity: str,
+    start: datetime,
+    location_id: Optional[str] = None,
+    floor_id: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Occupancy trend per bucket from the rollup of the requested granularity.
+    Buckets that overlap `start` are included whole. Without `floor_id` only
+    whole-location rows are aggregated.
+    """
+    label_format = BUCKET_LABEL_FORMATS[granularity]
+    samples = func.sum(OccupancyRollup.sample_count)
+    query = (
+        select(
+            OccupancyRollup.bucket_start,
+            samples.label("samples"),
+            (func.sum(OccupancyRollup.percentage_sum) / samples).label("average_percentage"),
+            (func.sum(OccupancyRollup.occupancy_sum) * 1.0 / samples).label("average_count"),
+            func.min(OccupancyRollup.occupancy_min).label("min_count"),
+            func.max(OccupancyRollup.occupancy_max).label("max_count"),
+        )
+        .where(
+            OccupancyRollup.granularity == granularity,
+            OccupancyRollup.bucket_start >= bucket_start(start, granularity),
+        )
+        .group_by(OccupancyRollup.bucket_start)
+        .order_by(OccupancyRollup.bucket_start)
+    )
+    if location_id:
+        query = query.where(OccupancyRollup.location_id == location_id)
+    if floor_id:
+        query = query.where(OccupancyRollup.floor_id == floor_id)
+    else:
+        # Floor rows add up to their location's row; count only the latter
+        query = query.where(OccupancyRollup.floor_id.is_(None))
+
+    return [
+        {
+            "timestamp": row.bucket_start.strftime(label_format),
+            "average_occupancy_percentage": round(row.average_percentage, 2),
+            "average_occupancy_count": round(row.average_count, 2),
+            "min_occupancy_count": row.min_count,
+            "max_occupancy_count": row.max_count,
+            "samples": row.samples,
+        }
+        for row in db.execute(query)
+    ]
+
+
+def get_history_trends(
+    db: Session,
+    granularity: str,
+    start: datetime,
+    location_id: Optional[str] = None,
+    floor_id: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Same trend as get_occupancy_trends, aggregated in SQL from the raw history
+    rows. Exact window boundaries, but cost grows with the number of rows and
+    it only covers the raw retention period.
+    """
+    bucket = bucket_label_expression(OccupancyHistory.timestamp, granularity, db.get_bind().dialect.name)
+    query = (
+        select(
+            bucket.label("bucket"),
+            func.count().label("samples"),
+            func.avg(OccupancyHistory.occupancy_percentage).label("average_percentage"),
+            func.avg(OccupancyHistory.occupancy_count * 1.0).label("average_count"),
+            func.min(OccupancyHistory.occupancy_count).label("min_count"),
+            func.max(OccupancyHistory.occupancy_count).label("max_count"),
+        )
+        .where(OccupancyHistory.timestamp >= start)
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    if location_id:
+        query = query.where(OccupancyHistory.location_id == location_id)
+    if floor_id:
+        query = query.where(OccupancyHistory.floor_id == floor_id)
+    else:
+        # Floor rows add up to their location's row; count only the latter
+        query = query.where(OccupancyHistory.floor_id.is_(None))
+
+    return [
+        {
+            "timestamp": row.bucket,
+            "average_occupancy_percentage": round(row.average_percentage, 2),
+            "average_occupancy_count": round(row.average_count, 2),
+            "min_occupancy_count": row.min_count,
+            "max_occupancy_count": row.max_count,
+            "samples": row.samples,
+        }
+        for row in db.execute(query)
+    ]
+
+
+def rebuild_occupancy_rollups(db: Session) -> None:
+    """
+    Recompute every rollup from the raw history with one GROUP BY per
+    granularity (after bulk imports that bypassed record_occupancy_rollups).
+    Buckets older than the oldest raw row are kept as they are.
+    """
+    dialect_name = db.get_bind().dialect.name
+    oldest_raw = db.scalar(select(func.min(OccupancyHistory.timestamp)))
+    if oldest_raw is None:
+        return
+    columns = [
+        "granularity", "bucket_start", "location_id", "floor_id", "sample_count",
+        "occupancy_sum", "occupancy_min", "occupancy_max", "percentage_sum",
+    ]
+    for granularity in GRANULARITIES:
+        db.execute(
+            delete(OccupancyRollup).where(
+                OccupancyRollup.granularity == granularity,
+                OccupancyRollup.bucket_start >= bucket_start(oldest_raw, granularity),
+            )
+        )
+        bucket = bucket_start_expression(OccupancyHistory.timestamp, granularity, dialect_name)
+        percentage = case(
+            (
+                OccupancyHistory.total_capacity > 0,
+                OccupancyHistory.occupancy_count * 100.0 / OccupancyHistory.total_capacity,
+            ),
+            else_=0.0,
+        )
+        aggregates = select(
+            literal(granularity),
+            bucket,
+            OccupancyHistory.location_id,
+            OccupancyHistory.floor_id,
+            func.count(),
+            func.sum(OccupancyHistory.occupancy_count),
+            func.min(OccupancyHistory.occupancy_count),
+            func.max(OccupancyHistory.occupancy_count),
+            func.sum(percentage),
+        ).group_by(bucket, OccupancyHistory.location_id, OccupancyHistory.floor_id)
+        db.execute(insert(OccupancyRollup).from_select(columns, aggregates))
+    db.commit()
+
+
+def _delete_in_batches(db: Session, model, id_column, condition, batch_size: int) -> int:
+    """Delete matching rows in short transactions so writers are not blocked for long."""
+    deleted = 0
+    while True:
+        batch = select(id_column).where(condition).limit(batch_size)
+        result = db.execute(delete(model).where(id_column.in_(batch)).execution_options(synchronize_session=False))
+        db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+def prune_occupancy_history(db: Session, now: Optional[datetime] = None, batch_size: int = 5000) -> Dict[str, int]:
+    """
+    Apply the retention policy: drop raw history older than
+    OCCUPANCY_RAW_RETENTION_DAYS and hourly rollups older than
+    OCCUPANCY_HOURLY_ROLLUP_RETENTION_DAYS (0 keeps them forever). Daily
+    rollups are kept, so long-range trends survive the raw rows.
+    """
+    now = now or datetime.utcnow()
+    pruned = {"history": 0, "hourly_rollups": 0}
+    if settings.OCCUPANCY_RAW_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=settings.OCCUPANCY_RAW_RETENTION_DAYS)
+        pruned["history"] = _delete_in_batches(
+            db, OccupancyHistory, OccupancyHistory.id, OccupancyHistory.timestamp < cutoff, batch_size
+        )
+    if settings.OCCUPANCY_HOURLY_ROLLUP_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=settings.OCCUPANCY_HOURLY_ROLLUP_RETENTION_DAYS)
+        pruned["hourly_rollups"] = _delete_in_batches(
+            db,
+            OccupancyRollup,
+            OccupancyRollup.id,
+            (OccupancyRollup.granularity == "hour") & (OccupancyRollup.bucket_start < cutoff),
+            batch_size,
+        )
+    return pruned
@@ -0,0 +1,125 @@
+"""Background task that records occupancy history at a fixed cadence.
+
+A sample that fails (e.g. SQLite reporting "database is locked" while
+request writers hold the lock) is logged and rolled back; the next one runs
+on schedule.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.floor import Floor
+from app.models.location import Location
+from app.models.occupancy_history import OccupancyHistory
+from app.services.leader_election import LeaderLock
+from app.services.occupancy_rollups import record_occupancy_rollups
+
+logger = logging.getLogger(__name__)
+
+
+class OccupancySample(NamedTuple):
+    """One occupancy_history row; floor_id is None for a whole-location sample."""
+
+    id: str
+    location_id: str
+    floor_id: Optional[str]
+    timestamp: datetime
+    occupancy_count: int
+    total_capacity: int
+    day_of_week: int
+    hour_of_day: int
+    recorded_at: datetime
+
+
+def collect_occupancy_samples(db: Session, timestamp: datetime) -> List[OccupancySample]:
+    """
+    One sample per floor and per location, read from the occupied-seat
+    counters kept on floors and locations (two narrow queries, no seat scan).
+    """
+    day_of_week, hour_of_day = timestamp.weekday(), timestamp.hour
+
+    def sample(location_id: str, floor_id: Optional[str], count: int, capacity: int) -> OccupancySample:
+        return OccupancySample(
+            str(uuid.uuid4()), location_id, floor_id, timestamp,
+            count, capacity, day_of_week, hour_of_day, timestamp,
+        )
+
+    floors = db.execute(select(Floor.id, Floor.location_id, Floor.occupied_seats, Floor.total_seats))
+    locations = db.execute(select(Location.id, Location.current_occupancy, Location.total_capacity))
+    samples = [sample(row.location_id, row.id, row.occupied_seats, row.total_seats) for row in floors]
+    samples.extend(sample(row.id, None, row.current_occupancy, row.total_capacity) for row in locations)
+    return samples
+
+
+def record_occupancy_samples(db: Session, samples: List[OccupancySample]) -> None:
+    """Insert the samples with one executemany and fold them into the rollups, in one transaction."""
+    if not samples:
+        return
+    db.execute(OccupancyHistory.__table__.insert(), [sample._asdict() for sample in samples])
+    record_occupancy_rollups(db, samples)
+    db.commit()
+
+
+class OccupancySampler:
+    """Samples per-floor and per-location occupancy into the history table (leader only)."""
+
+    def __init__(self, interval_seconds: int = 300, leader_lock: Optional[LeaderLock] = None) -> None:
+        self._interval = interval_seconds
+        self._leader_lock = leader_lock or LeaderLock("occupancy-sampler")
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None and self._interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self._leader_lock.release)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                # Wake on multiples of the interval so samples line up across restarts
+                await asyncio.sleep(self._interval - time.time() % self._interval)
+                try:
+                    await asyncio.to_thread(self._sample)
+                except Exception:
+                    logger.exception("Occupancy sample failed")
+        finally:
+            # Release the lock if this task dies, so another process can take over
+            await asyncio.to_thread(self._leader_lock.release)
+
+    def _sample(self) -> None:
+        if not self._leader_lock.try_acquire():
+            return
+        timestamp = datetime.utcnow().replace(microsecond=0)
+        db = SessionLocal()
+        try:
+            record_occupancy_samples(db, collect_occupancy_samples(db, timestamp))
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+occupancy_sampler = OccupancySampler(
+    interval_seconds=settings.OCCUPANCY_SAMPLE_INTERVAL_SECONDS,
+)
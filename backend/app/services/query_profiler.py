@@ -0,0 +1,225 @@
+"""Opt-in per-request SQL profiler with N+1 detection and a slow-request log.
+
+With QUERY_PROFILING_ENABLED, QueryProfilerMiddleware records every SQL
+statement a request runs: its text, duration and the line under app/ that
+issued it. A statement run N_PLUS_ONE_THRESHOLD or more times in one
+request with the same text (only the bound parameters differ) is flagged as
+an N+1 candidate, typically a lazy load or a per-item lookup in a loop.
+Requests slower than SLOW_REQUEST_THRESHOLD_MS are logged with their query
+breakdown and the last SLOW_REQUEST_LOG_SIZE of them are kept for
+GET /api/admin/profiling/slow-requests.
+
+Finding the call site walks the Python stack for every statement, so this
+is a diagnostic mode rather than something to leave on under load.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from types import FrameType
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.services.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+APP_DIR = os.path.join(BACKEND_DIR, "app") + os.sep
+
+# Slow-request log lines list the statements with the most total time first
+LOGGED_STATEMENTS = 10
+
+
+class QueryRecord(NamedTuple):
+    statement: str
+    duration_ms: float
+    call_site: Optional[str]
+
+
+@dataclass
+class RequestProfile:
+    method: str
+    path: str
+    started_at: datetime
+    route: str = ""
+    status: int = 500
+    duration_ms: float = 0.0
+    queries: List[QueryRecord] = field(default_factory=list)
+
+    @property
+    def query_ms(self) -> float:
+        return sum(query.duration_ms for query in self.queries)
+
+    def statement_groups(self) -> List[Dict]:
+        """Statements grouped by text, most total time first."""
+        groups: Dict[str, Dict] = {}
+        for query in self.queries:
+            group = groups.get(query.statement)
+            if group is None:
+                group = groups[query.statement] = {
+                    "statement": " ".join(query.statement.split()),
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "call_sites": [],
+                }
+            group["count"] += 1
+            group["total_ms"] += query.duration_ms
+            if query.call_site and query.call_site not in group["call_sites"]:
+                group["call_sites"].append(query.call_site)
+        for group in groups.values():
+            group["total_ms"] = round(group["total_ms"], 3)
+        return sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+    def to_dict(self, n_plus_one_threshold: int) -> Dict:
+        groups = self.statement_groups()
+        return {
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "query_count": len(self.queries),
+            "query_ms": round(self.query_ms, 3),
+            "n_plus_one": [group for group in groups if group["count"] >= n_plus_one_threshold],
+            "statements": groups,
+        }
+
+
+class SlowRequestLog:
+    """The most recent slow request profiles, newest first."""
+
+    def __init__(self, size: int) -> None:
+        self._profiles: Deque[RequestProfile] = deque(maxlen=max(1, size))
+        self._lock = Lock()
+
+    def record(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.appendleft(profile)
+
+    def recent(self, limit: Optional[int] = None) -> List[RequestProfile]:
+        with self._lock:
+            return list(self._profiles)[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+slow_requests = SlowRequestLog(settings.SLOW_REQUEST_LOG_SIZE)
+
+# Set per request by the middleware; threadpool calls and async sessions see the same profile
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+# Statement hooks
+
+
+def _first_app_frame(frame: Optional[FrameType]) -> Optional[str]:
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIR) and filename != __file__:
+            return f"{os.path.relpath(filename, BACKEND_DIR)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _call_site() -> Optional[str]:
+    site = _first_app_frame(sys._getframe(2))
+    if site is None:
+        # Async sessions run statements in a greenlet; the awaiting code is on its parent's stack
+        parent = getcurrent().parent
+        if parent is not None:
+            site = _first_app_frame(parent.gr_frame)
+    return site
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current_profile.get() is not None:
+        context._profiler_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_profiler_started", None)
+    profile = _current_profile.get()
+    if started is None or profile is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    profile.queries.append(QueryRecord(statement, duration_ms, _call_site()))
+
+
+def install_query_hooks(target=Engine) -> None:
+    """Record statements run on `target` (the Engine class covers every engine) while a request is profiled."""
+    if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+# HTTP middleware
+
+
+def _report(profile: RequestProfile) -> None:
+    threshold = settings.N_PLUS_ONE_THRESHOLD
+    groups = profile.statement_groups()
+    suspects = [group for group in groups if group["count"] >= threshold]
+    for group in suspects:
+        logger.warning(
+            "N+1 candidate in %s %s: %d x %s (%.1f ms) from %s",
+            profile.method, profile.route, group["count"], group["statement"][:200],
+            group["total_ms"], ", ".join(group["call_sites"]) or "unknown",
+        )
+    if profile.duration_ms < settings.SLOW_REQUEST_THRESHOLD_MS:
+        return
+    slow_requests.record(profile)
+    breakdown = "\n".join(
+        f"  {group['count']:>5} x {group['total_ms']:>9.1f} ms  {group['statement'][:160]}"
+        for group in groups[:LOGGED_STATEMENTS]
+    )
+    logger.warning(
+        "Slow request %s %s: %d in %.1f ms, %d statements in %.1f ms\n%s",
+        profile.method, profile.path, profile.status, profile.duration_ms,
+        len(profile.queries), profile.query_ms, breakdown,
+    )
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware that profiles the SQL of every request (see module docstring)."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"], datetime.utcnow())
+
+        async def send_and_capture_status(message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+            await send(message)
+
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_capture_status)
+        finally:
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            _current_profile.reset(token)
+            profile.route = route_template(scope)
+            _report(profile)
@@ -0,0 +1,62 @@
+"""Keeps the in-memory seat indexes in step with seat changes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.seat import Seat, SeatStatus
+from app.services.seat_spatial_index import seat_spatial_index
+from app.services.suggestion_index import seat_suggestion_index
+
+
+_INDEXES = (seat_suggestion_index, seat_spatial_index)
+
+
+def rebuild_seat_indexes(seats: Iterable[Seat]) -> None:
+    """Rebuild every index from a full list of seats."""
+    seats = list(seats)
+    for index in _INDEXES:
+        index.rebuild(seats)
+
+
+def refresh_seat_indexes(db: Session) -> None:
+    """Rebuild every index from the current database contents."""
+    rebuild_seat_indexes(db.query(Seat).options(joinedload(Seat.floor)).all())
+
+
+def ensure_seat_indexes(db: Session) -> None:
+    """Rebuild from the database if any index is missing or stale."""
+    if all(index.is_ready for index in _INDEXES):
+        return
+    refresh_seat_indexes(db)
+
+
+async def refresh_seat_indexes_async(db: AsyncSession) -> None:
+    """Async-session variant of refresh_seat_indexes; the rebuild runs off the event loop."""
+    seats = (await db.scalars(select(Seat).options(joinedload(Seat.floor)))).all()
+    await asyncio.to_thread(rebuild_seat_indexes, seats)
+
+
+async def ensure_seat_indexes_async(db: AsyncSession) -> None:
+    if all(index.is_ready for index in _INDEXES):
+        return
+    await refresh_seat_indexes_async(db)
+
+
+def update_seat_statuses(changes: Mapping[str, SeatStatus]) -> None:
+    """Apply committed seat status changes to every index."""
+    if not changes:
+        return
+    for index in _INDEXES:
+        index.update_statuses(changes)
+
+
+def invalidate_seat_indexes() -> None:
+    """Force a rebuild after layout edits (seats added, removed or moved)."""
+    for index in _INDEXES:
+        index.invalidate()
@@ -0,0 +1,153 @@
+"""Compact seat-map encoding used to keep LLM prompts small."""
+
+from __future__ import annotations
+
+import re
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+STATUS_CODES = {
+    "available": "A",
+    "occupied": "O",
+    "reserved": "R",
+    "maintenance": "M",
+    "blocked": "B",
+}
+
+FEATURE_CODES = (
+    ("has_power_outlet", "p"),
+    ("has_wifi", "w"),
+    ("has_ac", "c"),
+    ("accessibility", "x"),
+)
+
+COMPACT_LEGEND = (
+    "Legend: floors are listed as F<n>=<location / floor> with seat counts. "
+    "Each T<table> line gives the seat numbers at that table followed by one token per seat "
+    "in the same order, run-length encoded as <count>*<token> when repeated. "
+    "Token = status letter (A=available, O=occupied, R=reserved, M=maintenance, B=blocked) "
+    "followed by feature letters (p=power, w=wifi, c=AC, x=accessible)."
+)
+
+_NUMBERED_SEAT = re.compile(r"^(.*?)(\d+)$")
+
+
+def seat_token(seat: Dict) -> str:
+    """Return the status + feature token for a single seat."""
+    status = STATUS_CODES.get(str(seat.get("status")), "?")
+    features = "".join(code for key, code in FEATURE_CODES if seat.get(key))
+    return f"{status}{features}"
+
+
+def run_length(tokens: Sequence[str]) -> str:
+    parts = []
+    for token, group in groupby(tokens):
+        count = sum(1 for _ in group)
+        parts.append(f"{count}*{token}" if count > 1 else token)
+    return " ".join(parts)
+
+
+def compress_seat_numbers(seat_numbers: Sequence[str]) -> str:
+    """Collapse ``LIB-1-001, LIB-1-002, LIB-1-003`` into ``LIB-1-[001-003]``."""
+    matches = [_NUMBERED_SEAT.match(number) for number in seat_numbers]
+    if not seat_numbers or not all(matches):
+        return ",".join(seat_numbers)
+
+    prefixes = {match.group(1) for match in matches}
+    if len(prefixes) != 1:
+        return ",".join(seat_numbers)
+
+    prefix = prefixes.pop()
+    digits = [match.group(2) for match in matches]
+    ranges: List[str] = []
+    start = previous = digits[0]
+    for current in digits[1:]:
+        if int(current) == int(previous) + 1:
+            previous = current
+            continue
+        ranges.append(start if start == previous else f"{start}-{previous}")
+        start = previous = current
+    ranges.append(start if start == previous else f"{start}-{previous}")
+
+    if len(ranges) == 1 and "-" not in ranges[0]:
+        return f"{prefix}{ranges[0]}"
+    return f"{prefix}[{','.join(ranges)}]"
+
+
+def _sort_key(seat: Dict):
+    match = _NUMBERED_SEAT.match(str(seat.get("seat_number", "")))
+    if match:
+        return (match.group(1), int(match.group(2)))
+    return (str(seat.get("seat_number", "")), 0)
+
+
+def encode_floor(floor_code: str, floor_entry: Dict) -> str:
+    """Encode one floor (as produced by the refresh worker) into compact lines."""
+    seats = floor_entry.get("seats", [])
+    available = sum(1 for seat in seats if seat.get("status") == "available")
+    lines = [f"{floor_code}={floor_entry.get('path') or floor_entry.get('floor_id')}|seats={len(seats)}|available={available}"]
+
+    tables: Dict[object, List[Dict]] = {}
+    for seat in seats:
+        tables.setdefault(seat.get("table_number"), []).append(seat)
+
+    for table_number in sorted(tables, key=lambda value: (value is None, value if value is not None else 0)):
+        table_seats = sorted(tables[table_number], key=_sort_key)
+        label = f"T{table_number}" if table_number is not None else "T-"
+        numbers = compress_seat_numbers([str(seat.get("seat_number", "")) for seat in table_seats])
+        tokens = run_length([seat_token(seat) for seat in table_seats])
+        lines.append(f"{label}:{numbers}|{tokens}")
+
+    return "\n".join(lines)
+
+
+def encode_floors(floor_payload: Iterable[Dict]) -> Dict[str, Dict[str, str]]:
+    """Encode every floor once, keyed by floor_id, with a stable dictionary code."""
+    encoded: Dict[str, Dict[str, str]] = {}
+    for index, floor_entry in enumerate(floor_payload, start=1):
+        code = f"F{index}"
+        encoded[floor_entry["floor_id"]] = {
+            "code": code,
+            "path": floor_entry.get("path") or "",
+            "location_name": floor_entry.get("location_name") or "",
+            "floor_name": floor_entry.get("floor_name") or "",
+            "encoded": encode_floor(code, floor_entry),
+        }
+    return encoded
+
+
+def select_relevant_floors(
+    encoded_floors: Dict[str, Dict[str, str]],
+    message: str,
+    preferred_floor_ids: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Pick the floors worth sending to the LLM for a given request.
+
+    Floors whose location/floor name is mentioned in the message win; otherwise
+    the floors holding the recommended seats are used. An empty result means
+    nothing narrowed the search and every floor should be included.
+    """
+    lowered = (message or "").lower()
+    mentioned_locations = {
+        entry["location_name"].lower()
+        for entry in encoded_floors.values()
+        if entry["location_name"] and entry["location_name"].lower() in lowered
+    }
+    if mentioned_locations:
+        candidates = [
+            floor_id
+            for floor_id, entry in encoded_floors.items()
+            if entry["location_name"].lower() in mentioned_locations
+        ]
+        by_floor = [
+            floor_id
+            for floor_id in candidates
+            if encoded_floors[floor_id]["floor_name"]
+            and encoded_floors[floor_id]["floor_name"].lower() in lowered
+        ]
+        return by_floor or candidates
+
+    if preferred_floor_ids:
+        return [floor_id for floor_id in dict.fromkeys(preferred_floor_ids) if floor_id in encoded_floors]
+    return []
@@ -1,16 +1,93 @@
-"""Background worker that simulates seat occupancy drift and caches snapshots."""
+"""Background worker that simulates seat occupancy drift and caches snapshots.
+
+With several server processes only the leader (see leader_election) applies
+drift and builds the snapshot; it publishes the result to the shared
+snapshot store and the other processes poll it instead of recomputing.
+
+Each leader refresh is timed phase by phase (see SeatRefreshTick). Ticks
+run on a fixed schedule: one that takes longer than the interval is an
+overrun, and the ticks that fell due meanwhile are skipped and counted. A
+tick that fails is logged and recorded with its error; the schedule carries
+on and the next tick retries.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import logging
 import random
+import statistics
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from threading import Lock
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional
 
 from app.config import settings
 from app.database import SessionLocal
+from app.models.floor import Floor
+from app.models.location import Location
 from app.models.seat import Seat, SeatStatus
+from app.services.seat_map_encoding import COMPACT_LEGEND, encode_floors, select_relevant_floors
+from app.services.leader_election import LeaderLock
+from app.services.metrics import registry
+from app.services.seat_indexes import invalidate_seat_indexes, rebuild_seat_indexes
+from app.services.snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+TICK_PHASES = ("query", "drift", "commit", "build", "publish")
+
+tick_phase_duration = registry.histogram(
+    "seat_refresh_phase_duration_seconds", "Seat refresh tick time per phase (leader only).", ("phase",),
+)
+tick_duration = registry.histogram(
+    "seat_refresh_tick_duration_seconds", "Seat refresh tick time (leader only).",
+)
+seats_mutated = registry.counter(
+    "seat_refresh_seats_mutated_total", "Seat status changes applied by occupancy drift.",
+)
+snapshot_size = registry.gauge(
+    "seat_refresh_snapshot_bytes", "Size of the last published seat snapshot.", ("encoding",),
+)
+tick_overruns = registry.counter(
+    "seat_refresh_overruns_total", "Seat refresh ticks that took longer than the interval.",
+)
+skipped_ticks = registry.counter(
+    "seat_refresh_skipped_ticks_total", "Seat refresh ticks skipped because an earlier one overran.",
+)
+tick_errors = registry.counter(
+    "seat_refresh_errors_total", "Seat refresh ticks that failed.",
+)
+
+
+@dataclass
+class SeatRefreshTick:
+    """Timings (ms) and sizes of one leader refresh."""
+
+    started_at: datetime
+    seats: int = 0
+    seats_mutated: int = 0
+    query_ms: float = 0.0
+    drift_ms: float = 0.0
+    # Occupancy counter sync and commit
+    commit_ms: float = 0.0
+    # Snapshot payload, compact floor encoding and seat indexes
+    build_ms: float = 0.0
+    # Snapshot serialisation and the write to the snapshot store
+    publish_ms: float = 0.0
+    duration_ms: float = 0.0
+    snapshot_bytes: int = 0
+    snapshot_compressed_bytes: int = 0
+    overrun: bool = False
+    skipped_ticks: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        return data
 
 
 class SeatRefreshWorker:
@@ -21,8 +98,16 @@ class SeatRefreshWorker:
         interval_seconds: int = 60,
         drift_ratio: float = 0.05,
         target_occupancy: float = 0.65,
+        poll_interval_seconds: int = 5,
+        leader_lock: Optional[LeaderLock] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        tick_history: int = 120,
     ) -> None:
         self._interval = interval_seconds
+        self._poll_interval = poll_interval_seconds
+        self._leader_lock = leader_lock or LeaderLock("seat-refresh")
+        self._snapshot_store = snapshot_store or SnapshotStore("seat-refresh")
+        self._snapshot_version: Optional[int] = None
         self._drift_ratio = drift_ratio
         self._target_occupancy = target_occupancy
         self._task: Optional[asyncio.Task] = None
@@ -30,11 +115,21 @@ class SeatRefreshWorker:
         self._encoded_map: str = ""
         self._seat_payload: List[Dict] = []
         self._floor_payload: List[Dict] = []
+        self._compact_floors: Dict[str, Dict[str, str]] = {}
         self._last_updated: Optional[datetime] = None
+        self._ticks: Deque[SeatRefreshTick] = deque(maxlen=max(1, tick_history))
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._skipped_count = 0
+        self._error_count = 0
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader_lock.is_held
 
     async def start(self) -> None:
         if self._task is None:
-            await asyncio.to_thread(self._refresh_snapshot)
+            await asyncio.to_thread(self._tick)
             self._task = asyncio.create_task(self._run())
 
     async def stop(self) -> None:
@@ -45,48 +140,196 @@ class SeatRefreshWorker:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        await asyncio.to_thread(self._leader_lock.release)
 
     async def _run(self) -> None:
-        while True:
-            await asyncio.to_thread(self._refresh_snapshot)
-            await asyncio.sleep(self._interval)
+        try:
+            next_due = time.monotonic()
+            while True:
+                interval = self._interval if self.is_leader else self._poll_interval
+                next_due += interval
+                await asyncio.sleep(max(0.0, next_due - time.monotonic()))
+                try:
+                    tick = await asyncio.to_thread(self._tick)
+                except Exception:
+                    # Lock checks and follower polls; leader refreshes record their own errors
+                    logger.exception("Seat refresh tick failed")
+                    continue
+                overdue = time.monotonic() - next_due
+                if tick is not None and overdue > interval:
+                    # Ran past the next due time: drop the ticks missed meanwhile
+                    # rather than running them back to back
+                    missed = int(overdue // interval)
+                    next_due += missed * interval
+                    tick.overrun = True
+                    tick.skipped_ticks = missed
+                    with self._lock:
+                        self._overrun_count += 1
+                        self._skipped_count += missed
+                    tick_overruns.inc()
+                    skipped_ticks.inc(amount=missed)
+        finally:
+            # Release the lock if this task dies, so another process can take over
+            await asyncio.to_thread(self._leader_lock.release)
+
+    def _tick(self) -> Optional[SeatRefreshTick]:
+        """Refresh as leader (returning its timings) or adopt the leader's snapshot."""
+        # Followers retry the lock on every poll so one takes over if the leader exits
+        if self._leader_lock.try_acquire():
+            return self._refresh_snapshot()
+        self._load_published_snapshot()
+        return None
+
+    def _refresh_snapshot(self) -> SeatRefreshTick:
+        tick = SeatRefreshTick(started_at=datetime.utcnow())
+        started = time.perf_counter()
+        try:
+            self._refresh_phases(tick)
+        except Exception as exc:
+            tick.error = repr(exc)
+            logger.exception("Seat refresh failed")
+        tick.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        self._record_tick(tick)
+        return tick
+
+    def _refresh_phases(self, tick: SeatRefreshTick) -> None:
+        mark = time.perf_counter()
+
+        def lap() -> float:
+            nonlocal mark
+            now = time.perf_counter()
+            elapsed, mark = (now - mark) * 1000, now
+            return round(elapsed, 3)
 
-    def _refresh_snapshot(self) -> None:
         db = SessionLocal()
         try:
             seats = db.query(Seat).all()
+            tick.query_ms = lap()
+            tick.seats = len(seats)
             if not seats:
                 return
 
-            self._apply_drift(seats)
+            tick.seats_mutated = self._apply_drift(seats)
+            tick.drift_ms = lap()
+            self._sync_occupancy_counters(db, seats)
             db.commit()
+            tick.commit_ms = lap()
 
             payload, encoded, floor_payload = self._build_snapshot(seats)
+            compact_floors = encode_floors(floor_payload)
+            rebuild_seat_indexes(seats)
             with self._lock:
                 self._seat_payload = payload
                 self._floor_payload = floor_payload
                 self._encoded_map = encoded
+                self._compact_floors = compact_floors
                 self._last_updated = datetime.utcnow()
+            tick.build_ms = lap()
         finally:
             db.close()
 
-    def _apply_drift(self, seats: List[Seat]) -> None:
+        serialized = self._snapshot_store.serialize(self._snapshot_document())
+        compressed = self._snapshot_store.compress(serialized)
+        self._snapshot_version = self._snapshot_store.publish_encoded(compressed)
+        tick.publish_ms = lap()
+        tick.snapshot_bytes = len(serialized)
+        tick.snapshot_compressed_bytes = len(compressed)
+
+    def _record_tick(self, tick: SeatRefreshTick) -> None:
+        with self._lock:
+            self._ticks.append(tick)
+            self._tick_count += 1
+            if tick.error:
+                self._error_count += 1
+        if tick.error:
+            tick_errors.inc()
+        for phase in TICK_PHASES:
+            tick_phase_duration.observe(getattr(tick, f"{phase}_ms") / 1000, (phase,))
+        tick_duration.observe(tick.duration_ms / 1000)
+        seats_mutated.inc(amount=tick.seats_mutated)
+        if tick.snapshot_bytes:
+            snapshot_size.set(tick.snapshot_bytes, ("json",))
+            snapshot_size.set(tick.snapshot_compressed_bytes, ("zlib",))
+
+    def get_tick_stats(self, limit: Optional[int] = None) -> Dict:
+        """Recent leader ticks (newest first), totals, and duration percentiles over the kept history."""
+        with self._lock:
+            ticks = list(self._ticks)
+            totals = {
+                "ticks": self._tick_count,
+                "overruns": self._overrun_count,
+                "skipped_ticks": self._skipped_count,
+                "errors": self._error_count,
+            }
+        summary = {}
+        for field_name in [f"{phase}_ms" for phase in TICK_PHASES] + ["duration_ms"]:
+            values = sorted(getattr(tick, field_name) for tick in ticks)
+            if values:
+                summary[field_name] = {
+                    "p50": round(statistics.median(values), 3),
+                    "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                    "max": values[-1],
+                }
+        ticks.reverse()
+        return {
+            "role": "leader" if self.is_leader else "follower",
+            "interval_seconds": self._interval,
+            "totals": totals,
+            "summary": summary,
+            "ticks": [tick.to_dict() for tick in ticks[:limit]],
+        }
+
+    def _snapshot_document(self) -> Dict:
+        with self._lock:
+            return {
+                "seats": self._seat_payload,
+                "floors": self._floor_payload,
+                "encoded": self._encoded_map,
+                "compact_floors": self._compact_floors,
+                "last_updated": self._last_updated.isoformat() if self._last_updated else None,
+            }
+
+    def _load_published_snapshot(self) -> None:
+        """Adopt the leader's latest snapshot if it changed since the last poll."""
+        version = self._snapshot_store.current_version()
+        if version is None or version == self._snapshot_version:
+            return
+        published = self._snapshot_store.load()
+        if published is None:
+            return
+        version, document = published
+        with self._lock:
+            self._seat_payload = document["seats"]
+            self._floor_payload = document["floors"]
+            self._encoded_map = document["encoded"]
+            self._compact_floors = document["compact_floors"]
+            last_updated = document["last_updated"]
+            self._last_updated = datetime.fromisoformat(last_updated) if last_updated else None
+        self._snapshot_version = version
+        # The leader changed seat statuses; rebuild the local indexes on next use
+        invalidate_seat_indexes()
+
+    def _apply_drift(self, seats: List[Seat]) -> int:
+        """Move seat statuses toward the target occupancy; return the number of status changes."""
         total = len(seats)
         if total == 0:
-            return
+            return 0
 
         available = [s for s in seats if s.status == SeatStatus.AVAILABLE]
         occupied = [s for s in seats if s.status == SeatStatus.OCCUPIED]
         desired_occupied = int(total * self._target_occupancy)
         delta = desired_occupied - len(occupied)
         max_changes = max(1, int(total * self._drift_ratio))
+        changes = 0
 
         if delta > 0 and available:
             change = min(delta, len(available), max_changes)
+            changes += change
             for seat in random.sample(available, change):
                 seat.status = SeatStatus.OCCUPIED
         elif delta < 0 and occupied:
             change = min(-delta, len(occupied), max_changes)
+            changes += change
             for seat in random.sample(occupied, change):
                 seat.status = SeatStatus.AVAILABLE
 
@@ -95,10 +338,23 @@ class SeatRefreshWorker:
         if maintenance_candidates and random.random() < 0.05:
             seat = random.choice(maintenance_candidates)
             seat.status = SeatStatus.MAINTENANCE
+            changes += 1
         maintenance = [s for s in seats if s.status == SeatStatus.MAINTENANCE]
         if maintenance and random.random() < 0.4:
             seat = random.choice(maintenance)
             seat.status = SeatStatus.AVAILABLE
+            changes += 1
+        return changes
+
+    def _sync_occupancy_counters(self, db, seats: List[Seat]) -> None:
+        """Keep the floor and location occupied counters in step with the drifted seats."""
+        occupied = Counter(seat.floor_id for seat in seats if seat.status == SeatStatus.OCCUPIED)
+        per_location: Counter = Counter()
+        for floor in db.query(Floor).all():
+            floor.occupied_seats = occupied[floor.id]
+            per_location[floor.location_id] += floor.occupied_seats
+        for location in db.query(Location).all():
+            location.current_occupancy = per_location[location.id]
 
     def _build_snapshot(self, seats: List[Seat]) -> tuple[List[Dict], str, List[Dict]]:
         xs = [float(seat.x_coordinate) for seat in seats]
@@ -158,6 +414,7 @@ class SeatRefreshWorker:
                 {
                     "seat_id": seat.id,
                     "seat_number": seat.seat_number,
+                    "table_number": seat.table_number,
                     "status": status_value,
                     "has_power_outlet": seat.has_power_outlet,
                     "has_wifi": seat_dict["has_wifi"],
@@ -194,9 +451,33 @@ class SeatRefreshWorker:
                 "last_updated": self._last_updated.isoformat() if self._last_updated else None,
             }
 
+    def get_compact_snapshot(
+        self,
+        message: str = "",
+        preferred_floor_ids: Optional[Iterable[str]] = None,
+    ) -> Dict:
+        """Return the compact per-floor encoding, narrowed to floors relevant to the request."""
+        with self._lock:
+            compact_floors = self._compact_floors
+            last_updated = self._last_updated
+
+        floor_ids = select_relevant_floors(compact_floors, message, preferred_floor_ids)
+        if not floor_ids:
+            floor_ids = list(compact_floors)
+
+        body = "\n".join(compact_floors[floor_id]["encoded"] for floor_id in floor_ids)
+        return {
+            "encoded": f"{COMPACT_LEGEND}\n{body}" if body else "",
+            "last_updated": last_updated.isoformat() if last_updated else None,
+            "floors_included": len(floor_ids),
+            "floors_total": len(compact_floors),
+        }
+
 
 seat_refresh_worker = SeatRefreshWorker(
     interval_seconds=settings.SEAT_REFRESH_INTERVAL_SECONDS,
     drift_ratio=settings.SEAT_REFRESH_DRIFT_RATIO,
     target_occupancy=settings.SEAT_TARGET_OCCUPANCY_RATIO,
+    poll_interval_seconds=settings.SEAT_SNAPSHOT_POLL_SECONDS,
+    tick_history=settings.SEAT_REFRESH_TICK_HISTORY,
 )
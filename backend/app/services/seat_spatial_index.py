@@ -0,0 +1,366 @@
+"""Per-floor spatial index over seat coordinates for adjacency queries."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.models.seat import Seat, SeatStatus
+
+
+# Average number of seats per grid cell; keeps ring searches short.
+SEATS_PER_CELL = 4
+
+
+@dataclass(frozen=True)
+class SpatialSeat:
+    """Seat attributes kept alongside the grid."""
+
+    seat_id: str
+    seat_number: str
+    floor_id: str
+    floor_name: Optional[str]
+    table_number: Optional[int]
+    seat_type: str
+    has_power_outlet: bool
+    has_ac: bool
+    is_quiet: bool
+    accessibility: bool
+    x: float
+    y: float
+
+
+@dataclass
+class SeatCluster:
+    """A set of available seats that sit together."""
+
+    floor_id: str
+    seats: List[SpatialSeat]
+    same_table: bool
+    table_number: Optional[int]
+    spread: float
+    free_ratio: float
+
+    @property
+    def rank_key(self) -> Tuple:
+        # Same table first, then emptier tables, then the tightest cluster.
+        return (not self.same_table, -round(self.free_ratio, 3), self.spread)
+
+
+class FloorSpatialIndex:
+    """Uniform grid over one floor's seats, plus seats grouped by table."""
+
+    def __init__(self, floor_id: str, seats: List[SpatialSeat], available: List[bool]) -> None:
+        self.floor_id = floor_id
+        self.seats = seats
+        self.available = available
+        self._positions = {seat.seat_id: position for position, seat in enumerate(seats)}
+
+        xs = [seat.x for seat in seats]
+        ys = [seat.y for seat in seats]
+        self._x_min, self._y_min = min(xs), min(ys)
+        extent = max(max(xs) - self._x_min, max(ys) - self._y_min) or 1.0
+        cells_per_side = max(1, math.ceil(math.sqrt(len(seats) / SEATS_PER_CELL)))
+        self._cell_size = extent / cells_per_side
+
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._tables: Dict[int, List[int]] = {}
+        for position, seat in enumerate(seats):
+            self._grid.setdefault(self._cell(seat.x, seat.y), []).append(position)
+            if seat.table_number is not None:
+                self._tables.setdefault(seat.table_number, []).append(position)
+        self._max_cell = (max(cell[0] for cell in self._grid), max(cell[1] for cell in self._grid))
+
+    def position_of(self, seat_id: str) -> Optional[int]:
+        return self._positions.get(seat_id)
+
+    def set_available(self, position: int, is_available: bool) -> None:
+        self.available[position] = is_available
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (
+            int((x - self._x_min) // self._cell_size),
+            int((y - self._y_min) // self._cell_size),
+        )
+
+    def _ring(self, center: Tuple[int, int], radius: int) -> Iterable[Tuple[int, int]]:
+        cx, cy = center
+        if radius == 0:
+            yield center
+            return
+        for dx in range(-radius, radius + 1):
+            yield (cx + dx, cy - radius)
+            yield (cx + dx, cy + radius)
+        for dy in range(-radius + 1, radius):
+            yield (cx - radius, cy + dy)
+            yield (cx + radius, cy + dy)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        predicate: Optional[Callable[[int], bool]] = None,
+    ) -> List[Tuple[float, int]]:
+        """Return up to ``k`` (distance, position) pairs closest to (x, y)."""
+        if k <= 0 or not (math.isfinite(x) and math.isfinite(y)):
+            return []
+        # Points off the map start from the closest cell on the grid; rings
+        # past the grid edge are empty, so the search never walks beyond it.
+        cx, cy = self._cell(x, y)
+        center = (min(max(cx, 0), self._max_cell[0]), min(max(cy, 0), self._max_cell[1]))
+        max_radius = max(
+            center[0],
+            center[1],
+            self._max_cell[0] - center[0],
+            self._max_cell[1] - center[1],
+        )
+
+        best: List[Tuple[float, int]] = []  # max-heap via negated distance
+        for radius in range(max_radius + 1):
+            for cell in self._ring(center, radius):
+                for position in self._grid.get(cell, ()):
+                    if predicate is not None and not predicate(position):
+                        continue
+                    distance = self._distance(position, x, y)
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, position))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, position))
+            # Anything in later rings is at least radius * cell_size away
+            # (still true from a clamped center: the point lies beyond it).
+            if len(best) == k and -best[0][0] <= radius * self._cell_size:
+                break
+
+        return sorted((-distance, position) for distance, position in best)
+
+    def find_groups(self, size: int, limit: int) -> List[SeatCluster]:
+        """Best non-overlapping clusters of ``size`` available seats on this floor."""
+        clusters: List[SeatCluster] = []
+
+        for table_number, positions in self._tables.items():
+            free = [position for position in positions if self.available[position]]
+            if len(free) < size:
+                continue
+            chosen = self._tightest_subset(free, size)
+            clusters.append(
+                self._cluster(
+                    chosen,
+                    same_table=True,
+                    table_number=table_number,
+                    free_ratio=len(free) / len(positions),
+                )
+            )
+
+        if len(clusters) < limit:
+            clusters.extend(self._spatial_clusters(size))
+
+        clusters.sort(key=lambda cluster: cluster.rank_key)
+        selected: List[SeatCluster] = []
+        used: set = set()
+        for cluster in clusters:
+            ids = {seat.seat_id for seat in cluster.seats}
+            if ids & used:
+                continue
+            selected.append(cluster)
+            used |= ids
+            if len(selected) == limit:
+                break
+        return selected
+
+    def _spatial_clusters(self, size: int) -> List[SeatCluster]:
+        """Cross-table clusters seeded from one available seat per grid cell."""
+        is_free = self.available.__getitem__
+        seen: set = set()
+        clusters: List[SeatCluster] = []
+        for positions in self._grid.values():
+            seed = next((position for position in positions if self.available[position]), None)
+            if seed is None:
+                continue
+            seat = self.seats[seed]
+            neighbours = self.nearest(seat.x, seat.y, size, predicate=is_free)
+            if len(neighbours) < size:
+                break
+            chosen = [position for _, position in neighbours]
+            key = frozenset(chosen)
+            if key in seen:
+                continue
+            seen.add(key)
+            tables = {self.seats[position].table_number for position in chosen}
+            same_table = len(tables) == 1 and None not in tables
+            clusters.append(
+                self._cluster(
+                    chosen,
+                    same_table=same_table,
+                    table_number=next(iter(tables)) if same_table else None,
+                    free_ratio=0.0,
+                )
+            )
+        return clusters
+
+    def _tightest_subset(self, positions: List[int], size: int) -> List[int]:
+        if len(positions) == size:
+            return positions
+        best: Optional[List[int]] = None
+        best_spread = math.inf
+        for seed in positions:
+            origin = self.seats[seed]
+            ordered = sorted(positions, key=lambda position: self._distance(position, origin.x, origin.y))[:size]
+            spread = self._spread(ordered)
+            if spread < best_spread:
+                best, best_spread = ordered, spread
+        return best or positions[:size]
+
+    def _distance(self, position: int, x: float, y: float) -> float:
+        seat = self.seats[position]
+        return math.hypot(seat.x - x, seat.y - y)
+
+    def _spread(self, positions: List[int]) -> float:
+        """Mean distance from the cluster centroid."""
+        cx = sum(self.seats[position].x for position in positions) / len(positions)
+        cy = sum(self.seats[position].y for position in positions) / len(positions)
+        return sum(self._distance(position, cx, cy) for position in positions) / len(positions)
+
+    def _cluster(
+        self,
+        positions: List[int],
+        same_table: bool,
+        table_number: Optional[int],
+        free_ratio: float,
+    ) -> SeatCluster:
+        ordered = sorted(positions, key=lambda position: self.seats[position].seat_number)
+        return SeatCluster(
+            floor_id=self.floor_id,
+            seats=[self.seats[position] for position in ordered],
+            same_table=same_table,
+            table_number=table_number,
+            spread=round(self._spread(ordered), 4),
+            free_ratio=free_ratio,
+        )
+
+
+class SeatSpatialIndex:
+    """Floor-partitioned spatial index shared across requests."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._ready = False
+        self._floors: Dict[str, FloorSpatialIndex] = {}
+        self._seat_floor: Dict[str, str] = {}
+        self._seat_numbers: Dict[str, str] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def rebuild(self, seats: Iterable[Seat]) -> None:
+        """Replace the index contents with the given seats (floor should be loaded)."""
+        grouped: Dict[str, Tuple[List[SpatialSeat], List[bool]]] = {}
+        for seat in seats:
+            seat_type = seat.seat_type.value if hasattr(seat.seat_type, "value") else str(seat.seat_type)
+            entries, available = grouped.setdefault(seat.floor_id, ([], []))
+            entries.append(
+                SpatialSeat(
+                    seat_id=seat.id,
+                    seat_number=seat.seat_number,
+                    floor_id=seat.floor_id,
+                    floor_name=seat.floor.floor_name if seat.floor else None,
+                    table_number=seat.table_number,
+                    seat_type=seat_type,
+                    has_power_outlet=bool(seat.has_power_outlet),
+                    has_ac=bool(seat.has_ac),
+                    is_quiet=bool(seat.is_quiet),
+                    accessibility=bool(seat.accessibility),
+                    x=float(seat.x_coordinate),
+                    y=float(seat.y_coordinate),
+                )
+            )
+            available.append(seat.status == SeatStatus.AVAILABLE)
+
+        floors = {
+            floor_id: FloorSpatialIndex(floor_id, entries, available)
+            for floor_id, (entries, available) in grouped.items()
+        }
+        seat_floor = {seat.seat_id: floor_id for floor_id, floor in floors.items() for seat in floor.seats}
+        seat_numbers = {
+            seat.seat_number.upper(): seat.seat_id for floor in floors.values() for seat in floor.seats
+        }
+
+        with self._lock:
+            self._floors = floors
+            self._seat_floor = seat_floor
+            self._seat_numbers = seat_numbers
+            self._ready = True
+
+    def update_statuses(self, changes: Mapping[str, SeatStatus]) -> None:
+        with self._lock:
+            if not self._ready:
+                return
+            for seat_id, status in changes.items():
+                floor = self._floors.get(self._seat_floor.get(seat_id, ""))
+                position = floor.position_of(seat_id) if floor else None
+                if position is None:
+                    self._ready = False
+                    return
+                floor.set_available(position, status == SeatStatus.AVAILABLE)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._ready = False
+
+    def locate(self, seat_id: Optional[str] = None, seat_number: Optional[str] = None) -> Optional[SpatialSeat]:
+        """Find an indexed seat by id or (case-insensitive) seat number."""
+        with self._lock:
+            if seat_id is None and seat_number is not None:
+                seat_id = self._seat_numbers.get(seat_number.upper())
+            floor = self._floors.get(self._seat_floor.get(seat_id or "", ""))
+            position = floor.position_of(seat_id) if floor else None
+            return floor.seats[position] if position is not None else None
+
+    def nearest(
+        self,
+        floor_id: str,
+        x: float,
+        y: float,
+        k: int = 5,
+        exclude_seat_id: Optional[str] = None,
+        filters: Optional[Mapping[str, bool]] = None,
+    ) -> List[Tuple[float, SpatialSeat]]:
+        """k nearest available seats on a floor, optionally requiring seat features.
+
+        ``filters`` maps SpatialSeat attribute names (e.g. ``has_power_outlet``)
+        to the value a seat must have.
+        """
+        required = [(name, value) for name, value in (filters or {}).items() if value is not None]
+        with self._lock:
+            floor = self._floors.get(floor_id)
+            if floor is None:
+                return []
+
+            def matches(position: int) -> bool:
+                if not floor.available[position]:
+                    return False
+                seat = floor.seats[position]
+                if seat.seat_id == exclude_seat_id:
+                    return False
+                return all(getattr(seat, name) == value for name, value in required)
+
+            return [(distance, floor.seats[position]) for distance, position in floor.nearest(x, y, k, matches)]
+
+    def find_groups(self, size: int, floor_id: Optional[str] = None, limit: int = 5) -> List[SeatCluster]:
+        with self._lock:
+            if floor_id is not None:
+                floor = self._floors.get(floor_id)
+                return floor.find_groups(size, limit) if floor else []
+
+            clusters: List[SeatCluster] = []
+            for floor in self._floors.values():
+                clusters.extend(floor.find_groups(size, limit))
+        clusters.sort(key=lambda cluster: cluster.rank_key)
+        return clusters[:limit]
+
+
+seat_spatial_index = SeatSpatialIndex()
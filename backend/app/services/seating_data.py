@@ -6,9 +6,13 @@ import csv
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import Dict, List, Optional
 
+from app.config import settings
+
 
 DATE_FORMAT = "%m/%d/%Y %H:%M"
 
@@ -35,29 +39,37 @@ class SeatingDataService:
         self._path = Path(data_path)
         self._records: List[SeatingRecord] = []
         self._summary: Optional[Dict] = None
+        self._loaded = False
+        self._lock = Lock()
 
     def ensure_loaded(self) -> None:
-        if self._records:
+        if self._loaded:
             return
-        if not self._path.exists():
-            raise FileNotFoundError(f"Seating dataset not found: {self._path}")
-
-        with self._path.open("r", encoding="utf-8-sig") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                arrival = datetime.strptime(row["Arrival Time"].strip(), DATE_FORMAT)
-                leaving = datetime.strptime(row["Leaving Time"].strip(), DATE_FORMAT)
-                temperature = float(row.get("Temperature", 0) or 0)
-                power = (row.get("Power Plugs") or "").strip().upper() == "TRUE"
-                self._records.append(
-                    SeatingRecord(
-                        location=row["Location"].strip(),
-                        arrival_time=arrival,
-                        leaving_time=leaving,
-                        temperature=temperature,
-                        power_plugs=power,
+        with self._lock:
+            if self._loaded:
+                return
+            if not self._path.exists():
+                raise FileNotFoundError(f"Seating dataset not found: {self._path}")
+
+            records: List[SeatingRecord] = []
+            with self._path.open("r", encoding="utf-8-sig") as handle:
+                reader = csv.DictReader(handle)
+                for row in reader:
+                    arrival = datetime.strptime(row["Arrival Time"].strip(), DATE_FORMAT)
+                    leaving = datetime.strptime(row["Leaving Time"].strip(), DATE_FORMAT)
+                    temperature = float(row.get("Temperature", 0) or 0)
+                    power = (row.get("Power Plugs") or "").strip().upper() == "TRUE"
+                    records.append(
+                        SeatingRecord(
+                            location=row["Location"].strip(),
+                            arrival_time=arrival,
+                            leaving_time=leaving,
+                            temperature=temperature,
+                            power_plugs=power,
+                        )
                     )
-                )
+            self._records = records
+            self._loaded = True
 
     @property
     def records(self) -> List[SeatingRecord]:
@@ -73,9 +85,14 @@ class SeatingDataService:
             return self._summary
 
         self.ensure_loaded()
+        with self._lock:
+            if self._summary is None:
+                self._summary = self._build_summary()
+        return self._summary
+
+    def _build_summary(self) -> Dict:
         if not self._records:
-            self._summary = {"overall": {"total_records": 0}, "locations": {}}
-            return self._summary
+            return {"overall": {"total_records": 0}, "locations": {}}
 
         total_records = len(self._records)
         avg_duration = sum(r.duration_minutes for r in self._records) / total_records
@@ -111,7 +128,7 @@ class SeatingDataService:
                 }
             )
 
-        self._summary = {
+        return {
             "overall": {
                 "total_records": total_records,
                 "date_range": {
@@ -122,7 +139,21 @@ class SeatingDataService:
             },
             "locations": location_stats,
         }
-        return self._summary
+
+
+@lru_cache(maxsize=1)
+def get_seating_data_service() -> SeatingDataService:
+    """Process-wide dataset service so the CSV is parsed at most once."""
+    return SeatingDataService(settings.SEATING_DATA_PATH)
+
+
+def warm_up_seating_data() -> bool:
+    """Load the dataset and its summary ahead of the first request."""
+    try:
+        get_seating_data_service().summary()
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def build_prediction_context(service: SeatingDataService, location: str) -> Dict:
@@ -0,0 +1,66 @@
+"""Snapshots shared between server processes through the worker_snapshots table."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+
+from app.database import engine
+from app.models.worker_snapshot import WorkerSnapshot
+from app.services.leader_election import process_identity
+
+
+class SnapshotStore:
+    """
+    Versioned JSON document published by one process and read by the others.
+    Readers poll `current_version()` (a primary-key lookup) and only fetch and
+    decode the payload when it changed.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._table = WorkerSnapshot.__table__
+
+    @staticmethod
+    def serialize(document: Dict) -> bytes:
+        return json.dumps(document, separators=(",", ":")).encode()
+
+    @staticmethod
+    def compress(serialized: bytes) -> bytes:
+        return zlib.compress(serialized, 1)
+
+    def publish(self, document: Dict) -> int:
+        """Store `document` as the latest snapshot; return its version."""
+        return self.publish_encoded(self.compress(self.serialize(document)))
+
+    def publish_encoded(self, payload: bytes) -> int:
+        """publish() for a document already serialized and compressed."""
+        values = {"payload": payload, "owner": process_identity(), "updated_at": datetime.utcnow()}
+        table = self._table
+        with engine.begin() as conn:
+            result = conn.execute(
+                update(table).where(table.c.name == self.name).values(version=table.c.version + 1, **values)
+            )
+            if result.rowcount == 0:
+                conn.execute(insert(table).values(name=self.name, version=1, **values))
+            return conn.execute(select(table.c.version).where(table.c.name == self.name)).scalar_one()
+
+    def current_version(self) -> Optional[int]:
+        table = self._table
+        with engine.connect() as conn:
+            return conn.execute(select(table.c.version).where(table.c.name == self.name)).scalar()
+
+    def load(self) -> Optional[Tuple[int, Dict]]:
+        """Return (version, document) or None if nothing was published yet."""
+        table = self._table
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.version, table.c.payload).where(table.c.name == self.name)
+            ).first()
+        if row is None:
+            return None
+        return row.version, json.loads(zlib.decompress(row.payload))
@@ -0,0 +1,254 @@
+"""In-memory bitset index backing seat suggestions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from app.models.seat import Seat, SeatStatus, SeatType
+from app.schemas.prediction import SeatSuggestionRequest
+
+
+# Scores are kept in tenths so ranking can use exact integer keys.
+BASE_SCORE = 10
+POWER_REQUIRED_BONUS = 20
+POWER_OPTIONAL_BONUS = 2
+WIFI_REQUIRED_BONUS = 10
+WIFI_OPTIONAL_BONUS = 1
+AC_REQUIRED_BONUS = 5
+AC_OPTIONAL_BONUS = 1
+CAPACITY_BONUS = 3
+ACCESSIBILITY_BONUS = 2
+
+
+@dataclass(frozen=True)
+class IndexedSeat:
+    """Row payload returned for each ranked seat."""
+
+    seat_id: str
+    seat_number: str
+    floor_id: str
+    floor_name: Optional[str]
+    seat_type: SeatType
+    has_power_outlet: bool
+    has_wifi: bool
+    has_ac: bool
+    accessibility: bool
+    capacity: int
+    score: float
+
+
+# Bits of the per-seat feature class used to look up scores.
+_POWER_BIT = 1
+_WIFI_BIT = 2
+_AC_BIT = 4
+_CAPACITY_BIT = 8
+_ACCESSIBLE_BIT = 16
+_CLASS_COUNT = 32
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    return np.packbits(mask, bitorder="little")
+
+
+def _code_masks(values: List) -> Dict:
+    """Packed bitset per distinct value, built via integer codes."""
+    codes: Dict = {}
+    coded = np.fromiter(
+        (codes.setdefault(value, len(codes)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return {value: _pack(coded == code) for value, code in codes.items()}
+
+
+class SeatSuggestionIndex:
+    """Packed bitsets per feature, floor and seat type plus a live availability bitset.
+
+    Hard filters are bitwise ANDs over the packed sets; the surviving rows are
+    scored with vectorised integer arithmetic and the top ``limit`` picked with
+    ``argpartition`` so the cost does not depend on a full sort.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._ready = False
+        self._size = 0
+        self._positions: Dict[str, int] = {}
+        self._rows: List[tuple] = []
+        self._available = np.zeros(0, dtype=np.uint8)
+        self._features: Dict[str, np.ndarray] = {}
+        self._floors: Dict[str, np.ndarray] = {}
+        self._seat_types: Dict[SeatType, np.ndarray] = {}
+        self._classes = np.zeros(0, dtype=np.uint8)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return self._size
+
+    def rebuild(self, seats: Iterable[Seat]) -> None:
+        """Replace the index contents with the given seats (floor should be loaded)."""
+        rows: List[tuple] = []
+        positions: Dict[str, int] = {}
+        available, power, wifi, ac, accessible, capacity = [], [], [], [], [], []
+        floor_ids: List[str] = []
+        seat_types: List[SeatType] = []
+
+        for seat in seats:
+            floor_name = seat.floor.floor_name if seat.floor else None
+            has_wifi = bool(getattr(seat, "has_wifi", False))
+            positions[seat.id] = len(rows)
+            rows.append(
+                (
+                    seat.id,
+                    seat.seat_number,
+                    seat.floor_id,
+                    floor_name,
+                    seat.seat_type,
+                    bool(seat.has_power_outlet),
+                    has_wifi,
+                    bool(seat.has_ac),
+                    bool(seat.accessibility),
+                    seat.capacity or 1,
+                )
+            )
+            available.append(seat.status == SeatStatus.AVAILABLE)
+            power.append(bool(seat.has_power_outlet))
+            wifi.append(has_wifi)
+            ac.append(bool(seat.has_ac))
+            accessible.append(bool(seat.accessibility))
+            capacity.append(seat.capacity or 1)
+            floor_ids.append(seat.floor_id)
+            seat_types.append(SeatType(seat.seat_type))
+
+        power_mask = np.array(power, dtype=bool)
+        wifi_mask = np.array(wifi, dtype=bool)
+        ac_mask = np.array(ac, dtype=bool)
+        accessible_mask = np.array(accessible, dtype=bool)
+
+        classes = (
+            power_mask * _POWER_BIT
+            + wifi_mask * _WIFI_BIT
+            + ac_mask * _AC_BIT
+            + (np.array(capacity) > 1) * _CAPACITY_BIT
+            + accessible_mask * _ACCESSIBLE_BIT
+        ).astype(np.uint8)
+
+        features = {
+            "power": _pack(power_mask),
+            "wifi": _pack(wifi_mask),
+            "ac": _pack(ac_mask),
+            "accessibility": _pack(accessible_mask),
+        }
+        floors = _code_masks(floor_ids)
+        types = _code_masks(seat_types)
+
+        with self._lock:
+            self._rows = rows
+            self._positions = positions
+            self._size = len(rows)
+            self._available = _pack(np.array(available, dtype=bool))
+            self._features = features
+            self._floors = floors
+            self._seat_types = types
+            self._classes = classes
+            self._ready = True
+
+    def update_statuses(self, changes: Mapping[str, SeatStatus]) -> None:
+        """Apply seat status changes to the availability bitset."""
+        with self._lock:
+            if not self._ready:
+                return
+            for seat_id, status in changes.items():
+                position = self._positions.get(seat_id)
+                if position is None:
+                    # Unknown seat: layout changed underneath us, rebuild on next use.
+                    self._ready = False
+                    return
+                byte, bit = position >> 3, np.uint8(1 << (position & 7))
+                if status == SeatStatus.AVAILABLE:
+                    self._available[byte] |= bit
+                else:
+                    self._available[byte] &= ~bit
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next search rebuilds it."""
+        with self._lock:
+            self._ready = False
+
+    def search(self, request: SeatSuggestionRequest) -> List[IndexedSeat]:
+        with self._lock:
+            if self._size == 0:
+                return []
+            mask = self._available.copy()
+            if request.floor_id:
+                floor_bits = self._floors.get(request.floor_id)
+                if floor_bits is None:
+                    return []
+                mask &= floor_bits
+            if request.seat_type:
+                type_bits = self._seat_types.get(SeatType(request.seat_type))
+                if type_bits is None:
+                    return []
+                mask &= type_bits
+            if request.need_power is True:
+                mask &= self._features["power"]
+            if request.need_wifi is True:
+                mask &= self._features["wifi"]
+            if request.need_ac is True:
+                mask &= self._features["ac"]
+
+            candidates = np.flatnonzero(np.unpackbits(mask, count=self._size, bitorder="little"))
+            if candidates.size == 0:
+                return []
+
+            scores = self._score_table(request)[self._classes[candidates]]
+
+            # Higher score first, ties broken by index order (matches a stable sort).
+            keys = scores * (self._size + 1) + (self._size - candidates)
+            limit = min(request.limit, candidates.size)
+            if candidates.size > limit:
+                top = np.argpartition(-keys, limit - 1)[:limit]
+            else:
+                top = np.arange(candidates.size)
+            top = top[np.argsort(-keys[top])]
+
+            return [
+                IndexedSeat(*self._rows[candidates[i]], score=scores[i] / 10)
+                for i in top
+            ]
+
+    @classmethod
+    def _score_table(cls, request: SeatSuggestionRequest) -> np.ndarray:
+        """Score for each of the 32 feature classes under this request."""
+        classes = np.arange(_CLASS_COUNT)
+        table = np.full(_CLASS_COUNT, BASE_SCORE, dtype=np.int64)
+        table += ((classes & _POWER_BIT) > 0) * cls._bonus(
+            request.need_power, POWER_REQUIRED_BONUS, POWER_OPTIONAL_BONUS
+        )
+        table += ((classes & _WIFI_BIT) > 0) * cls._bonus(
+            request.need_wifi, WIFI_REQUIRED_BONUS, WIFI_OPTIONAL_BONUS
+        )
+        table += ((classes & _AC_BIT) > 0) * cls._bonus(
+            request.need_ac, AC_REQUIRED_BONUS, AC_OPTIONAL_BONUS
+        )
+        table += ((classes & _CAPACITY_BIT) > 0) * CAPACITY_BONUS
+        table += ((classes & _ACCESSIBLE_BIT) > 0) * ACCESSIBILITY_BONUS
+        return table
+
+    @staticmethod
+    def _bonus(preference: Optional[bool], required: int, optional: int) -> int:
+        if preference is True:
+            return required
+        if preference is False:
+            return optional
+        return 0
+
+
+seat_suggestion_index = SeatSuggestionIndex()
@@ -0,0 +1,65 @@
+"""
+Online-safe Alembic operations for tables that already hold live data.
+
+Use these from migration scripts instead of the bare ``op`` calls when adding
+indexes or columns to an existing table:
+
+- every helper is idempotent, so a database that already has the object
+  (e.g. one created by ``create_all``) migrates cleanly;
+- Postgres builds and drops indexes ``CONCURRENTLY`` outside the migration
+  transaction, so writes are not blocked while the index is built;
+- new columns must be nullable or carry a ``server_default`` so the table is
+  not rewritten (SQLite ``ADD COLUMN`` and Postgres 11+ both add such columns
+  as a metadata-only change).
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def index_exists(table: str, name: str) -> bool:
+    return any(index["name"] == name for index in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def column_exists(table: str, name: str) -> bool:
+    return any(column["name"] == name for column in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def create_index_online(name: str, table: str, columns: Sequence[str], **kwargs) -> None:
+    """Create an index without blocking writes; no-op if it already exists."""
+    if index_exists(table, name):
+        return
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+    else:
+        op.create_index(name, table, columns, **kwargs)
+
+
+def drop_index_online(name: str, table: str) -> None:
+    """Drop an index without blocking writes; no-op if it is already gone."""
+    if not index_exists(table, name):
+        return
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
+
+
+def add_column_online(table: str, column: sa.Column) -> None:
+    """Add a column without rewriting the table; no-op if it already exists."""
+    if not column.nullable and column.server_default is None:
+        raise ValueError(
+            f"Column {table}.{column.name} is NOT NULL without a server_default; "
+            "add it as nullable, backfill, then tighten it in a later migration"
+        )
+    if column_exists(table, column.name):
+        return
+    op.add_column(table, column)
@@ -16,8 +16,10 @@ from app.models.floor import Floor, FloorStatus
 from app.models.seat import Seat, SeatType, SeatStatus
 from app.models.reservation import Reservation
 from app.models.occupancy_history import OccupancyHistory
+from app.models.occupancy_rollup import OccupancyRollup
 from app.models.operating_hours import OperatingHours
 from app.models.lecturer_assignment import LecturerAssignment
+from app.services.occupancy_rollups import record_occupancy_rollups
 from app.utils.security import get_password_hash
 
 # Add parent directory to path
@@ -79,6 +81,7 @@ def main():
 def clear_database(db):
     """Clear all data from database."""
     print("🗑️  Clearing existing data...")
+    db.query(OccupancyRollup).delete()
     db.query(OccupancyHistory).delete()
     db.query(Reservation).delete()
     db.query(Seat).delete()
@@ -509,6 +512,7 @@ def create_occupancy_history(db, locations):
                 history_records.append(history)
 
     db.add_all(history_records)
+    record_occupancy_rollups(db, history_records)
     db.commit()
     print(f"✓ Created {len(history_records)} occupancy history records")
 
@@ -0,0 +1,544 @@
+"""
+Deterministic synthetic campus data for benchmarks.
+
+Follows the layout of mock_data: the same locations and per-location seat
+attribute rules, and every floor laid out from the seats.json floor plan
+(tiled when a floor holds more seats than the plan). Rows are plain column
+dicts, usable both for Core inserts and to build ORM objects in memory.
+load_synthetic_dataset() streams a full dataset (users, seats, occupancy
+history, reservations) into a SQLite database in batches.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.models.floor import Floor, FloorStatus
+from app.models.location import Location, LocationStatus, LocationType
+from app.models.occupancy_history import OccupancyHistory
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.seat import Seat, SeatStatus, SeatType
+from app.models.user import User, UserRole, UserStatus
+
+
+SEAT_LAYOUT_PATH = Path(__file__).with_name("seats.json")
+
+# Location names from mock_data; repeated with a number when more are needed
+LOCATION_NAMES = [
+    "JCU Library",
+    "Student Hub",
+    "Study Hub E",
+    "Study Hub A",
+    "Library",
+    "Study Pods",
+    "Yard",
+    "Auditorium C4-14",
+    "Auditorium C2-15",
+    "Lecture Room B1-05",
+]
+
+SEATS_PER_FLOOR = 500
+
+# bcrypt hash of "student123" for the synthetic accounts; fixed so datasets stay byte-for-byte reproducible
+SYNTHETIC_PASSWORD_HASH = "$2b$12$Z0keJfXsNhA5jsSpSdGOyOx6zYx82koDiL4GQ9eShzT84Wiy3Gwi."
+
+
+@dataclass(frozen=True)
+class DatasetShape:
+    locations: int
+    floors_per_location: int
+    seats_per_floor: int
+
+    @property
+    def total_floors(self) -> int:
+        return self.locations * self.floors_per_location
+
+    @property
+    def total_seats(self) -> int:
+        return self.total_floors * self.seats_per_floor
+
+    @classmethod
+    def for_seat_count(cls, seats: int, seats_per_floor: int = SEATS_PER_FLOOR) -> "DatasetShape":
+        """Spread `seats` over up to len(LOCATION_NAMES) locations of equal floors."""
+        seats_per_floor = min(seats, seats_per_floor)
+        floors = math.ceil(seats / seats_per_floor)
+        locations = min(len(LOCATION_NAMES), floors)
+        return cls(locations, math.ceil(floors / locations), seats_per_floor)
+
+
+# Second group of sequential_id(), keeping ids of different tables apart
+HISTORY_ID_GROUP = 1
+RESERVATION_ID_GROUP = 2
+
+
+def seeded_uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def sequential_id(seed: int, group: int, number: int) -> str:
+    """UUID-shaped id that increases with `number`, so bulk inserts append to the primary key index."""
+    return f"{seed & 0xFFFFFFFF:08x}-{group:04x}-4000-8000-{number:012x}"
+
+
+@lru_cache(maxsize=1)
+def seat_layout() -> List[Dict]:
+    with SEAT_LAYOUT_PATH.open() as handle:
+        return [
+            {"x": seat["x_coordinate"], "y": seat["y_coordinate"], "table_number": seat["table_number"]}
+            for seat in json.load(handle)
+        ]
+
+
+def location_name(number: int) -> str:
+    name = LOCATION_NAMES[number % len(LOCATION_NAMES)]
+    cycle = number // len(LOCATION_NAMES)
+    return f"{name} {cycle + 1}" if cycle else name
+
+
+def generate_locations(shape: DatasetShape, rng: random.Random, now: datetime) -> List[Dict]:
+    capacity = shape.floors_per_location * shape.seats_per_floor
+    return [
+        {
+            "id": seeded_uuid(rng),
+            "name": location_name(number),
+            "total_capacity": capacity,
+            "current_occupancy": 0,
+            "status": LocationStatus.OPEN,
+            "location_type": LocationType.PUBLIC,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for number in range(shape.locations)
+    ]
+
+
+def generate_floors(shape: DatasetShape, locations: Sequence[Dict], rng: random.Random, now: datetime) -> List[Dict]:
+    return [
+        {
+            "id": seeded_uuid(rng),
+            "location_id": location["id"],
+            "floor_number": floor_number,
+            "floor_name": f"Level {floor_number}",
+            "floor_map_url": "api/images/mockmap.svg",
+            "total_seats": shape.seats_per_floor,
+            "occupied_seats": 0,
+            "is_best_floor": floor_number == 1,
+            "status": FloorStatus.OPEN,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for location in locations
+        for floor_number in range(1, shape.floors_per_location + 1)
+    ]
+
+
+def _seat_features(location: str, rng: random.Random) -> Tuple[bool, bool, bool, bool]:
+    """(power, ac, quiet, accessible) following mock_data's per-location rules."""
+    if location.startswith("Study Pods"):
+        return True, False, False, False
+    if location.startswith("JCU Library"):
+        return rng.random() < 0.5, True, True, rng.random() < 0.5
+    if location.startswith("Yard"):
+        return False, False, False, False
+    return rng.random() < 0.5, rng.random() < 0.5, False, rng.random() < 0.5
+
+
+def iter_floor_seats(
+    floor: Dict,
+    location: str,
+    seats_per_floor: int,
+    rng: random.Random,
+    now: datetime,
+    occupied_ratio: float = 0.5,
+) -> Iterator[Dict]:
+    """Seats of one floor; the floor plan is tiled on a square grid past its own size."""
+    layout = seat_layout()
+    tiles = math.ceil(seats_per_floor / len(layout))
+    grid = math.ceil(math.sqrt(tiles))
+    tables_per_tile = max(seat["table_number"] for seat in layout)
+    prefix = location[:3].upper()
+    seat_types = list(SeatType)
+    for i in range(seats_per_floor):
+        tile, seat = divmod(i, len(layout))
+        position = layout[seat]
+        row, column = divmod(tile, grid)
+        power, ac, quiet, accessible = _seat_features(location, rng)
+        yield {
+            "id": seeded_uuid(rng),
+            "floor_id": floor["id"],
+            "seat_number": f"{prefix}-{floor['floor_number']}-{i + 1:03d}",
+            "seat_type": rng.choice(seat_types),
+            "table_number": tile * tables_per_tile + position["table_number"],
+            "has_power_outlet": power,
+            "has_ac": ac,
+            "is_quiet": quiet,
+            "accessibility": accessible,
+            "capacity": 1,
+            "x_coordinate": round((column + position["x"]) / grid, 4),
+            "y_coordinate": round((row + position["y"]) / grid, 4),
+            "status": SeatStatus.OCCUPIED if rng.random() < occupied_ratio else SeatStatus.AVAILABLE,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def generate_campus(shape: DatasetShape, seed: int = 42, now: Optional[datetime] = None) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Locations, floors and seats for `shape`; the same seed gives the same rows."""
+    rng = random.Random(seed)
+    now = now or datetime(2026, 1, 1)
+    locations = generate_locations(shape, rng, now)
+    floors = generate_floors(shape, locations, rng, now)
+    names = {location["id"]: location["name"] for location in locations}
+    seats = [
+        seat
+        for floor in floors
+        for seat in iter_floor_seats(floor, names[floor["location_id"]], shape.seats_per_floor, rng, now)
+    ]
+    return locations, floors, seats
+
+
+def occupancy_ratio(timestamp: datetime) -> float:
+    """Typical share of seats in use: busiest around 13:00, quieter at weekends."""
+    ratio = 0.15 + 0.65 * max(0.0, 1 - abs(timestamp.hour + timestamp.minute / 60 - 13) / 7)
+    return ratio * (0.5 if timestamp.weekday() >= 5 else 1.0)
+
+
+HISTORY_COLUMNS = (
+    "id", "location_id", "floor_id", "timestamp", "occupancy_count",
+    "total_capacity", "day_of_week", "hour_of_day", "recorded_at",
+)
+
+
+def iter_history_values(
+    floors: Sequence[Dict],
+    start: datetime,
+    days: int,
+    interval: timedelta,
+    rng: random.Random,
+    seed: int = 0,
+    timestamp_value: Callable[[datetime], object] = lambda timestamp: timestamp,
+    location_samples: bool = True,
+) -> Iterator[Tuple]:
+    """
+    Occupancy history every `interval` for `days` from `start`, as tuples in
+    HISTORY_COLUMNS order: one sample per floor and, with `location_samples`,
+    one per location (summed over its floors), like the occupancy sampler.
+    `timestamp_value` converts each tick's timestamp once, e.g. to the
+    database's text format.
+    """
+    locations: Dict[str, List[Dict]] = {}
+    for floor in floors:
+        locations.setdefault(floor["location_id"], []).append(floor)
+    ticks = int(timedelta(days=days) / interval)
+    number = 0
+    for tick in range(ticks):
+        timestamp = start + interval * tick
+        value = timestamp_value(timestamp)
+        day_of_week, hour = timestamp.weekday(), timestamp.hour
+        ratio = occupancy_ratio(timestamp)
+        for location_id, location_floors in locations.items():
+            location_count = location_capacity = 0
+            for floor in location_floors:
+                capacity = floor["total_seats"]
+                count = min(capacity, max(0, round(capacity * (ratio + rng.uniform(-0.08, 0.08)))))
+                location_count += count
+                location_capacity += capacity
+                yield (sequential_id(seed, HISTORY_ID_GROUP, number), location_id, floor["id"], value,
+                       count, capacity, day_of_week, hour, value)
+                number += 1
+            if location_samples:
+                yield (sequential_id(seed, HISTORY_ID_GROUP, number), location_id, None, value,
+                       location_count, location_capacity, day_of_week, hour, value)
+                number += 1
+
+
+def iter_history_rows(
+    floors: Sequence[Dict],
+    start: datetime,
+    days: int,
+    interval: timedelta,
+    rng: random.Random,
+    location_samples: bool = False,
+) -> Iterator[Dict]:
+    """iter_history_values as column dicts, per floor unless `location_samples`."""
+    for values in iter_history_values(floors, start, days, interval, rng, location_samples=location_samples):
+        yield dict(zip(HISTORY_COLUMNS, values))
+
+
+def generate_users(count: int, hashed_password: str, rng: random.Random, now: datetime) -> List[Dict]:
+    """Student accounts student000001@synthetic.jcu.edu.au... sharing one password hash."""
+    return [
+        {
+            "id": seeded_uuid(rng),
+            "email": f"student{number:06d}@synthetic.jcu.edu.au",
+            "hashed_password": hashed_password,
+            "student_id": f"SYN{number:07d}",
+            "name": f"Synthetic Student {number}",
+            "role": UserRole.STUDENT,
+            "status": UserStatus.ACTIVE,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+RESERVATION_COLUMNS = (
+    "id", "user_id", "seat_id", "start_time", "end_time", "check_in_time",
+    "status", "reminder_sent", "created_at", "updated_at",
+)
+
+
+def iter_reservation_values(
+    user_ids: Sequence[str],
+    seat_ids: Sequence[str],
+    start: datetime,
+    days: int,
+    per_day: int,
+    now: datetime,
+    rng: random.Random,
+    seed: int = 0,
+    timestamp_value: Callable[[datetime], object] = lambda timestamp: timestamp,
+) -> Iterator[Tuple]:
+    """
+    `per_day` reservations for each day from `start`, as tuples in
+    RESERVATION_COLUMNS order. Past ones are mostly completed (some
+    cancelled or no-shows); those not yet started are confirmed.
+    """
+    number = 0
+    for day in range(days):
+        opening = (start + timedelta(days=day)).replace(hour=8, minute=0, second=0, microsecond=0)
+        for _ in range(per_day):
+            begins = opening + timedelta(minutes=rng.randrange(0, 12 * 60, 30))
+            ends = begins + timedelta(minutes=rng.randrange(60, 241, 30))
+            created = begins - timedelta(hours=rng.randrange(1, 72))
+            check_in = None
+            if begins > now:
+                status = ReservationStatus.CONFIRMED
+            else:
+                roll = rng.random()
+                status = (
+                    ReservationStatus.COMPLETED if roll < 0.8
+                    else ReservationStatus.CANCELLED if roll < 0.9
+                    else ReservationStatus.NO_SHOW
+                )
+                if status == ReservationStatus.COMPLETED:
+                    check_in = timestamp_value(begins + timedelta(minutes=rng.randrange(0, 15)))
+            yield (
+                sequential_id(seed, RESERVATION_ID_GROUP, number),
+                rng.choice(user_ids),
+                rng.choice(seat_ids),
+                timestamp_value(begins),
+                timestamp_value(ends),
+                check_in,
+                status.name,
+                0,
+                timestamp_value(created),
+                timestamp_value(created),
+            )
+            number += 1
+
+
+# Bulk loading
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    shape: DatasetShape
+    history_days: int = 30
+    history_interval: timedelta = timedelta(minutes=15)
+    users: int = 1000
+    reservations_per_day: int = 500
+    seed: int = 42
+
+    @property
+    def history_rows(self) -> int:
+        """Rows in occupancy_history: per tick, one per floor and one per location."""
+        ticks = int(timedelta(days=self.history_days) / self.history_interval)
+        return ticks * (self.shape.total_floors + self.shape.locations)
+
+
+def sqlite_datetime(value: datetime) -> str:
+    """A DateTime value in the text format SQLAlchemy stores in SQLite."""
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _insert_batches(
+    conn: Connection, table, rows: Iterable, batch_size: int, columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    executemany `rows` in batches, committing after each so the WAL stays
+    small. Rows are column dicts, or with `columns` tuples already in the
+    database's storage format, which skip SQLAlchemy's per-value type
+    processing (the bulk of the cost at 100M rows).
+    """
+    raw = columns is not None
+    statement = table.insert()
+    if raw:
+        statement = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    inserted = 0
+    batch: List = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.exec_driver_sql(statement, batch) if raw else conn.execute(statement, batch)
+            conn.commit()
+            inserted += len(batch)
+            batch = []
+    if batch:
+        conn.exec_driver_sql(statement, batch) if raw else conn.execute(statement, batch)
+        conn.commit()
+        inserted += len(batch)
+    return inserted
+
+
+@contextmanager
+def _indexes_deferred(conn: Connection, table, progress: Callable[[str], None]) -> Iterator[None]:
+    """Drop `table`'s secondary indexes for a bulk load and build each once afterwards."""
+    # table.indexes is a set; a fixed order keeps the file layout reproducible
+    indexes = sorted(table.indexes, key=lambda index: index.name)
+    for index in indexes:
+        index.drop(conn)
+    conn.commit()
+    yield
+    started = time.perf_counter()
+    for index in indexes:
+        index.create(conn)
+    conn.commit()
+    progress(f"  {table.name} indexes rebuilt in {time.perf_counter() - started:.1f}s")
+
+
+def load_synthetic_dataset(
+    engine: Engine,
+    dataset: SyntheticDataset,
+    hashed_password: str = SYNTHETIC_PASSWORD_HASH,
+    end: Optional[datetime] = None,
+    batch_size: int = 50_000,
+    rebuild_rollups: bool = True,
+    progress: Callable[[str], None] = print,
+) -> Dict[str, int]:
+    """
+    Stream `dataset` into an empty, migrated SQLite database and return the
+    row count per table. History ends at `end` and reservations run from the
+    start of history to one day past it. Secondary indexes of the seat,
+    history and reservation tables are dropped during the load and rebuilt
+    afterwards, which is much faster than maintaining them per row.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError("load_synthetic_dataset writes SQLite's storage format; use a sqlite:// URL")
+
+    rng = random.Random(dataset.seed)
+    end = end or datetime(2026, 1, 1)
+    now = end
+    shape = dataset.shape
+    counts: Dict[str, int] = {}
+
+    def timed(label: str, started: float) -> None:
+        progress(f"  {label}: {counts.get(label, 0):,} rows in {time.perf_counter() - started:.1f}s")
+
+    with engine.connect() as conn:
+        # Durability is pointless while building a throwaway benchmark database
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+
+        started = time.perf_counter()
+        locations = generate_locations(shape, rng, now)
+        floors = generate_floors(shape, locations, rng, now)
+        counts["locations"] = _insert_batches(conn, Location.__table__, locations, batch_size)
+        counts["floors"] = _insert_batches(conn, Floor.__table__, floors, batch_size)
+        timed("floors", started)
+
+        started = time.perf_counter()
+        names = {location["id"]: location["name"] for location in locations}
+        seat_ids: List[str] = []
+        occupied: Dict[str, int] = {}
+
+        def seats() -> Iterator[Dict]:
+            for floor in floors:
+                for seat in iter_floor_seats(floor, names[floor["location_id"]], shape.seats_per_floor, rng, now):
+                    seat_ids.append(seat["id"])
+                    if seat["status"] == SeatStatus.OCCUPIED:
+                        occupied[floor["id"]] = occupied.get(floor["id"], 0) + 1
+                    yield seat
+
+        with _indexes_deferred(conn, Seat.__table__, progress):
+            counts["seats"] = _insert_batches(conn, Seat.__table__, seats(), batch_size)
+        floor_table, location_table = Floor.__table__, Location.__table__
+        conn.execute(
+            floor_table.update().where(floor_table.c.id == bindparam("floor_id")).values(
+                occupied_seats=bindparam("occupied"), updated_at=now,
+            ),
+            [{"floor_id": floor["id"], "occupied": occupied.get(floor["id"], 0)} for floor in floors],
+        )
+        per_location: Dict[str, int] = {}
+        for floor in floors:
+            per_location[floor["location_id"]] = per_location.get(floor["location_id"], 0) + occupied.get(floor["id"], 0)
+        conn.execute(
+            location_table.update().where(location_table.c.id == bindparam("location_id")).values(
+                current_occupancy=bindparam("occupied"), updated_at=now,
+            ),
+            [{"location_id": location_id, "occupied": count} for location_id, count in per_location.items()],
+        )
+        conn.commit()
+        timed("seats", started)
+
+        started = time.perf_counter()
+        users = generate_users(dataset.users, hashed_password, rng, now)
+        counts["users"] = _insert_batches(conn, User.__table__, users, batch_size)
+        timed("users", started)
+
+        history_start = end - timedelta(days=dataset.history_days)
+        with _indexes_deferred(conn, OccupancyHistory.__table__, progress):
+            started = time.perf_counter()
+            counts["occupancy_history"] = _insert_batches(
+                conn,
+                OccupancyHistory.__table__,
+                iter_history_values(floors, history_start, dataset.history_days, dataset.history_interval,
+                                    rng, dataset.seed, sqlite_datetime),
+                batch_size,
+                HISTORY_COLUMNS,
+            )
+            timed("occupancy_history", started)
+
+        if users and dataset.reservations_per_day:
+            with _indexes_deferred(conn, Reservation.__table__, progress):
+                started = time.perf_counter()
+                counts["reservations"] = _insert_batches(
+                    conn,
+                    Reservation.__table__,
+                    iter_reservation_values([user["id"] for user in users], seat_ids, history_start,
+                                            dataset.history_days + 1, dataset.reservations_per_day, now,
+                                            rng, dataset.seed, sqlite_datetime),
+                    batch_size,
+                    RESERVATION_COLUMNS,
+                )
+                timed("reservations", started)
+
+        conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+
+    if rebuild_rollups and counts.get("occupancy_history"):
+        from app.services.occupancy_rollups import rebuild_occupancy_rollups
+
+        started = time.perf_counter()
+        with Session(bind=engine) as db:
+            rebuild_occupancy_rollups(db)
+        progress(f"  occupancy_rollups rebuilt in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    progress(f"  ANALYZE in {time.perf_counter() - started:.1f}s")
+    return counts
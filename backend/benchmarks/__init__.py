@@ -0,0 +1,8 @@
+"""
+Microbenchmarks for the core services, with stored baselines.
+
+Run from the backend directory:
+    python -m benchmarks run
+    python -m benchmarks compare
+See `python -m benchmarks --help`.
+"""
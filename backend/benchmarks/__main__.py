@@ -0,0 +1,100 @@
+"""Command line for the benchmark suite.
+
+Usage:
+    python -m benchmarks run --seats 1000 10000 100000 --output results.json
+    python -m benchmarks run -k occupancy --save-baseline   # re-record only the occupancy cases
+    python -m benchmarks compare [--baseline benchmarks/baselines/default.json] results.json
+    python -m benchmarks run --compare      # run, then compare with the baseline
+
+`compare` exits with status 1 when a benchmark regressed, so it can gate CI,
+and lists the baseline benchmarks the results did not cover. --save-baseline
+merges the results into the existing baseline.
+Baselines are machine specific: record one on the machine that compares.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("DEBUG", "false")
+
+from benchmarks.runner import (  # noqa: E402
+    DEFAULT_BASELINE,
+    compare,
+    load_results,
+    merge_results,
+    not_compared,
+    print_comparison,
+    run_suite,
+    save_results,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Core service microbenchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite")
+    run.add_argument("--seats", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    run.add_argument("-k", dest="pattern", help="Only benchmarks whose name contains this")
+    run.add_argument("--repeat", type=int, default=5, help="Timed samples per benchmark")
+    run.add_argument("--output", type=Path, help="Write the results as JSON")
+    run.add_argument("--save-baseline", action="store_true",
+                     help="Store the results in the baseline, replacing the benchmarks that were run")
+    run.add_argument("--compare", action="store_true", help="Compare the results with the baseline")
+    add_compare_options(run)
+
+    check = commands.add_parser("compare", help="Compare a results file with the baseline")
+    check.add_argument("results", type=Path)
+    add_compare_options(check)
+    return parser
+
+
+def add_compare_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Slowdown (fraction of the baseline median) that counts as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+
+
+def check_against_baseline(report, args: argparse.Namespace) -> int:
+    if not args.baseline.exists():
+        print(f"❌ No baseline at {args.baseline}; record one with `run --save-baseline`", file=sys.stderr)
+        return 2
+    baseline = load_results(args.baseline)
+    rows = compare(baseline, report, args.threshold, args.min_delta_ms)
+    print_comparison(rows, baseline, report)
+    skipped = not_compared(baseline, report)
+    if skipped:
+        print(f"\n⚠️ {len(skipped)} baseline benchmark(s) not compared (no result): {', '.join(skipped)}")
+    regressions = [row["benchmark"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\n✅ No regressions over {args.threshold:.0%} across {len(rows)} benchmarks")
+    return 0
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.command == "compare":
+        return check_against_baseline(load_results(args.results), args)
+
+    report = run_suite(args.seats, args.pattern, args.repeat)
+    if args.output:
+        save_results(report, args.output)
+    status = check_against_baseline(report, args) if args.compare else 0
+    if args.save_baseline:
+        if args.baseline.exists():
+            report = merge_results(load_results(args.baseline), report)
+        save_results(report, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
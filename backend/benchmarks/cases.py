@@ -0,0 +1,350 @@
+"""Benchmark cases for the core services.
+
+Each case is a setup function registered with @case. Setup runs untimed
+and returns the zero-argument callable that is timed. Sized cases receive
+the seat count of the run; fixtures come from app.utils.synthetic_data and
+are cached per seat count.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.floor import Floor
+from app.models.location import Location
+from app.models.occupancy_history import OccupancyHistory
+from app.models.seat import Seat
+from app.utils.synthetic_data import (
+    DatasetShape,
+    generate_campus,
+    iter_history_rows,
+    location_name,
+)
+
+
+SEED = 42
+# Fixed clock so fixtures, and therefore timings, do not depend on the day of the run
+NOW = datetime(2026, 3, 2, 12)
+HISTORY_DAYS = 7
+HISTORY_INTERVAL = timedelta(minutes=15)
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[..., Callable[[], object]]
+    sized: bool
+    # Upper bound on timed repeats, for cases that take seconds per call
+    max_repeat: int
+
+
+CASES: Dict[str, Case] = {}
+_open_sessions: List[Session] = []
+
+
+def case(name: str, sized: bool = True, max_repeat: int = 0):
+    def register(setup):
+        CASES[name] = Case(name, setup, sized, max_repeat)
+        return setup
+    return register
+
+
+# Fixtures
+
+
+@lru_cache(maxsize=1)
+def campus_rows(seats: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    return generate_campus(DatasetShape.for_seat_count(seats), seed=SEED, now=NOW)
+
+
+def orm_seats(seats: int) -> List[Seat]:
+    """Transient Seat objects with floor and location attached, as the worker loads them."""
+    locations, floors, seat_rows = campus_rows(seats)
+    location_objects = {row["id"]: Location(**row) for row in locations}
+    floor_objects = {}
+    for row in floors:
+        floor = Floor(**row)
+        floor.location = location_objects[row["location_id"]]
+        floor_objects[row["id"]] = floor
+    seat_objects = []
+    for row in seat_rows:
+        seat = Seat(**row)
+        seat.floor = floor_objects[row["floor_id"]]
+        seat_objects.append(seat)
+    return seat_objects
+
+
+@lru_cache(maxsize=1)
+def shared_orm_seats(seats: int) -> List[Seat]:
+    """orm_seats for cases that only read them."""
+    return orm_seats(seats)
+
+
+@lru_cache(maxsize=1)
+def occupancy_database(seats: int) -> Session:
+    """In-memory SQLite with HISTORY_DAYS of per-floor and per-location history and its rollups."""
+    from app.services.occupancy_rollups import rebuild_occupancy_rollups
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    locations, floors, _ = campus_rows(seats)
+    start = NOW - timedelta(days=HISTORY_DAYS)
+    with engine.begin() as conn:
+        conn.execute(Location.__table__.insert(), locations)
+        conn.execute(Floor.__table__.insert(), floors)
+        batch = []
+        for row in iter_history_rows(
+            floors, start, HISTORY_DAYS, HISTORY_INTERVAL, random.Random(SEED), location_samples=True,
+        ):
+            batch.append(row)
+            if len(batch) >= 50_000:
+                conn.execute(OccupancyHistory.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(OccupancyHistory.__table__.insert(), batch)
+    db = Session(bind=engine)
+    rebuild_occupancy_rollups(db)
+    _open_sessions.append(db)
+    return db
+
+
+def clear_fixtures() -> None:
+    campus_rows.cache_clear()
+    shared_orm_seats.cache_clear()
+    occupancy_database.cache_clear()
+    while _open_sessions:
+        db = _open_sessions.pop()
+        engine = db.get_bind()
+        db.close()
+        engine.dispose()
+
+
+# Seat refresh worker
+
+
+@case("seat_refresh.build_snapshot")
+def build_snapshot(seats: int):
+    from app.services.seat_refresh_worker import SeatRefreshWorker
+
+    worker = SeatRefreshWorker()
+    seat_objects = shared_orm_seats(seats)
+    return lambda: worker._build_snapshot(seat_objects)
+
+
+@case("seat_refresh.apply_drift")
+def apply_drift(seats: int):
+    from app.services.seat_refresh_worker import SeatRefreshWorker
+
+    worker = SeatRefreshWorker()
+    # Drift mutates the seats, so this case gets its own copy
+    seat_objects = orm_seats(seats)
+    random.seed(SEED)
+    return lambda: worker._apply_drift(seat_objects)
+
+
+# Suggestions and AI assistant
+
+
+@case("suggestions.suggest")
+def suggest(seats: int):
+    from app.schemas.prediction import SeatSuggestionRequest
+    from app.services.suggestion_index import SeatSuggestionIndex
+    from app.services.suggestion_service import SeatSuggestionService
+
+    index = SeatSuggestionIndex()
+    index.rebuild(shared_orm_seats(seats))
+    service = SeatSuggestionService(db=None, index=index)
+    requests = [SeatSuggestionRequest(), SeatSuggestionRequest(need_power=True, need_ac=True)]
+    return lambda: [service.suggest(request) for request in requests]
+
+
+@case("ai_assistant.parse_highlight_ids")
+def parse_highlight_ids(seats: int):
+    from app.services.ai_assistant_service import AiAssistantService
+
+    # Parsing needs no database, Gemini client or dataset
+    service = AiAssistantService.__new__(AiAssistantService)
+    seat_details = [
+        {"seat_id": seat["id"], "seat_number": seat["seat_number"]}
+        for seat in campus_rows(seats)[2]
+    ]
+    picked = seat_details[:: max(1, len(seat_details) // 5)][:5]
+    listed = (
+        "Seats " + ", ".join(detail["seat_number"] for detail in picked) + " are free on Level 1.\n"
+        "highlight_seats_list: [" + ", ".join(detail["seat_id"] for detail in picked) + "]"
+    )
+    # Without the list line the parser scans the reply for every seat number
+    unlisted = "Seats " + ", ".join(detail["seat_number"] for detail in picked) + " are free on Level 1."
+    return lambda: (
+        service._parse_highlight_ids(listed, seat_details),
+        service._parse_highlight_ids(unlisted, seat_details),
+    )
+
+
+# Seating dataset and forecast
+
+
+@case("seating_data.summary")
+def seating_summary(seats: int):
+    from app.services.seating_data import SeatingDataService, SeatingRecord
+
+    # One recorded visit per seat
+    rng = random.Random(SEED)
+    start = NOW - timedelta(days=90)
+    records = []
+    for number in range(seats):
+        arrival = start + timedelta(days=rng.randrange(90), minutes=rng.randrange(8 * 60, 20 * 60, 15))
+        records.append(
+            SeatingRecord(
+                location=location_name(number % 40),
+                arrival_time=arrival,
+                leaving_time=arrival + timedelta(minutes=rng.randrange(30, 240, 15)),
+                temperature=float(rng.randrange(21, 28)),
+                power_plugs=rng.random() < 0.5,
+            )
+        )
+    service = SeatingDataService("unused.csv")
+    service._records = records
+    service._loaded = True
+
+    def run():
+        service._summary = None
+        return service.summary()
+
+    return run
+
+
+@case("forecast.weekly", sized=False, max_repeat=3)
+def weekly_forecast():
+    from app.utils.forecast_service import ForecastService
+
+    service = ForecastService()
+    if service.model is None or service.config is None:
+        raise RuntimeError("ARIMA model or config missing under ml/")
+    # The horizon grows with the time since training (it is over a year in
+    # the shipped config), which would make the timing drift day by day
+    service.config = dict(service.config)
+    today = datetime.now().replace(hour=23, minute=0, second=0, microsecond=0)
+    service.config["last_training_date"] = (today - timedelta(days=14)).strftime("%Y-%m-%d %H:%M:%S")
+    return service.get_weekly_forecast
+
+
+# Occupancy aggregation
+
+
+@case("occupancy.record_rollups")
+def record_rollups(seats: int):
+    from app.services.occupancy_rollups import record_occupancy_rollups
+    from app.services.occupancy_sampler import OccupancySample
+
+    db = occupancy_database(seats)
+    floors = campus_rows(seats)[1]
+    # One sampler tick: a sample per floor, folded into existing buckets
+    timestamp = NOW - HISTORY_INTERVAL
+    samples = [
+        OccupancySample(f"bench-{i}", floor["location_id"], floor["id"], timestamp, 100, floor["total_seats"],
+                        timestamp.weekday(), timestamp.hour, timestamp)
+        for i, floor in enumerate(floors)
+    ]
+
+    def run():
+        record_occupancy_rollups(db, samples)
+        db.flush()
+        db.rollback()
+
+    return run
+
+
+@case("occupancy.rollup_trends")
+def rollup_trends(seats: int):
+    from app.services.occupancy_rollups import get_occupancy_trends
+
+    db = occupancy_database(seats)
+    start = NOW - timedelta(days=HISTORY_DAYS)
+    return lambda: get_occupancy_trends(db, "hour", start)
+
+
+@case("occupancy.history_trends")
+def history_trends(seats: int):
+    from app.services.occupancy_rollups import get_history_trends
+
+    db = occupancy_database(seats)
+    start = NOW - timedelta(days=HISTORY_DAYS)
+    return lambda: get_history_trends(db, "hour", start)
+
+
+# Request instrumentation overhead: compare each *_instrumented case with its *_plain twin
+
+
+def _asgi_get(app, path: str) -> Callable[[], object]:
+    """One GET through the ASGI app, without a server or HTTP client in the way."""
+    loop = asyncio.new_event_loop()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # The router adds to the scope, so every request gets a fresh copy
+    return lambda: loop.run_until_complete(app(dict(scope), receive, send))
+
+
+def _item_app(instrumented: bool):
+    from fastapi import FastAPI
+
+    from app.services.metrics import MetricsMiddleware
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id, "name": f"item {item_id}"}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+@case("metrics.request_plain", sized=False)
+def request_plain():
+    return _asgi_get(_item_app(instrumented=False), "/items/42")
+
+
+@case("metrics.request_instrumented", sized=False)
+def request_instrumented():
+    return _asgi_get(_item_app(instrumented=True), "/items/42")
+
+
+def _select_one_batch(instrumented: bool) -> Callable[[], object]:
+    from app.services.metrics import install_query_hooks
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    if instrumented:
+        install_query_hooks(engine)
+    conn = engine.connect()
+    statement = text("SELECT 1")
+    return lambda: [conn.execute(statement).scalar() for _ in range(100)]
+
+
+@case("metrics.queries_plain", sized=False)
+def queries_plain():
+    return _select_one_batch(instrumented=False)
+
+
+@case("metrics.queries_instrumented", sized=False)
+def queries_instrumented():
+    return _select_one_batch(instrumented=True)
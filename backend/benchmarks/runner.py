@@ -0,0 +1,161 @@
+"""Timing, result files and baseline comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from benchmarks.cases import CASES, clear_fixtures
+
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_BASELINE = BASELINE_DIR / "default.json"
+
+# Aim for samples of at least this long, so short calls are looped
+MIN_SAMPLE_SECONDS = 0.05
+
+
+def result_key(name: str, seats: Optional[int]) -> str:
+    return name if seats is None else f"{name}[seats={seats}]"
+
+
+def machine_info() -> Dict:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "git_revision": revision,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def time_callable(run: Callable[[], object], repeat: int) -> Dict:
+    """Median/min/stdev per call over `repeat` samples, each looping short calls."""
+    gc.collect()
+    started = time.perf_counter()
+    run()
+    first = time.perf_counter() - started
+    loops = max(1, int(MIN_SAMPLE_SECONDS / first)) if first > 0 else 1000
+
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(loops):
+                run()
+            samples.append((time.perf_counter() - started) / loops * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run_suite(seat_counts: Iterable[int], pattern: Optional[str] = None, repeat: int = 5) -> Dict:
+    selected = [case for name, case in CASES.items() if pattern is None or pattern in name]
+    results: Dict[str, Dict] = {}
+
+    def record(key: str, run_factory: Callable[[], Callable[[], object]], case_repeat: int) -> None:
+        started = time.perf_counter()
+        run = run_factory()
+        setup_seconds = time.perf_counter() - started
+        results[key] = time_callable(run, case_repeat)
+        print(
+            f"{key:<52} {results[key]['median_ms']:>12.3f} ms  "
+            f"(±{results[key]['stdev_ms']:.3f}, x{results[key]['loops']}, setup {setup_seconds:.1f}s)",
+            flush=True,
+        )
+
+    for case in selected:
+        if not case.sized:
+            record(result_key(case.name, None), case.setup, min(repeat, case.max_repeat or repeat))
+    for seats in seat_counts:
+        for case in selected:
+            if case.sized:
+                record(result_key(case.name, seats), lambda: case.setup(seats), min(repeat, case.max_repeat or repeat))
+        clear_fixtures()
+    return {"meta": machine_info(), "results": results}
+
+
+def load_results(path: Path) -> Dict:
+    return json.loads(Path(path).read_text())
+
+
+def save_results(report: Dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def merge_results(baseline: Dict, report: Dict) -> Dict:
+    """`report` on top of `baseline`, so a filtered run only replaces the benchmarks it ran."""
+    return {"meta": report["meta"], "results": {**baseline["results"], **report["results"]}}
+
+
+def not_compared(baseline: Dict, current: Dict) -> List[str]:
+    """Baseline benchmarks that `current` has no result for."""
+    return [key for key in baseline["results"] if key not in current["results"]]
+
+
+def compare(baseline: Dict, current: Dict, threshold: float, min_delta_ms: float) -> List[Dict]:
+    """
+    Per benchmark present in both reports: the median ratio and whether it
+    regressed, i.e. got slower by more than `threshold` (a fraction) and by
+    at least `min_delta_ms`, which keeps tiny noisy timings from failing.
+    """
+    rows = []
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        before, after = reference["median_ms"], result["median_ms"]
+        ratio = after / before if before else float("inf")
+        rows.append({
+            "benchmark": key,
+            "baseline_ms": before,
+            "current_ms": after,
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + threshold and after - before >= min_delta_ms,
+            "improvement": ratio < 1 - threshold and before - after >= min_delta_ms,
+        })
+    return rows
+
+
+def print_comparison(rows: List[Dict], baseline: Dict, current: Dict) -> None:
+    base_meta, current_meta = baseline.get("meta", {}), current.get("meta", {})
+    for field in ("platform", "python", "cpu_count"):
+        if base_meta.get(field) != current_meta.get(field):
+            print(
+                f"⚠️ Baseline {field} differs ({base_meta.get(field)} vs {current_meta.get(field)}); "
+                "timings may not be comparable",
+                file=sys.stderr,
+            )
+    print(f"{'benchmark':<52} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else "  faster" if row["improvement"] else ""
+        print(
+            f"{row['benchmark']:<52} {row['baseline_ms']:>10.3f}ms {row['current_ms']:>10.3f}ms "
+            f"{row['ratio']:>7.2f}{flag}"
+        )
@@ -0,0 +1,34 @@
+"""worker snapshots
+
+Table holding the seat refresh snapshot published by the leader process so
+every uvicorn worker serves the same data.
+
+Revision ID: 5d2a7e9c1b44
+Revises: 8c4e6b2f7a31
+Create Date: 2026-10-19 15:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a7e9c1b44'
+down_revision = '8c4e6b2f7a31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'worker_snapshots',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('owner', sa.String(length=128), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('worker_snapshots')
@@ -0,0 +1,52 @@
+"""hot query indexes
+
+Composite indexes for the seat availability, occupancy history and
+reservation lookups, plus a partial index over available seats for the
+feature filters on /api/seats/available.
+
+Revision ID: 8c4e6b2f7a31
+Revises: 3f1c2a9d8b10
+Create Date: 2026-10-19 09:30:00.000000
+"""
+import sqlalchemy as sa
+
+from app.utils.migration_ops import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e6b2f7a31'
+down_revision = '3f1c2a9d8b10'
+branch_labels = None
+depends_on = None
+
+AVAILABLE_ONLY = sa.text("status = 'AVAILABLE'")
+
+
+def upgrade() -> None:
+    create_index_online('ix_seats_floor_id_status', 'seats', ['floor_id', 'status'])
+    create_index_online('ix_seats_status_id', 'seats', ['status', 'id'])
+    create_index_online(
+        'ix_seats_available_features',
+        'seats',
+        ['has_power_outlet', 'has_ac', 'is_quiet'],
+        sqlite_where=AVAILABLE_ONLY,
+        postgresql_where=AVAILABLE_ONLY,
+    )
+    create_index_online(
+        'ix_occupancy_history_location_id_timestamp',
+        'occupancy_history',
+        ['location_id', 'timestamp'],
+    )
+    create_index_online('ix_reservations_user_id_start_time', 'reservations', ['user_id', 'start_time'])
+    create_index_online('ix_reservations_seat_id_status', 'reservations', ['seat_id', 'status'])
+    create_index_online('ix_reservations_created_at', 'reservations', ['created_at'])
+
+
+def downgrade() -> None:
+    drop_index_online('ix_reservations_created_at', 'reservations')
+    drop_index_online('ix_reservations_seat_id_status', 'reservations')
+    drop_index_online('ix_reservations_user_id_start_time', 'reservations')
+    drop_index_online('ix_occupancy_history_location_id_timestamp', 'occupancy_history')
+    drop_index_online('ix_seats_available_features', 'seats')
+    drop_index_online('ix_seats_status_id', 'seats')
+    drop_index_online('ix_seats_floor_id_status', 'seats')
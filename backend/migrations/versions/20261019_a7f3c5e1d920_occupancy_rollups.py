@@ -0,0 +1,105 @@
+"""occupancy rollups
+
+Hourly and daily occupancy aggregates per location/floor, backfilled from
+the existing occupancy_history rows.
+
+Revision ID: a7f3c5e1d920
+Revises: 5d2a7e9c1b44
+Create Date: 2026-10-19 16:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7f3c5e1d920'
+down_revision = '5d2a7e9c1b44'
+branch_labels = None
+depends_on = None
+
+history = sa.table(
+    'occupancy_history',
+    sa.column('location_id', sa.String),
+    sa.column('floor_id', sa.String),
+    sa.column('timestamp', sa.DateTime),
+    sa.column('occupancy_count', sa.Integer),
+    sa.column('total_capacity', sa.Integer),
+)
+rollups = sa.table(
+    'occupancy_rollups',
+    sa.column('granularity', sa.String),
+    sa.column('bucket_start', sa.DateTime),
+    sa.column('location_id', sa.String),
+    sa.column('floor_id', sa.String),
+    sa.column('sample_count', sa.Integer),
+    sa.column('occupancy_sum', sa.Integer),
+    sa.column('occupancy_min', sa.Integer),
+    sa.column('occupancy_max', sa.Integer),
+    sa.column('percentage_sum', sa.Float),
+)
+
+
+def _bucket(granularity: str):
+    if op.get_bind().dialect.name == 'sqlite':
+        pattern = '%Y-%m-%d %H:00:00.000000' if granularity == 'hour' else '%Y-%m-%d 00:00:00.000000'
+        return sa.func.strftime(pattern, history.c.timestamp)
+    return sa.func.date_trunc(granularity, history.c.timestamp)
+
+
+def _backfill(granularity: str) -> None:
+    bucket = _bucket(granularity)
+    percentage = sa.case(
+        (history.c.total_capacity > 0, history.c.occupancy_count * 100.0 / history.c.total_capacity),
+        else_=0.0,
+    )
+    aggregates = sa.select(
+        sa.literal(granularity),
+        bucket,
+        history.c.location_id,
+        history.c.floor_id,
+        sa.func.count(),
+        sa.func.sum(history.c.occupancy_count),
+        sa.func.min(history.c.occupancy_count),
+        sa.func.max(history.c.occupancy_count),
+        sa.func.sum(percentage),
+    ).group_by(bucket, history.c.location_id, history.c.floor_id)
+    op.execute(
+        rollups.insert().from_select(
+            ['granularity', 'bucket_start', 'location_id', 'floor_id', 'sample_count',
+             'occupancy_sum', 'occupancy_min', 'occupancy_max', 'percentage_sum'],
+            aggregates,
+        )
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'occupancy_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('granularity', sa.String(length=8), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('location_id', sa.String(length=36), nullable=False),
+        sa.Column('floor_id', sa.String(length=36), nullable=True),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('occupancy_sum', sa.Integer(), nullable=False),
+        sa.Column('occupancy_min', sa.Integer(), nullable=False),
+        sa.Column('occupancy_max', sa.Integer(), nullable=False),
+        sa.Column('percentage_sum', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['floor_id'], ['floors.id'], ),
+        sa.ForeignKeyConstraint(['location_id'], ['locations.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_occupancy_rollups_granularity_bucket', 'occupancy_rollups', ['granularity', 'bucket_start'])
+    op.create_index(
+        'ix_occupancy_rollups_granularity_location_bucket',
+        'occupancy_rollups',
+        ['granularity', 'location_id', 'bucket_start'],
+    )
+    for granularity in ('hour', 'day'):
+        _backfill(granularity)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_occupancy_rollups_granularity_location_bucket', table_name='occupancy_rollups')
+    op.drop_index('ix_occupancy_rollups_granularity_bucket', table_name='occupancy_rollups')
+    op.drop_table('occupancy_rollups')
@@ -0,0 +1,167 @@
+"""Check that the hot seat/occupancy/reservation queries are served by indexes.
+
+Runs EXPLAIN QUERY PLAN (SQLite) or EXPLAIN (Postgres) for every query in
+HOT_QUERIES against a migrated database and exits non-zero if any of them
+falls back to a full table scan.
+
+Usage:
+    python scripts/audit_query_plans.py
+    python scripts/audit_query_plans.py --database-url postgresql://... --verbose
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import create_engine, func, inspect, select  # noqa: E402
+from sqlalchemy.engine import Connection  # noqa: E402
+from sqlalchemy.sql import Select  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models.floor import Floor  # noqa: E402
+from app.models.occupancy_history import OccupancyHistory  # noqa: E402
+from app.models.occupancy_rollup import OccupancyRollup  # noqa: E402
+from app.models.reservation import Reservation, ReservationStatus  # noqa: E402
+from app.models.seat import Seat, SeatStatus  # noqa: E402
+
+
+# Placeholder values: plans depend on the shape of the query, not the ids.
+SAMPLE_ID = "00000000-0000-0000-0000-000000000000"
+SINCE = datetime(2025, 1, 1) - timedelta(days=7)
+
+HOT_QUERIES: Dict[str, Select] = {
+    "floor occupied count": select(func.count()).select_from(Seat).where(
+        Seat.floor_id == SAMPLE_ID, Seat.status == SeatStatus.OCCUPIED
+    ),
+    "location occupied count": select(func.count()).select_from(Seat).join(Floor).where(
+        Floor.location_id == SAMPLE_ID, Seat.status == SeatStatus.OCCUPIED
+    ),
+    "seats by floor and status": select(Seat).where(
+        Seat.floor_id == SAMPLE_ID, Seat.status == SeatStatus.AVAILABLE
+    ).order_by(Seat.id).limit(100),
+    "seats by status (keyset page)": select(Seat).where(
+        Seat.status == SeatStatus.AVAILABLE, Seat.id > SAMPLE_ID
+    ).order_by(Seat.id).limit(100),
+    "available seats with power": select(Seat).where(
+        Seat.status == SeatStatus.AVAILABLE, Seat.has_power_outlet.is_(True)
+    ).limit(100),
+    "available quiet seats with power and ac": select(Seat).where(
+        Seat.status == SeatStatus.AVAILABLE,
+        Seat.has_power_outlet.is_(True),
+        Seat.has_ac.is_(True),
+        Seat.is_quiet.is_(True),
+    ).limit(100),
+    "location occupancy history window": select(OccupancyHistory).where(
+        OccupancyHistory.location_id == SAMPLE_ID, OccupancyHistory.timestamp >= SINCE
+    ).order_by(OccupancyHistory.timestamp),
+    "latest location occupancy": select(OccupancyHistory).where(
+        OccupancyHistory.location_id == SAMPLE_ID
+    ).order_by(OccupancyHistory.timestamp.desc()).limit(100),
+    "occupancy history window": select(OccupancyHistory).where(
+        OccupancyHistory.timestamp >= SINCE
+    ).order_by(OccupancyHistory.timestamp),
+    "hourly rollup trend": select(
+        OccupancyRollup.bucket_start, func.sum(OccupancyRollup.sample_count)
+    ).where(
+        OccupancyRollup.granularity == "hour",
+        OccupancyRollup.floor_id.is_(None),
+        OccupancyRollup.bucket_start >= SINCE,
+    ).group_by(OccupancyRollup.bucket_start).order_by(OccupancyRollup.bucket_start),
+    "location daily rollup trend": select(
+        OccupancyRollup.bucket_start, func.sum(OccupancyRollup.sample_count)
+    ).where(
+        OccupancyRollup.granularity == "day",
+        OccupancyRollup.location_id == SAMPLE_ID,
+        OccupancyRollup.floor_id.is_(None),
+        OccupancyRollup.bucket_start >= SINCE,
+    ).group_by(OccupancyRollup.bucket_start).order_by(OccupancyRollup.bucket_start),
+    "user reservations": select(Reservation).where(
+        Reservation.user_id == SAMPLE_ID
+    ).order_by(Reservation.start_time.desc()),
+    "open reservations for seat": select(Reservation).where(
+        Reservation.seat_id == SAMPLE_ID,
+        Reservation.status.in_(
+            [ReservationStatus.PENDING, ReservationStatus.CONFIRMED, ReservationStatus.ACTIVE]
+        ),
+    ),
+    "reservations created since": select(Reservation).where(Reservation.created_at >= SINCE),
+}
+
+# "SCAN seats" is a full table scan; "SCAN seats USING INDEX ..." walks an index.
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Audit query plans of hot queries")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not just failures")
+    return parser
+
+
+def render(statement: Select, connection: Connection) -> str:
+    return str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def explain(connection: Connection, sql: str) -> Tuple[List[str], List[str]]:
+    """Return (plan lines, tables read with a full scan)."""
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        lines = [row[3] for row in rows]
+        pattern = SQLITE_FULL_SCAN
+    else:
+        rows = connection.exec_driver_sql(f"EXPLAIN {sql}").fetchall()
+        lines = [row[0] for row in rows]
+        pattern = POSTGRES_FULL_SCAN
+
+    scanned = []
+    for line in lines:
+        match = pattern.search(line.strip())
+        if match:
+            scanned.append(match.group(1))
+    return lines, scanned
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    engine = create_engine(args.database_url)
+
+    missing = [table for table in ("seats", "occupancy_history", "reservations") if not inspect(engine).has_table(table)]
+    if missing:
+        print(f"Missing tables {', '.join(missing)}; run `alembic upgrade head` first.")
+        return 2
+
+    failures = 0
+    with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # Small tables make the planner prefer sequential scans even when a
+            # usable index exists; forbid them so only missing indexes show up.
+            connection.exec_driver_sql("SET enable_seqscan = off")
+
+        for name, statement in HOT_QUERIES.items():
+            lines, scanned = explain(connection, render(statement, connection))
+            failed = bool(scanned)
+            failures += failed
+            label = f"FULL SCAN ({', '.join(scanned)})" if failed else "ok"
+            print(f"{name:<42} {label}")
+            if failed or args.verbose:
+                for line in lines:
+                    print(f"    {line}")
+
+    engine.dispose()
+    print(f"\n{len(HOT_QUERIES) - failures}/{len(HOT_QUERIES)} hot queries use an index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
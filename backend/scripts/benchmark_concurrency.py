@@ -0,0 +1,242 @@
+"""Benchmark request throughput of the async data layer under concurrent clients.
+
+Starts uvicorn on a throwaway SQLite database and drives it with httpx at each
+concurrency level. Every scenario is run against the AsyncSession endpoint and
+against a copy of the previous implementation (sync Session inside an async
+route, mounted under /bench/sync) so the two can be compared.
+
+Usage:
+    python scripts/benchmark_concurrency.py --seats 20000 --concurrency 50 100 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent request throughput")
+    parser.add_argument("--seats", type=int, default=20_000)
+    parser.add_argument("--floors", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario and level")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Server DB_POOL_SIZE (default: highest concurrency level)",
+    )
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def seed_database(seat_count: int, floor_count: int) -> List[str]:
+    """Migrate and fill the database named by DATABASE_URL; return the seat ids."""
+    from app.database import engine, init_db
+    from app.models.floor import Floor
+    from app.models.location import Location
+    from app.models.seat import Seat, SeatStatus, SeatType
+
+    init_db()
+    now = datetime.utcnow()
+    location_id = str(uuid.uuid4())
+    floor_ids = [str(uuid.uuid4()) for _ in range(floor_count)]
+    seat_ids = [str(uuid.uuid4()) for _ in range(seat_count)]
+    with engine.begin() as conn:
+        conn.execute(
+            Location.__table__.insert(),
+            [{"id": location_id, "name": "Benchmark Hall", "total_capacity": seat_count,
+              "current_occupancy": 0, "created_at": now, "updated_at": now}],
+        )
+        conn.execute(
+            Floor.__table__.insert(),
+            [
+                {"id": floor_id, "location_id": location_id, "floor_number": number,
+                 "floor_name": f"Level {number}", "total_seats": seat_count // floor_count,
+                 "occupied_seats": 0, "created_at": now, "updated_at": now}
+                for number, floor_id in enumerate(floor_ids, start=1)
+            ],
+        )
+        conn.execute(
+            Seat.__table__.insert(),
+            [
+                {
+                    "id": seat_id,
+                    "floor_id": floor_ids[i % floor_count],
+                    "seat_number": f"B-{i:06d}",
+                    "seat_type": SeatType.INDIVIDUAL.name,
+                    "table_number": i // 6,
+                    "has_power_outlet": i % 2 == 0,
+                    "has_ac": i % 3 == 0,
+                    "is_quiet": False,
+                    "accessibility": False,
+                    "capacity": 1,
+                    "x_coordinate": (i % 100) / 100,
+                    "y_coordinate": (i // 100 % 100) / 100,
+                    "status": (SeatStatus.AVAILABLE if i % 3 else SeatStatus.OCCUPIED).name,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i, seat_id in enumerate(seat_ids)
+            ],
+        )
+    return seat_ids
+
+
+def serve(port: int) -> None:
+    """Run the app plus sync-session copies of the benchmarked routes."""
+    import uvicorn
+    from fastapi import Depends, HTTPException, Query
+    from sqlalchemy.orm import Session
+
+    from app.database import get_read_db
+    from app.main import app
+    from app.models.seat import Seat, SeatStatus
+    from app.schemas.seat import SeatResponse
+
+    @app.get("/bench/sync/seats/available")
+    async def sync_available_seats(
+        has_power: bool = Query(None),
+        limit: int = Query(100),
+        db: Session = Depends(get_read_db),
+    ):
+        query = db.query(Seat).filter(Seat.status == SeatStatus.AVAILABLE)
+        if has_power is not None:
+            query = query.filter(Seat.has_power_outlet == has_power)
+        return [SeatResponse.from_orm(seat) for seat in query.order_by(Seat.id).limit(limit).all()]
+
+    @app.get("/bench/sync/seats/{seat_id}")
+    async def sync_get_seat(seat_id: str, db: Session = Depends(get_read_db)):
+        seat = db.query(Seat).filter(Seat.id == seat_id).first()
+        if not seat:
+            raise HTTPException(status_code=404, detail="Seat not found")
+        return SeatResponse.from_orm(seat)
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+async def drive(base_url: str, paths: List[str], concurrency: int) -> Dict[str, float]:
+    import httpx
+
+    latencies: List[float] = []
+    errors = 0
+    queue = iter(paths)
+
+    async def client_loop(client) -> None:
+        nonlocal errors
+        for path in queue:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+            except httpx.TransportError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += response.status_code != 200
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "errors": errors,
+    }
+
+
+async def wait_until_up(base_url: str, timeout: float = 60) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.serve:
+        serve(args.port)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # With fewer pooled connections than clients the sync routes block the
+        # event loop waiting for a checkout, which stalls until the pool timeout.
+        pool_size = args.pool_size or max(args.concurrency)
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+            DEBUG="false",
+            DB_POOL_SIZE=str(pool_size),
+            DB_MAX_OVERFLOW="0",
+        )
+        os.environ.update(env)
+        seat_ids = seed_database(args.seats, args.floors)
+
+        server = subprocess.Popen(
+            [sys.executable, __file__, "--serve", "--port", str(args.port)],
+            cwd=ROOT_DIR,
+            env=env,
+        )
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            asyncio.run(wait_until_up(base_url))
+
+            scenarios = {
+                "available seats": ("/api/seats/available?has_power=true&limit=100",
+                                    "/bench/sync/seats/available?has_power=true&limit=100"),
+                "seat by id": ("/api/seats/{seat_id}", "/bench/sync/seats/{seat_id}"),
+            }
+            print(f"{args.seats:,} seats, {args.requests} requests per run, pool of {pool_size}")
+            print(f"{'scenario':<18} {'session':<6} {'clients':>7} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>6}")
+            for label, (async_path, sync_path) in scenarios.items():
+                for concurrency in args.concurrency:
+                    for session_kind, template in (("sync", sync_path), ("async", async_path)):
+                        paths = [
+                            template.format(seat_id=seat_ids[i % len(seat_ids)])
+                            for i in range(args.requests)
+                        ]
+                        # Warm-up pass opens the pooled connections before timing
+                        asyncio.run(drive(base_url, paths[:concurrency * 2], concurrency))
+                        result = asyncio.run(drive(base_url, paths, concurrency))
+                        print(
+                            f"{label:<18} {session_kind:<6} {concurrency:>7} {result['rps']:>8.0f} "
+                            f"{result['p50']:>7.1f}ms {result['p95']:>7.1f}ms {result['p99']:>7.1f}ms "
+                            f"{result['errors']:>6.0f}"
+                        )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Benchmark the admin occupancy analytics query paths on a large history table.
+
+Fills a throwaway SQLite database with synthetic occupancy history (one
+sample per floor at a fixed cadence) plus its rollups, then times the hourly
+trend for a window three ways:
+
+- legacy:  ORM rows loaded into Python and grouped by strftime hour (the
+           previous implementation; skipped above --legacy-max-rows rows)
+- history: GROUP BY hour bucket over the raw rows in SQL (source=history)
+- rollup:  GROUP BY over the hourly rollup rows (default source)
+
+Latency is the median of --repeat runs; memory is the tracemalloc peak of a
+separate run (Python allocations only, not SQLite's page cache).
+
+Usage:
+    python scripts/benchmark_occupancy_analytics.py --rows 10000000 --days 90 --window-days 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import Base, create_db_engine  # noqa: E402
+from app.models.floor import Floor  # noqa: E402
+from app.models.location import Location  # noqa: E402
+from app.models.occupancy_history import OccupancyHistory  # noqa: E402
+from app.services.occupancy_rollups import (  # noqa: E402
+    get_history_trends,
+    get_occupancy_trends,
+    rebuild_occupancy_rollups,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark occupancy analytics aggregation")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Occupancy history rows")
+    parser.add_argument("--locations", type=int, default=20)
+    parser.add_argument("--floors", type=int, default=5, help="Floors per location")
+    parser.add_argument("--days", type=int, default=90, help="Days of history")
+    parser.add_argument("--window-days", type=int, default=30, help="Analytics window")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-max-rows", type=int, default=2_000_000,
+                        help="Skip the legacy path when the window holds more rows")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def seed(engine, args: argparse.Namespace, now: datetime) -> None:
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(args.seed)
+    capacity = 200
+    scopes = []
+    with engine.begin() as conn:
+        for location_number in range(args.locations):
+            location_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            conn.execute(
+                Location.__table__.insert(),
+                [{"id": location_id, "name": f"Location {location_number}", "total_capacity": capacity * args.floors,
+                  "current_occupancy": 0, "created_at": now, "updated_at": now}],
+            )
+            for floor_number in range(1, args.floors + 1):
+                floor_id = str(uuid.UUID(int=rng.getrandbits(128)))
+                conn.execute(
+                    Floor.__table__.insert(),
+                    [{"id": floor_id, "location_id": location_id, "floor_number": floor_number,
+                      "total_seats": capacity, "occupied_seats": 0, "created_at": now, "updated_at": now}],
+                )
+                scopes.append((location_id, floor_id))
+
+    samples_per_scope = max(1, args.rows // len(scopes))
+    step = timedelta(days=args.days) / samples_per_scope
+    start = now - timedelta(days=args.days)
+    table = OccupancyHistory.__table__
+    batch: List[Dict] = []
+    with engine.begin() as conn:
+        for tick in range(samples_per_scope):
+            timestamp = start + step * tick
+            # Busier around midday
+            base = 0.2 + 0.6 * max(0.0, 1 - abs(timestamp.hour - 13) / 8)
+            for location_id, floor_id in scopes:
+                count = min(capacity, max(0, int(capacity * base + rng.randint(-20, 20))))
+                batch.append({
+                    "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "location_id": location_id,
+                    "floor_id": floor_id,
+                    "timestamp": timestamp,
+                    "occupancy_count": count,
+                    "total_capacity": capacity,
+                    "day_of_week": timestamp.weekday(),
+                    "hour_of_day": timestamp.hour,
+                    "recorded_at": timestamp,
+                })
+            if len(batch) >= 50_000:
+                conn.execute(table.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(table.insert(), batch)
+
+    with Session(bind=engine) as db:
+        rebuild_occupancy_rollups(db)
+
+
+def legacy_trends(db: Session, start: datetime) -> List[Dict]:
+    """The previous get_occupancy_analytics body."""
+    history = db.query(OccupancyHistory).filter(
+        OccupancyHistory.timestamp >= start
+    ).order_by(OccupancyHistory.timestamp).all()
+    hourly_data: Dict[str, Dict] = {}
+    for record in history:
+        hour_key = record.timestamp.strftime("%Y-%m-%d %H:00")
+        data = hourly_data.setdefault(hour_key, {"occupancy_percentage": [], "occupancy_count": []})
+        data["occupancy_percentage"].append(record.occupancy_percentage)
+        data["occupancy_count"].append(record.occupancy_count)
+    return [
+        {
+            "timestamp": hour_key,
+            "average_occupancy_percentage": round(sum(data["occupancy_percentage"]) / len(data["occupancy_percentage"]), 2),
+            "average_occupancy_count": round(sum(data["occupancy_count"]) / len(data["occupancy_count"]), 2),
+        }
+        for hour_key, data in sorted(hourly_data.items())
+    ]
+
+
+def measure(engine, run: Callable[[Session], List[Dict]], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        with Session(bind=engine) as db:
+            started = time.perf_counter()
+            trends = run(db)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    with Session(bind=engine) as db:
+        run(db)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": statistics.median(timings), "peak_mb": peak / 2**20, "buckets": len(trends)}
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    now = datetime.utcnow().replace(microsecond=0)
+    window_start = now - timedelta(days=args.window_days)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/bench.db")
+        started = time.perf_counter()
+        seed(engine, args, now)
+        with Session(bind=engine) as db:
+            window_rows = db.query(OccupancyHistory).filter(OccupancyHistory.timestamp >= window_start).count()
+        print(
+            f"Seeded {args.rows:,} history rows over {args.days} days in {time.perf_counter() - started:.0f}s; "
+            f"{args.window_days}-day window holds {window_rows:,} rows"
+        )
+
+        paths: Dict[str, Callable[[Session], List[Dict]]] = {
+            "legacy": lambda db: legacy_trends(db, window_start),
+            "history": lambda db: get_history_trends(db, "hour", window_start),
+            "rollup": lambda db: get_occupancy_trends(db, "hour", window_start),
+        }
+        print(f"{'path':<8} {'latency':>11} {'peak mem':>10} {'buckets':>8}")
+        for name, run in paths.items():
+            if name == "legacy" and window_rows > args.legacy_max_rows:
+                print(f"{name:<8} {'skipped (--legacy-max-rows)':>31}")
+                continue
+            result = measure(engine, run, args.repeat)
+            print(f"{name:<8} {result['ms']:>9.1f}ms {result['peak_mb']:>8.1f}MB {result['buckets']:>8}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
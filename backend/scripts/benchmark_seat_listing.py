@@ -0,0 +1,175 @@
+"""Benchmark offset vs keyset pagination and JSON vs NDJSON seat listings.
+
+Builds a throwaway SQLite database, so it never touches jcu_library.db.
+
+Usage:
+    python scripts/benchmark_seat_listing.py --seats 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark seat listing endpoints")
+    parser.add_argument("--seats", type=int, default=100_000)
+    parser.add_argument("--floors", type=int, default=100)
+    return parser
+
+
+def seed_database(seat_count: int, floor_count: int) -> None:
+    from app.database import engine, init_db
+    from app.models.floor import Floor
+    from app.models.location import Location
+    from app.models.seat import Seat, SeatStatus, SeatType
+
+    init_db()
+    now = datetime.utcnow()
+    location_id = str(uuid.uuid4())
+    floor_ids = [str(uuid.uuid4()) for _ in range(floor_count)]
+    with engine.begin() as conn:
+        conn.execute(
+            Location.__table__.insert(),
+            [{"id": location_id, "name": "Benchmark Hall", "total_capacity": seat_count,
+              "current_occupancy": 0, "created_at": now, "updated_at": now}],
+        )
+        conn.execute(
+            Floor.__table__.insert(),
+            [
+                {"id": floor_id, "location_id": location_id, "floor_number": number,
+                 "floor_name": f"Level {number}", "total_seats": seat_count // floor_count,
+                 "occupied_seats": 0, "created_at": now, "updated_at": now}
+                for number, floor_id in enumerate(floor_ids, start=1)
+            ],
+        )
+        batch = []
+        for i in range(seat_count):
+            batch.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "floor_id": floor_ids[i % floor_count],
+                    "seat_number": f"B-{i:06d}",
+                    "seat_type": SeatType.INDIVIDUAL.name,
+                    "table_number": i // 6,
+                    "has_power_outlet": i % 2 == 0,
+                    "has_ac": i % 3 == 0,
+                    "is_quiet": False,
+                    "accessibility": False,
+                    "capacity": 1,
+                    "x_coordinate": (i % 100) / 100,
+                    "y_coordinate": (i // 100 % 100) / 100,
+                    "status": (SeatStatus.AVAILABLE if i % 3 else SeatStatus.OCCUPIED).name,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            if len(batch) == 5000:
+                conn.execute(Seat.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(Seat.__table__.insert(), batch)
+
+
+def fetch(client, url: str, stream: bool = False) -> int:
+    if stream:
+        size = 0
+        with client.stream("GET", url) as response:
+            for chunk in response.iter_bytes():
+                size += len(chunk)
+        return size
+    return len(client.get(url).content)
+
+
+def measure(client, url: str, stream: bool = False):
+    """Latency without tracing, then peak traced memory from a second call."""
+    start = time.perf_counter()
+    size = fetch(client, url, stream)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    fetch(client, url, stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def measure_generator(generator_factory):
+    """Server-side cost of producing a stream, excluding the test client's buffering."""
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in generator_factory())
+    elapsed = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    for _ in generator_factory():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    workdir = tempfile.mkdtemp(prefix="seat-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/bench.db"
+    os.environ["DEBUG"] = "false"
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    print(f"Seeding {args.seats:,} seats into {workdir}/bench.db ...")
+    seed_database(args.seats, args.floors)
+    client = TestClient(app)  # no lifespan: keeps the refresh worker out of the numbers
+
+    print(f"{'scenario':<40} {'ms':>9} {'bytes':>12} {'peak MB':>9}")
+
+    def row(label, result):
+        elapsed, size, peak = result
+        print(f"{label:<40} {elapsed:>9.1f} {size:>12,} {peak / 1e6:>9.1f}")
+
+    deep_skip = max(0, args.seats - 1000)
+    row("offset page (skip=0, limit=1000)", measure(client, "/api/seats/?limit=1000"))
+    row(f"offset page (skip={deep_skip:,})", measure(client, f"/api/seats/?limit=1000&skip={deep_skip}"))
+
+    # Walk to the last page via cursors, then time fetching it.
+    cursor, pages, walk_start = None, 0, time.perf_counter()
+    while True:
+        url = "/api/seats/?limit=1000" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        next_cursor = response.headers.get("x-next-cursor")
+        pages += 1
+        if not next_cursor:
+            break
+        last_cursor, cursor = cursor, next_cursor
+    walk_ms = (time.perf_counter() - walk_start) * 1000
+    row("keyset page (last page)", measure(client, f"/api/seats/?limit=1000&cursor={last_cursor}"))
+    print(f"{'keyset walk of all pages':<40} {walk_ms:>9.1f}   ({pages} pages)")
+
+    row("/available JSON array", measure(client, "/api/seats/available"))
+    row("/available NDJSON stream", measure(client, "/api/seats/available?format=ndjson", stream=True))
+
+    from app.api.seats import iter_seat_ndjson
+    from app.models.seat import Seat, SeatStatus
+
+    row(
+        "NDJSON generator only (server side)",
+        measure_generator(lambda: iter_seat_ndjson([Seat.status == SeatStatus.AVAILABLE], None, None)),
+    )
+    print("Note: Starlette's TestClient buffers whole bodies, so client-side peaks include the full payload.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark nearest-seat and group-seat queries on the spatial index.
+
+Usage:
+    python scripts/benchmark_spatial.py --seats-per-floor 10000 --floors 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.models.seat import SeatStatus, SeatType  # noqa: E402
+from app.services.seat_spatial_index import SeatSpatialIndex  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the seat spatial index")
+    parser.add_argument("--seats-per-floor", type=int, default=10_000)
+    parser.add_argument("--floors", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def synthetic_seats(floors: int, per_floor: int, seed: int) -> List[SimpleNamespace]:
+    """Tables of six seats laid out on a square grid per floor."""
+    rng = random.Random(seed)
+    tables_per_side = math.ceil(math.sqrt(per_floor / 6))
+    spacing = 1.0 / tables_per_side
+    statuses = [SeatStatus.AVAILABLE, SeatStatus.OCCUPIED, SeatStatus.OCCUPIED]
+    seats = []
+    for floor_index in range(floors):
+        floor = SimpleNamespace(floor_name=f"Level {floor_index + 1}")
+        for i in range(per_floor):
+            table = i // 6
+            tx, ty = (table % tables_per_side) * spacing, (table // tables_per_side) * spacing
+            offset = i % 6
+            seats.append(
+                SimpleNamespace(
+                    id=f"{floor_index}-{i:06d}",
+                    seat_number=f"F{floor_index + 1}-{i + 1:05d}",
+                    floor_id=f"floor-{floor_index}",
+                    floor=floor,
+                    table_number=table + 1,
+                    seat_type=SeatType.INDIVIDUAL,
+                    status=rng.choice(statuses),
+                    has_power_outlet=rng.random() < 0.5,
+                    has_ac=rng.random() < 0.6,
+                    is_quiet=rng.random() < 0.3,
+                    accessibility=rng.random() < 0.1,
+                    x_coordinate=tx + (offset % 3) * spacing * 0.25,
+                    y_coordinate=ty + (offset // 3) * spacing * 0.4,
+                )
+            )
+    return seats
+
+
+def brute_force(seats, floor_id: str, x: float, y: float, k: int) -> List[str]:
+    candidates = [
+        (math.hypot(float(seat.x_coordinate) - x, float(seat.y_coordinate) - y), seat.id)
+        for seat in seats
+        if seat.floor_id == floor_id and seat.status == SeatStatus.AVAILABLE
+    ]
+    return [seat_id for _, seat_id in sorted(candidates)[:k]]
+
+
+def report(label: str, samples: List[float]) -> None:
+    p50 = statistics.median(samples)
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(f"  {label:<32} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+
+def timed(func, iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    rng = random.Random(args.seed)
+    seats = synthetic_seats(args.floors, args.seats_per_floor, args.seed)
+
+    index = SeatSpatialIndex()
+    start = time.perf_counter()
+    index.rebuild(seats)
+    print(
+        f"Indexed {len(seats):,} seats on {args.floors} floors in "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+    points = [(rng.random(), rng.random()) for _ in range(args.iterations)]
+    mismatches = sum(
+        [seat.seat_id for _, seat in index.nearest("floor-0", x, y, k=5)]
+        != brute_force(seats, "floor-0", x, y, 5)
+        for x, y in points[:20]
+    )
+    print(f"Correctness vs brute force (20 points, k=5): {20 - mismatches}/20 match")
+
+    queries = iter(points * 4)
+    report("nearest k=5", timed(lambda: index.nearest("floor-0", *next(queries), k=5), args.iterations))
+    report("nearest k=20", timed(lambda: index.nearest("floor-0", *next(queries), k=20), args.iterations))
+    report(
+        "nearest k=5 power+quiet",
+        timed(
+            lambda: index.nearest(
+                "floor-0", *next(queries), k=5, filters={"has_power_outlet": True, "is_quiet": True}
+            ),
+            args.iterations,
+        ),
+    )
+    report(
+        "brute force k=5",
+        timed(lambda: brute_force(seats, "floor-0", *next(queries), 5), max(5, args.iterations // 20)),
+    )
+    report("group size=4 (one floor)", timed(lambda: index.find_groups(4, floor_id="floor-0"), 20))
+    report("group size=4 (all floors)", timed(lambda: index.find_groups(4), 10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Benchmark concurrent reads against an ingest writer for each SQLite profile.
+
+Builds a throwaway SQLite database per profile, then runs reader threads
+(available-seat listings and floor occupancy counts) alongside writer threads
+that apply IoT-style seat status updates, one transaction per event.
+
+Usage:
+    python scripts/benchmark_sqlite_profiles.py --seats 50000 --readers 8 --writers 1 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import func, select, update  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.database import SQLITE_PROFILES, Base, create_db_engine  # noqa: E402
+from app.models.floor import Floor  # noqa: E402
+from app.models.location import Location  # noqa: E402
+from app.models.seat import Seat, SeatStatus, SeatType  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite profiles under concurrent load")
+    parser.add_argument("--seats", type=int, default=50_000)
+    parser.add_argument("--floors", type=int, default=50)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per profile")
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES), choices=SQLITE_PROFILES)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def seed(engine, seat_count: int, floor_count: int) -> Dict[str, List[str]]:
+    """Create the schema and seats; return seat ids per floor id."""
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    location_id = str(uuid.uuid4())
+    floor_ids = [str(uuid.uuid4()) for _ in range(floor_count)]
+    seats_by_floor: Dict[str, List[str]] = {floor_id: [] for floor_id in floor_ids}
+    with engine.begin() as conn:
+        conn.execute(
+            Location.__table__.insert(),
+            [{"id": location_id, "name": "Benchmark Hall", "total_capacity": seat_count,
+              "current_occupancy": 0, "created_at": now, "updated_at": now}],
+        )
+        conn.execute(
+            Floor.__table__.insert(),
+            [
+                {"id": floor_id, "location_id": location_id, "floor_number": number,
+                 "floor_name": f"Level {number}", "total_seats": seat_count // floor_count,
+                 "occupied_seats": 0, "created_at": now, "updated_at": now}
+                for number, floor_id in enumerate(floor_ids, start=1)
+            ],
+        )
+        batch = []
+        for i in range(seat_count):
+            seat_id = str(uuid.uuid4())
+            floor_id = floor_ids[i % floor_count]
+            seats_by_floor[floor_id].append(seat_id)
+            batch.append(
+                {
+                    "id": seat_id,
+                    "floor_id": floor_id,
+                    "seat_number": f"B-{i:06d}",
+                    "seat_type": SeatType.INDIVIDUAL.name,
+                    "table_number": i // 6,
+                    "has_power_outlet": i % 2 == 0,
+                    "has_ac": i % 3 == 0,
+                    "is_quiet": i % 5 == 0,
+                    "accessibility": False,
+                    "capacity": 1,
+                    "x_coordinate": (i % 100) / 100,
+                    "y_coordinate": (i // 100 % 100) / 100,
+                    "status": (SeatStatus.AVAILABLE if i % 3 else SeatStatus.OCCUPIED).name,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            if len(batch) == 5000:
+                conn.execute(Seat.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(Seat.__table__.insert(), batch)
+    return seats_by_floor
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {"read": [], "write": []}
+        self.errors: Dict[str, int] = {"read": 0, "write": 0}
+
+    def record(self, kind: str, elapsed_ms: float) -> None:
+        with self.lock:
+            self.samples[kind].append(elapsed_ms)
+
+    def error(self, kind: str) -> None:
+        with self.lock:
+            self.errors[kind] += 1
+
+
+def reader(engine, floor_ids: List[str], stop: threading.Event, recorder: Recorder, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    while not stop.is_set():
+        floor_id = rng.choice(floor_ids)
+        start = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.execute(
+                    select(Seat.id, Seat.seat_number)
+                    .where(Seat.floor_id == floor_id, Seat.status == SeatStatus.AVAILABLE)
+                    .order_by(Seat.id)
+                    .limit(100)
+                ).all()
+                conn.execute(
+                    select(func.count()).select_from(Seat).where(
+                        Seat.floor_id == floor_id, Seat.status == SeatStatus.OCCUPIED
+                    )
+                ).scalar()
+        except OperationalError:
+            recorder.error("read")
+            continue
+        recorder.record("read", (time.perf_counter() - start) * 1000)
+
+
+def writer(engine, seats_by_floor: Dict[str, List[str]], stop: threading.Event, recorder: Recorder, seed_value: int) -> None:
+    """One occupancy event per transaction: flip a seat, recount its floor."""
+    rng = random.Random(seed_value)
+    floor_ids = list(seats_by_floor)
+    statuses = [SeatStatus.AVAILABLE, SeatStatus.OCCUPIED]
+    while not stop.is_set():
+        floor_id = rng.choice(floor_ids)
+        seat_id = rng.choice(seats_by_floor[floor_id])
+        start = time.perf_counter()
+        try:
+            with engine.begin() as conn:
+                conn.execute(update(Seat).where(Seat.id == seat_id).values(status=rng.choice(statuses)))
+                occupied = conn.execute(
+                    select(func.count()).select_from(Seat).where(
+                        Seat.floor_id == floor_id, Seat.status == SeatStatus.OCCUPIED
+                    )
+                ).scalar()
+                conn.execute(update(Floor).where(Floor.id == floor_id).values(occupied_seats=occupied))
+        except OperationalError:
+            recorder.error("write")
+            continue
+        recorder.record("write", (time.perf_counter() - start) * 1000)
+
+
+def run_profile(profile: str, args: argparse.Namespace) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/bench.db", sqlite_profile=profile)
+        seats_by_floor = seed(engine, args.seats, args.floors)
+        floor_ids = list(seats_by_floor)
+
+        stop = threading.Event()
+        recorder = Recorder()
+        threads = [
+            threading.Thread(target=reader, args=(engine, floor_ids, stop, recorder, args.seed + i))
+            for i in range(args.readers)
+        ] + [
+            threading.Thread(target=writer, args=(engine, seats_by_floor, stop, recorder, args.seed + 1000 + i))
+            for i in range(args.writers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    def percentile(samples: List[float], q: int) -> float:
+        if len(samples) < 2:
+            return samples[0] if samples else 0.0
+        return statistics.quantiles(samples, n=100)[q - 1]
+
+    reads, writes = recorder.samples["read"], recorder.samples["write"]
+    return {
+        "reads/s": len(reads) / args.duration,
+        "read p50": percentile(reads, 50),
+        "read p99": percentile(reads, 99),
+        "writes/s": len(writes) / args.duration,
+        "write p50": percentile(writes, 50),
+        "write p99": percentile(writes, 99),
+        "errors": recorder.errors["read"] + recorder.errors["write"],
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    print(
+        f"{args.seats:,} seats, {args.readers} readers, {args.writers} writers, "
+        f"{args.duration:.0f}s per profile"
+    )
+    print(
+        f"{'profile':<10} {'reads/s':>9} {'read p50':>9} {'read p99':>9} "
+        f"{'writes/s':>9} {'write p50':>10} {'write p99':>10} {'errors':>7}"
+    )
+    for profile in args.profiles:
+        result = run_profile(profile, args)
+        print(
+            f"{profile:<10} {result['reads/s']:>9.0f} {result['read p50']:>7.2f}ms {result['read p99']:>7.2f}ms "
+            f"{result['writes/s']:>9.0f} {result['write p50']:>8.2f}ms {result['write p99']:>8.2f}ms "
+            f"{result['errors']:>7d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark the in-memory seat suggestion index.
+
+Usage:
+    python scripts/benchmark_suggestions.py --seats 100000 --floors 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.models.seat import SeatStatus, SeatType  # noqa: E402
+from app.schemas.prediction import SeatSuggestionRequest  # noqa: E402
+from app.services.suggestion_index import SeatSuggestionIndex  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark seat suggestions")
+    parser.add_argument("--seats", type=int, default=100_000)
+    parser.add_argument("--floors", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def synthetic_seats(count: int, floors: int, seed: int) -> List[SimpleNamespace]:
+    rng = random.Random(seed)
+    floor_objects = [
+        SimpleNamespace(id=f"floor-{i:04d}", floor_name=f"Level {i % 5 + 1}") for i in range(floors)
+    ]
+    seat_types = list(SeatType)
+    statuses = [SeatStatus.AVAILABLE, SeatStatus.OCCUPIED, SeatStatus.OCCUPIED, SeatStatus.MAINTENANCE]
+    seats = []
+    for i in range(count):
+        floor = floor_objects[i % floors]
+        seats.append(
+            SimpleNamespace(
+                id=f"seat-{i:07d}",
+                seat_number=f"S-{i:07d}",
+                floor_id=floor.id,
+                floor=floor,
+                seat_type=rng.choice(seat_types),
+                status=rng.choice(statuses),
+                has_power_outlet=rng.random() < 0.5,
+                has_ac=rng.random() < 0.6,
+                accessibility=rng.random() < 0.1,
+                capacity=rng.choice([1, 1, 1, 2, 4]),
+            )
+        )
+    return seats
+
+
+def reference_ids(seats, request: SeatSuggestionRequest) -> List[str]:
+    """Legacy algorithm: score every available seat in Python and sort."""
+    scored = []
+    for seat in seats:
+        if seat.status != SeatStatus.AVAILABLE:
+            continue
+        if request.floor_id and seat.floor_id != request.floor_id:
+            continue
+        if request.seat_type and seat.seat_type != request.seat_type:
+            continue
+        score = 1.0
+        if request.need_power is True:
+            if not seat.has_power_outlet:
+                continue
+            score += 2.0
+        elif request.need_power is False and seat.has_power_outlet:
+            score += 0.2
+        if request.need_ac is True:
+            if not seat.has_ac:
+                continue
+            score += 0.5
+        elif request.need_ac is False and seat.has_ac:
+            score += 0.1
+        if seat.capacity > 1:
+            score += 0.3
+        if seat.accessibility:
+            score += 0.2
+        scored.append((round(score, 1), seat.id))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [seat_id for _, seat_id in scored[: request.limit]]
+
+
+def time_call(func, iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    seats = synthetic_seats(args.seats, args.floors, args.seed)
+
+    index = SeatSuggestionIndex()
+    start = time.perf_counter()
+    index.rebuild(seats)
+    print(f"Indexed {len(index):,} seats in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    requests = {
+        "no filters": SeatSuggestionRequest(),
+        "power + ac": SeatSuggestionRequest(need_power=True, need_ac=True),
+        "single floor": SeatSuggestionRequest(floor_id="floor-0007", need_power=False),
+        "seat type + power": SeatSuggestionRequest(seat_type=SeatType.GROUP, need_power=True),
+    }
+
+    print(f"{'request':<20} {'index p50':>10} {'index p99':>10} {'legacy p50':>11}  match")
+    for label, request in requests.items():
+        indexed = [seat.seat_id for seat in index.search(request)]
+        legacy = reference_ids(seats, request)
+        index_samples = time_call(lambda: index.search(request), args.iterations)
+        legacy_samples = time_call(lambda: reference_ids(seats, request), max(3, args.iterations // 50))
+        print(
+            f"{label:<20} {statistics.median(index_samples):>8.3f}ms "
+            f"{statistics.quantiles(index_samples, n=100)[98]:>8.3f}ms "
+            f"{statistics.median(legacy_samples):>9.1f}ms  {'yes' if indexed == legacy else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Check that an AI chat turn runs at most one SQL statement.
+
+AiAssistantService.chat serialises its ~25 seat suggestions, group clusters
+and nearby seats from the in-memory indexes. The only statement it may run
+is the index rebuild on a cold process; anything more (a lazy load or a
+per-seat lookup) is an N+1 regression. The chat runs against an in-memory
+SQLite campus with Gemini unconfigured, so no network is needed, and the
+script exits with status 1 if either a cold or a warm turn goes over the
+limit.
+
+Usage:
+    python scripts/check_chat_queries.py
+    python scripts/check_chat_queries.py --seats 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+# Settings are read at import: keep Gemini unconfigured so the reply is the local fallback
+os.environ["GEMINI_API_KEY"] = ""
+os.environ.setdefault("DEBUG", "false")
+
+from app.database import Base  # noqa: E402
+from app.models.floor import Floor  # noqa: E402
+from app.models.location import Location  # noqa: E402
+from app.models.seat import Seat  # noqa: E402
+from app.schemas.ai_demo import AiChatRequest, ChatMessage  # noqa: E402
+from app.services.ai_assistant_service import AiAssistantService  # noqa: E402
+from app.services.seat_indexes import invalidate_seat_indexes  # noqa: E402
+from app.utils.synthetic_data import DatasetShape, generate_campus  # noqa: E402
+
+
+MAX_STATEMENTS = 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Check the SQL statement count of an AI chat turn")
+    parser.add_argument("--seats", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def campus_session(seats: int, seed: int) -> Session:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    locations, floors, seat_rows = generate_campus(DatasetShape.for_seat_count(seats), seed=seed)
+    with engine.begin() as conn:
+        conn.execute(Location.__table__.insert(), locations)
+        conn.execute(Floor.__table__.insert(), floors)
+        conn.execute(Seat.__table__.insert(), seat_rows)
+    return Session(bind=engine)
+
+
+def count_chat_statements(db: Session, message: str) -> tuple[List[str], int]:
+    """Statements run by one chat turn, and how many seats the reply carried."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(" ".join(statement.split()))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        request = AiChatRequest(messages=[ChatMessage(role="user", content=message)])
+        response = asyncio.run(AiAssistantService(db).chat(request))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements, len(response.seat_details)
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    db = campus_session(args.seats, args.seed)
+    seat_number = db.query(Seat.seat_number).order_by(Seat.seat_number).limit(1).scalar()
+    # Asks for a group and names a seat, so suggestions, clusters and nearby seats are all serialised
+    message = f"We are 3 students, any seats near {seat_number}?"
+
+    invalidate_seat_indexes()
+    failed = False
+    for label in ("cold", "warm"):
+        statements, seat_count = count_chat_statements(db, message)
+        ok = len(statements) <= MAX_STATEMENTS
+        failed |= not ok
+        print(f"{'✅' if ok else '❌'} {label} chat turn: {len(statements)} statements for {seat_count} seats")
+        if not ok:
+            for statement in statements:
+                print(f"   {statement[:160]}")
+    db.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
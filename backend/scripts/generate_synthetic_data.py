@@ -0,0 +1,103 @@
+"""Build a large, deterministic SQLite database for benchmarking.
+
+The database is migrated with alembic and then filled by
+app.utils.synthetic_data.load_synthetic_dataset: locations, floors and
+seats laid out like mock_data, student accounts (password "student123"),
+occupancy history for every floor and location every
+--history-interval-minutes, reservations for each day of that history, and
+the occupancy rollups rebuilt from it. The same arguments, --seed and --end
+always give the same rows.
+
+Rows are generated as they are inserted in --batch-size executemany
+batches, so memory stays flat however much history is requested; the
+history table's secondary indexes are built once at the end.
+
+Usage:
+    python scripts/generate_synthetic_data.py bench.db --locations 40 --floors 5 --seats-per-floor 5000 \\
+        --history-days 365
+    python scripts/generate_synthetic_data.py small.db --force --seats-per-floor 200 --history-days 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("database", type=Path, help="SQLite file to create")
+    parser.add_argument("--force", action="store_true", help="Replace the file if it exists")
+    parser.add_argument("--locations", type=int, default=10)
+    parser.add_argument("--floors", type=int, default=3, help="Floors per location")
+    parser.add_argument("--seats-per-floor", type=int, default=500)
+    parser.add_argument("--history-days", type=int, default=30)
+    parser.add_argument("--history-interval-minutes", type=int, default=15)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--reservations-per-day", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None,
+                        help="End of the history, ISO format (default: midnight today, UTC)")
+    parser.add_argument("--no-rollups", action="store_true", help="Skip rebuilding occupancy_rollups")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    database = args.database.resolve()
+    if database.exists():
+        if not args.force:
+            print(f"❌ {database} exists; pass --force to replace it", file=sys.stderr)
+            return 1
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{database}{suffix}").unlink(missing_ok=True)
+
+    # Settings are read at import, so point the app at the new file first
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    os.environ.setdefault("DEBUG", "false")
+
+    from app.database import engine, init_db
+    from app.utils.synthetic_data import DatasetShape, SyntheticDataset, load_synthetic_dataset
+
+    dataset = SyntheticDataset(
+        shape=DatasetShape(args.locations, args.floors, args.seats_per_floor),
+        history_days=args.history_days,
+        history_interval=timedelta(minutes=args.history_interval_minutes),
+        users=args.users,
+        reservations_per_day=args.reservations_per_day,
+        seed=args.seed,
+    )
+    end = args.end or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    print(
+        f"📦 {database.name}: {dataset.shape.total_seats:,} seats on {dataset.shape.total_floors:,} floors, "
+        f"{dataset.history_rows:,} history rows, "
+        f"{(dataset.history_days + 1) * dataset.reservations_per_day:,} reservations"
+    )
+
+    started = time.perf_counter()
+    init_db()
+    load_synthetic_dataset(
+        engine,
+        dataset,
+        end=end,
+        batch_size=args.batch_size,
+        rebuild_rollups=not args.no_rollups,
+    )
+    engine.dispose()
+    size = database.stat().st_size / 1024 ** 2
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s ({size:,.0f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
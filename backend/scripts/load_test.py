@@ -0,0 +1,505 @@
+"""Load-test the API with scenario profiles and report latency per endpoint.
+
+Each scenario runs --users virtual users against the server for --duration
+seconds:
+
+- sensor_storm:  IoT sensors posting seat events to /api/iot/occupancy,
+                 with an occasional /occupancy/batch
+- browsing:      students listing locations, a floor's seats and the
+                 available seats on it
+- reservations:  bursts where every user reserves a free seat on the same
+                 floor at once (so some collide) and cancels it again
+- ai_chat:       /ai/demo/chat with Gemini replaced by a local stub that
+                 answers after --gemini-latency-ms
+
+By default a throwaway SQLite database is seeded and uvicorn is started on
+it with GEMINI_ENDPOINT_URL pointing at the stub. Pass --base-url to drive a
+server that is already running instead. For the ai_chat scenario, start the
+stub yourself (`--serve-gemini-stub --gemini-port 8766`) and run that server
+with GEMINI_ENDPOINT_URL=http://127.0.0.1:8766/v1/chat and any
+GEMINI_API_KEY.
+
+Per endpoint (route template, not the concrete path) the report has request
+and error counts, status codes, throughput and p50/p95/p99 latency. It is
+printed, and written as JSON with --output so runs can be compared.
+Errors are 5xx responses and transport failures; 4xx answers such as a
+reservation losing the race for a seat are expected and only counted.
+
+Usage:
+    python scripts/load_test.py --scenario all --users 50 --duration 30 --output load.json
+    python scripts/load_test.py --base-url http://127.0.0.1:8000 --scenario browsing sensor_storm
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, NamedTuple
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+# Opening words of AiAssistantService._fallback_reply
+GEMINI_FALLBACK_MARKERS = ("I couldn't reach Gemini", "Gemini is temporarily unavailable")
+
+CHAT_PROMPTS = [
+    "Find me a quiet seat with a power outlet",
+    "We are a group of 4, where can we sit together?",
+    "Any free seats near a window on level 2?",
+    "I need an accessible seat close to the entrance",
+]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load-test the API with scenario profiles")
+    parser.add_argument("--scenario", nargs="+", default=["all"], choices=["all", *SCENARIOS])
+    parser.add_argument("--users", type=int, default=50, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per scenario")
+    parser.add_argument("--accounts", type=int, default=20, help="Student accounts registered for reservations")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-url", help="Drive a running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--locations", type=int, default=4, help="Seeded locations (self-hosted run)")
+    parser.add_argument("--floors", type=int, default=3, help="Seeded floors per location")
+    parser.add_argument("--seats-per-floor", type=int, default=250)
+    parser.add_argument("--gemini-port", type=int, default=8766)
+    parser.add_argument("--gemini-latency-ms", type=float, default=200)
+    parser.add_argument("--serve-gemini-stub", action="store_true", help="Only run the Gemini stub")
+    return parser
+
+
+# Gemini stub
+
+
+def serve_gemini_stub(port: int, latency_ms: float) -> None:
+    """OpenAI-style chat endpoint that highlights the first seat ids it finds in the prompt."""
+    import uvicorn
+    from fastapi import FastAPI
+
+    stub = FastAPI()
+    seat_id_pattern = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+    @stub.post("/v1/chat")
+    async def chat(payload: dict):
+        await asyncio.sleep(latency_ms / 1000)
+        prompt = " ".join(message.get("content") or "" for message in payload.get("messages", []))
+        seat_ids = list(dict.fromkeys(seat_id_pattern.findall(prompt)))[:3]
+        reply = f"These seats should suit you.\nhighlight_seats_list: [{', '.join(seat_ids)}]"
+        return {"choices": [{"message": {"role": "assistant", "content": reply}}]}
+
+    uvicorn.run(stub, host="127.0.0.1", port=port, log_level="warning")
+
+
+# Self-hosted server
+
+
+def seed_database(args: argparse.Namespace) -> None:
+    """Migrate and fill the database named by DATABASE_URL."""
+    from app.database import engine, init_db
+    from app.models.floor import Floor
+    from app.models.location import Location
+    from app.models.seat import Seat, SeatStatus, SeatType
+
+    init_db()
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    capacity = args.floors * args.seats_per_floor
+    with engine.begin() as conn:
+        for location_number in range(1, args.locations + 1):
+            location_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            conn.execute(
+                Location.__table__.insert(),
+                [{"id": location_id, "name": f"Load Test Building {location_number}", "total_capacity": capacity,
+                  "current_occupancy": 0, "created_at": now, "updated_at": now}],
+            )
+            location_occupied = 0
+            for floor_number in range(1, args.floors + 1):
+                floor_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                statuses = [
+                    SeatStatus.OCCUPIED if rng.random() < 0.4 else SeatStatus.AVAILABLE
+                    for _ in range(args.seats_per_floor)
+                ]
+                conn.execute(
+                    Floor.__table__.insert(),
+                    [{"id": floor_id, "location_id": location_id, "floor_number": floor_number,
+                      "floor_name": f"Level {floor_number}", "total_seats": args.seats_per_floor,
+                      "occupied_seats": statuses.count(SeatStatus.OCCUPIED), "created_at": now, "updated_at": now}],
+                )
+                conn.execute(
+                    Seat.__table__.insert(),
+                    [
+                        {
+                            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                            "floor_id": floor_id,
+                            "seat_number": f"{location_number}{floor_number}-{i:04d}",
+                            "seat_type": SeatType.INDIVIDUAL.name,
+                            "table_number": i // 6,
+                            "has_power_outlet": rng.random() < 0.5,
+                            "has_ac": rng.random() < 0.3,
+                            "is_quiet": rng.random() < 0.2,
+                            "accessibility": rng.random() < 0.05,
+                            "capacity": 1,
+                            "x_coordinate": (i % 25) / 25,
+                            "y_coordinate": (i // 25) / 25,
+                            "status": seat_status.name,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for i, seat_status in enumerate(statuses)
+                    ],
+                )
+                location_occupied += statuses.count(SeatStatus.OCCUPIED)
+            conn.execute(
+                Location.__table__.update()
+                .where(Location.id == location_id)
+                .values(current_occupancy=location_occupied)
+            )
+
+
+def write_seating_dataset(path: Path, seed: int, rows: int = 500) -> None:
+    """Small seating CSV so the AI chat prompt can include a dataset summary."""
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 1, 8)
+    lines = ["Location,Arrival Time,Leaving Time,Temperature,Power Plugs"]
+    for _ in range(rows):
+        arrival = start + timedelta(days=rng.randrange(30), minutes=rng.randrange(0, 600, 15))
+        leaving = arrival + timedelta(minutes=rng.randrange(30, 240, 15))
+        lines.append(
+            f"HUBE-{rng.randrange(1, 60)},{arrival:%m/%d/%Y %H:%M},{leaving:%m/%d/%Y %H:%M},"
+            f"{rng.randrange(21, 28)},{'TRUE' if rng.random() < 0.5 else 'FALSE'}"
+        )
+    path.write_text("\n".join(lines) + "\n")
+
+
+async def wait_until_up(base_url: str, timeout: float = 60) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+# Measurement
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class Recorder:
+    """Latencies and status codes per endpoint label."""
+
+    def __init__(self) -> None:
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._statuses: Dict[str, Counter] = defaultdict(Counter)
+        self._notes: Dict[str, Counter] = defaultdict(Counter)
+
+    async def request(self, client, method: str, label: str, path: str, **kwargs):
+        import httpx
+
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except httpx.TransportError as exc:
+            self._statuses[label][type(exc).__name__] += 1
+            return None
+        self._latencies[label].append((time.perf_counter() - started) * 1000)
+        self._statuses[label][str(response.status_code)] += 1
+        return response
+
+    def note(self, label: str, key: str) -> None:
+        """Count a noteworthy response (e.g. a degraded answer) without treating it as an error."""
+        self._notes[label][key] += 1
+
+    def summary(self, elapsed: float) -> Dict:
+        endpoints = {}
+        for label in sorted(self._statuses):
+            statuses = self._statuses[label]
+            latencies = sorted(self._latencies[label])
+            requests = sum(statuses.values())
+            endpoint = {
+                "requests": requests,
+                "errors": sum(count for code, count in statuses.items() if not code.isdigit() or int(code) >= 500),
+                "status_codes": dict(sorted(statuses.items())),
+                "throughput_rps": round(requests / elapsed, 2),
+            }
+            if latencies:
+                endpoint.update({
+                    "p50_ms": round(percentile(latencies, 50), 2),
+                    "p95_ms": round(percentile(latencies, 95), 2),
+                    "p99_ms": round(percentile(latencies, 99), 2),
+                    "mean_ms": round(sum(latencies) / len(latencies), 2),
+                    "max_ms": round(latencies[-1], 2),
+                })
+            if self._notes[label]:
+                endpoint["notes"] = dict(self._notes[label])
+            endpoints[label] = endpoint
+        requests = sum(endpoint["requests"] for endpoint in endpoints.values())
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "requests": requests,
+            "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+            "throughput_rps": round(requests / elapsed, 2),
+            "endpoints": endpoints,
+        }
+
+
+# Scenarios
+
+
+@dataclass
+class LoadContext:
+    location_ids: List[str]
+    floor_ids: List[str]
+    seat_ids: List[str]
+    tokens: List[str] = field(default_factory=list)
+
+
+Action = Callable[..., Awaitable[None]]
+
+
+class Scenario(NamedTuple):
+    action: Action
+    # Burst scenarios start every user's action together and wait for all of them
+    burst: bool = False
+    needs_accounts: bool = False
+
+
+async def sensor_storm(client, ctx: LoadContext, recorder: Recorder, rng: random.Random, user: int) -> None:
+    if rng.random() < 0.1:
+        events = [
+            {"seat_id": rng.choice(ctx.seat_ids), "is_occupied": rng.random() < 0.5}
+            for _ in range(20)
+        ]
+        await recorder.request(client, "POST", "POST /api/iot/occupancy/batch", "/api/iot/occupancy/batch", json=events)
+        return
+    event = {"seat_id": rng.choice(ctx.seat_ids), "is_occupied": rng.random() < 0.5}
+    await recorder.request(client, "POST", "POST /api/iot/occupancy", "/api/iot/occupancy", json=event)
+
+
+async def browsing(client, ctx: LoadContext, recorder: Recorder, rng: random.Random, user: int) -> None:
+    await recorder.request(client, "GET", "GET /api/locations/", "/api/locations/")
+    location_id = rng.choice(ctx.location_ids)
+    await recorder.request(client, "GET", "GET /api/locations/{location_id}", f"/api/locations/{location_id}")
+    floor_id = rng.choice(ctx.floor_ids)
+    await recorder.request(client, "GET", "GET /api/floors/{floor_id}/seats", f"/api/floors/{floor_id}/seats")
+    params = {"floor_id": floor_id, "limit": 100}
+    if rng.random() < 0.5:
+        params["has_power"] = "true"
+    await recorder.request(client, "GET", "GET /api/seats/available", "/api/seats/available", params=params)
+
+
+async def reservations(client, ctx: LoadContext, recorder: Recorder, rng: random.Random, user: int) -> None:
+    headers = {"Authorization": f"Bearer {ctx.tokens[user % len(ctx.tokens)]}"}
+    # Everyone in a burst looks at the same few floors, so some pick the same seat
+    floor_id = ctx.floor_ids[int(time.monotonic()) % min(3, len(ctx.floor_ids))]
+    response = await recorder.request(
+        client, "GET", "GET /api/seats/available", "/api/seats/available",
+        params={"floor_id": floor_id, "limit": 20},
+    )
+    if response is None or response.status_code != 200 or not response.json():
+        return
+    seat = rng.choice(response.json())
+    start = datetime.utcnow() + timedelta(minutes=5)
+    response = await recorder.request(
+        client, "POST", "POST /api/reservations/", "/api/reservations/", headers=headers,
+        json={"seat_id": seat["id"], "start_time": start.isoformat(), "end_time": (start + timedelta(hours=1)).isoformat()},
+    )
+    if response is None or response.status_code != 201:
+        return
+    reservation_id = response.json()["id"]
+    await recorder.request(
+        client, "DELETE", "DELETE /api/reservations/{reservation_id}", f"/api/reservations/{reservation_id}",
+        headers=headers,
+    )
+
+
+async def ai_chat(client, ctx: LoadContext, recorder: Recorder, rng: random.Random, user: int) -> None:
+    payload = {"messages": [{"role": "user", "content": rng.choice(CHAT_PROMPTS)}]}
+    response = await recorder.request(client, "POST", "POST /ai/demo/chat", "/ai/demo/chat", json=payload)
+    # The service answers with a canned reply when Gemini (the stub) was not reached
+    if response is not None and response.status_code == 200 and response.json()["reply"].startswith(GEMINI_FALLBACK_MARKERS):
+        recorder.note("POST /ai/demo/chat", "gemini_fallback")
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "sensor_storm": Scenario(sensor_storm),
+    "browsing": Scenario(browsing),
+    "reservations": Scenario(reservations, burst=True, needs_accounts=True),
+    "ai_chat": Scenario(ai_chat),
+}
+
+
+async def discover(client) -> LoadContext:
+    """Collect location, floor and seat ids from the API."""
+    locations = (await client.get("/api/locations/")).json()
+    floors = (await client.get("/api/floors/")).json()
+    seats = (await client.get("/api/seats/", params={"limit": 1000})).json()
+    if not (locations and floors and seats):
+        raise RuntimeError("The target database has no locations, floors or seats; seed it first")
+    return LoadContext(
+        location_ids=[location["id"] for location in locations],
+        floor_ids=[floor["id"] for floor in floors],
+        seat_ids=[seat["id"] for seat in seats],
+    )
+
+
+async def register_accounts(client, count: int) -> List[str]:
+    tokens = []
+    run_id = uuid.uuid4().hex[:8]
+    for number in range(count):
+        response = await client.post("/api/auth/register", json={
+            "email": f"load-{run_id}-{number}@example.com",
+            "name": f"Load Test Student {number}",
+            "password": "load-test-password",
+        })
+        response.raise_for_status()
+        tokens.append(response.json()["access_token"])
+    return tokens
+
+
+async def run_scenario(client, name: str, ctx: LoadContext, users: int, duration: float, seed: int) -> Dict:
+    scenario = SCENARIOS[name]
+    recorder = Recorder()
+    rngs = [random.Random(f"{seed}-{name}-{user}") for user in range(users)]
+    started = time.monotonic()
+    deadline = started + duration
+
+    if scenario.burst:
+        while time.monotonic() < deadline:
+            await asyncio.gather(*(scenario.action(client, ctx, recorder, rngs[user], user) for user in range(users)))
+    else:
+        async def virtual_user(user: int) -> None:
+            while time.monotonic() < deadline:
+                await scenario.action(client, ctx, recorder, rngs[user], user)
+
+        await asyncio.gather(*(virtual_user(user) for user in range(users)))
+    return recorder.summary(time.monotonic() - started)
+
+
+async def drive(base_url: str, args: argparse.Namespace, names: List[str]) -> Dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        ctx = await discover(client)
+        if any(SCENARIOS[name].needs_accounts for name in names):
+            ctx.tokens = await register_accounts(client, min(args.accounts, args.users))
+
+        results = {}
+        for name in names:
+            results[name] = await run_scenario(client, name, ctx, args.users, args.duration, args.seed)
+            print_summary(name, results[name])
+    return results
+
+
+def print_summary(name: str, result: Dict) -> None:
+    print(f"\n{name}: {result['requests']} requests, {result['throughput_rps']:.0f} req/s, {result['errors']} errors")
+    print(f"  {'endpoint':<42} {'reqs':>7} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>6}")
+    for label, endpoint in result["endpoints"].items():
+        if "p50_ms" not in endpoint:
+            print(f"  {label:<42} {endpoint['requests']:>7} {'-':>8} {'-':>9} {'-':>9} {'-':>9} {endpoint['errors']:>6}")
+            continue
+        print(
+            f"  {label:<42} {endpoint['requests']:>7} {endpoint['throughput_rps']:>8.1f} "
+            f"{endpoint['p50_ms']:>7.1f}ms {endpoint['p95_ms']:>7.1f}ms {endpoint['p99_ms']:>7.1f}ms "
+            f"{endpoint['errors']:>6}"
+        )
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.serve_gemini_stub:
+        serve_gemini_stub(args.gemini_port, args.gemini_latency_ms)
+        return
+
+    names = list(SCENARIOS) if "all" in args.scenario else list(dict.fromkeys(args.scenario))
+    report = {
+        "meta": {
+            "started_at": datetime.utcnow().isoformat(),
+            "users": args.users,
+            "duration_seconds": args.duration,
+            "seed": args.seed,
+            "gemini_latency_ms": args.gemini_latency_ms,
+        },
+    }
+
+    processes: List[subprocess.Popen] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            base_url = args.base_url
+            if base_url is None:
+                env = dict(
+                    os.environ,
+                    DATABASE_URL=f"sqlite:///{tmp}/load.db",
+                    DEBUG="false",
+                    DB_POOL_SIZE=str(max(args.users, 10)),
+                    GEMINI_ENDPOINT_URL=f"http://127.0.0.1:{args.gemini_port}/v1/chat",
+                    GEMINI_API_KEY="load-test",
+                )
+                if not Path(env.get("SEATING_DATA_PATH", "")).is_file():
+                    env["SEATING_DATA_PATH"] = f"{tmp}/seatings.csv"
+                    write_seating_dataset(Path(env["SEATING_DATA_PATH"]), args.seed)
+                os.environ.update(env)
+                seed_database(args)
+                report["meta"]["dataset"] = {
+                    "locations": args.locations,
+                    "floors_per_location": args.floors,
+                    "seats_per_floor": args.seats_per_floor,
+                }
+                processes.append(subprocess.Popen(
+                    [sys.executable, __file__, "--serve-gemini-stub", "--gemini-port", str(args.gemini_port),
+                     "--gemini-latency-ms", str(args.gemini_latency_ms)],
+                    cwd=ROOT_DIR,
+                    env=env,
+                ))
+                processes.append(subprocess.Popen(
+                    [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+                     "--port", str(args.port), "--log-level", "warning"],
+                    cwd=ROOT_DIR,
+                    env=env,
+                ))
+                base_url = f"http://127.0.0.1:{args.port}"
+            report["meta"]["base_url"] = base_url
+
+            asyncio.run(wait_until_up(base_url))
+            report["scenarios"] = asyncio.run(drive(base_url, args, names))
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Compare verbose vs compact seat-map prompt sizes.
+
+Usage:
+    python scripts/measure_prompt_encoding.py                 # current database
+    python scripts/measure_prompt_encoding.py --synthetic 20 250   # 20 floors x 250 seats
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.models.seat import SeatStatus  # noqa: E402
+from app.services.seat_map_encoding import COMPACT_LEGEND, encode_floors  # noqa: E402
+from app.services.seat_refresh_worker import SeatRefreshWorker  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure seat-map prompt encoding sizes")
+    parser.add_argument(
+        "--synthetic",
+        nargs=2,
+        type=int,
+        metavar=("FLOORS", "SEATS_PER_FLOOR"),
+        help="Generate an in-memory layout instead of reading the database",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    return parser
+
+
+def synthetic_seats(floors: int, seats_per_floor: int, seed: int) -> List[SimpleNamespace]:
+    rng = random.Random(seed)
+    statuses = [SeatStatus.AVAILABLE, SeatStatus.OCCUPIED, SeatStatus.OCCUPIED, SeatStatus.RESERVED]
+    seats = []
+    for floor_index in range(1, floors + 1):
+        location = SimpleNamespace(name=f"Building {(floor_index - 1) // 3 + 1}")
+        floor = SimpleNamespace(
+            floor_name=f"Level {(floor_index - 1) % 3 + 1}",
+            floor_map_url="api/images/mockmap.svg",
+            location=location,
+        )
+        for seat_index in range(1, seats_per_floor + 1):
+            seats.append(
+                SimpleNamespace(
+                    id=f"{floor_index:04d}-{seat_index:06d}",
+                    floor_id=f"floor-{floor_index:04d}",
+                    floor=floor,
+                    seat_number=f"B{floor_index}-{seat_index:03d}",
+                    table_number=(seat_index - 1) // 7 + 1,
+                    status=rng.choice(statuses),
+                    has_power_outlet=rng.random() < 0.5,
+                    has_ac=rng.random() < 0.7,
+                    accessibility=rng.random() < 0.1,
+                    x_coordinate=rng.random(),
+                    y_coordinate=rng.random(),
+                )
+            )
+    return seats
+
+
+def database_seats():
+    from app.database import SessionLocal
+    from app.models.seat import Seat
+
+    db = SessionLocal()
+    try:
+        seats = db.query(Seat).all()
+        for seat in seats:
+            if seat.floor is not None:
+                seat.floor.location  # load while the session is open
+        return seats, db
+    except Exception:
+        db.close()
+        raise
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    session = None
+    if args.synthetic:
+        seats = synthetic_seats(args.synthetic[0], args.synthetic[1], args.seed)
+    else:
+        seats, session = database_seats()
+
+    try:
+        if not seats:
+            print("No seats found.")
+            return
+
+        worker = SeatRefreshWorker()
+        payload, verbose_map, floor_payload = worker._build_snapshot(seats)
+        compact_floors = encode_floors(floor_payload)
+        compact_all = COMPACT_LEGEND + "\n" + "\n".join(entry["encoded"] for entry in compact_floors.values())
+        first_floor = next(iter(compact_floors.values()))
+        compact_one = COMPACT_LEGEND + "\n" + first_floor["encoded"]
+
+        seat_details = [
+            {
+                "seat_id": seat["id"],
+                "seat_number": seat["seat_number"],
+                "floor_id": seat["floor_id"],
+                "floor_name": seat["floor_name"],
+                "has_power_outlet": seat["has_power_outlet"],
+                "has_ac": seat["has_ac"],
+                "accessibility": seat["accessibility"],
+            }
+            for seat in payload[:25]
+        ]
+        verbose_json = json.dumps(seat_details, ensure_ascii=False, indent=2)
+        compact_json = json.dumps(seat_details, ensure_ascii=False, separators=(",", ":"))
+
+        verbose_total = len(verbose_map) + len(verbose_json)
+        rows = [
+            ("verbose map + indented JSON", verbose_total),
+            ("compact map (all floors) + JSON", len(compact_all) + len(compact_json)),
+            ("compact map (one floor) + JSON", len(compact_one) + len(compact_json)),
+        ]
+
+        print(f"Seats: {len(seats)}  Floors: {len(compact_floors)}")
+        for label, size in rows:
+            reduction = 100 * (1 - size / verbose_total)
+            print(f"  {label:<34} {size:>10,} chars  ({reduction:5.1f}% smaller)")
+    finally:
+        if session is not None:
+            session.close()
+
+
+if __name__ == "__main__":
+    main()